@@ -0,0 +1,222 @@
+"""Visitor analytics: which variants, filters and case studies get used.
+
+``track`` is called from the script and returns immediately. Events go into a
+bounded in-memory queue that a background thread drains into SQLite in
+batches (one transaction per batch), so logging never waits on disk during a
+rerun. When the queue fills up, the log degrades instead of blocking:
+
+- above ``SAMPLE_AT`` of capacity only every ``SAMPLE_EVERY``-th event is kept,
+  stored with a matching ``weight`` so counts stay approximately right;
+- when the queue is full, events are dropped and counted.
+
+The database is ``build/analytics/events.sqlite3`` (or ``RESUME_ANALYTICS_DB``);
+``RESUME_ANALYTICS=0`` turns logging off. Summarise it with:
+
+    python analytics.py [--db PATH] [--limit 10]
+"""
+import argparse
+import atexit
+import itertools
+import os
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from static_assets import BUILD_DIR
+
+DB_PATH = Path(os.environ.get("RESUME_ANALYTICS_DB", BUILD_DIR / "analytics" / "events.sqlite3"))
+QUEUE_SIZE = 10_000
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 1.0  # seconds a partial batch may wait before it is written
+SAMPLE_AT = 0.8
+SAMPLE_EVERY = 10
+_STATE_KEY = "_analytics"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    ts REAL NOT NULL,
+    session TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    weight INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS events_kind_value ON events (kind, value);
+"""
+
+
+class EventLog:
+    """Bounded queue plus one writer thread; ``put`` never blocks."""
+
+    def __init__(self, path=DB_PATH, maxsize=QUEUE_SIZE, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = Path(path)
+        self.queue = queue.Queue(maxsize)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.stats = {"queued": 0, "sampled_out": 0, "dropped": 0, "written": 0, "batches": 0, "errors": 0}
+        self._lock = threading.Lock()  # counters are updated from every script thread and the writer
+        self._sample = itertools.count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="analytics-writer", daemon=True)
+        self._thread.start()
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self.stats[key] += n
+
+    def put(self, session, kind, value):
+        q = self.queue
+        weight = 1
+        if q.maxsize and q.qsize() >= q.maxsize * SAMPLE_AT:
+            if next(self._sample) % SAMPLE_EVERY:
+                self._count("sampled_out")
+                return False
+            weight = SAMPLE_EVERY
+        try:
+            q.put_nowait((time.time(), session, kind, str(value), weight))
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("queued")
+        return True
+
+    def _take_batch(self):
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get(timeout=max(0, deadline - time.monotonic())))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, db, batch):
+        try:
+            with db:
+                db.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?)", batch)
+        except sqlite3.Error:
+            self._count("errors")
+            return
+        self._count("written", len(batch))
+        self._count("batches")
+
+    def _run(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self.path)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.executescript(SCHEMA)
+        try:
+            while not (self._stop.is_set() and self.queue.empty()):
+                batch = self._take_batch()
+                if batch:
+                    self._write(db, batch)
+        finally:
+            db.close()
+
+    def close(self, timeout=5):
+        """Write what is queued and stop the writer thread."""
+        self._stop.set()
+        self._thread.join(timeout)
+
+
+_LOG = None
+_LOG_LOCK = threading.Lock()
+
+
+def enabled():
+    return os.environ.get("RESUME_ANALYTICS", "1") != "0"
+
+
+def get_log():
+    global _LOG
+    if _LOG is None:
+        with _LOG_LOCK:
+            if _LOG is None:
+                _LOG = EventLog()
+                atexit.register(_LOG.close)
+    return _LOG
+
+
+def _session():
+    # Imported here so the report CLI does not need Streamlit.
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return st.session_state.setdefault(_STATE_KEY, {}), ctx.session_id if ctx else ""
+
+
+def track(kind, value):
+    """Record ``kind=value`` for this session when it differs from the last value seen."""
+    if not enabled() or value in (None, ""):
+        return
+    seen, session = _session()
+    if seen.get(kind) == value:
+        return
+    seen[kind] = value
+    get_log().put(session, kind, value)
+
+
+def track_event(kind, value):
+    """Record ``kind=value`` for this session; for events the caller has already de-duplicated."""
+    if not enabled() or value in (None, ""):
+        return
+    _, session = _session()
+    get_log().put(session, kind, value)
+
+
+def track_selection(facet, values):
+    """Record each value newly added to a multiselect as a ``filter`` event."""
+    if not enabled():
+        return
+    seen, session = _session()
+    key = f"filter:{facet}"
+    previous, current = seen.get(key, frozenset()), frozenset(values)
+    seen[key] = current
+    for v in sorted(current - previous, key=str):
+        get_log().put(session, "filter", f"{facet}: {v}")
+
+
+def report(path=DB_PATH, limit=10):
+    """Weighted counts of the most used variants, case studies and filters."""
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        def top(kind):
+            return db.execute(
+                "SELECT value, SUM(weight) AS n FROM events WHERE kind = ? "
+                "GROUP BY value ORDER BY n DESC, value LIMIT ?", (kind, limit),
+            ).fetchall()
+
+        sessions, events = db.execute("SELECT COUNT(DISTINCT session), SUM(weight) FROM events").fetchone()
+        return {
+            "sessions": sessions,
+            "events": events or 0,
+            "variants": top("variant"),
+            "cases": top("case"),
+            "filters": top("filter"),
+        }
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Top variants and case studies from the analytics log.")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    if not args.db.exists():
+        parser.exit(1, f"no analytics database at {args.db}\n")
+    rep = report(args.db, args.limit)
+    print(f"{rep['events']} events from {rep['sessions']} sessions")
+    for title, key in (("Variants (role | mode)", "variants"), ("Case studies", "cases"), ("Filters", "filters")):
+        print(f"\n{title}")
+        for value, n in rep[key] or [("—", 0)]:
+            print(f"  {n:>7}  {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Headless load and latency benchmark for app.py.
+
+Drives the app through Streamlit's app-testing harness (no browser, no
+network). Each simulated visitor loads the page, then switches theme, role
+focus and Scan/Deep mode, filters and searches projects, opens a ``?case=``
+page and submits the contact form. It reports p50/p95/p99 rerun latency per
+step, CPU time per rerun and retained memory per session:
+
+    python bench/bench_app.py [--sessions 40] [--workers 4] [--json out.json]
+
+AppTest keeps process-global state, so sessions inside one worker run one
+after another; ``--workers`` runs several worker processes in parallel to put
+the machine under concurrent load. Sequences are seeded, so runs on different
+commits perform the same interactions and their numbers can be compared.
+
+The contact outbox and the analytics log go to a temporary directory and
+SMTP is disabled, so a run sends no mail, leaves no rows behind and does not
+depend on earlier runs. Each visitor sends a different message from a
+different address, so the step times the path that queues a message, not the
+duplicate or throttle refusal.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+APP = str(ROOT / "app.py")
+TIMEOUT = 60
+
+
+def _app_test():
+    from streamlit.testing.v1 import AppTest
+
+    # `streamlit run` puts the script's directory on sys.path; AppTest does not.
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return AppTest.from_file(APP, default_timeout=TIMEOUT)
+
+
+def _content():
+    with open(ROOT / "content" / "profile.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def session_steps(rnd, content):
+    """One visitor's interactions as (name, action) pairs; each action triggers a rerun."""
+    roles = [r["label"] for r in content["roles"]]
+    ids = [p["id"] for p in content["projects"]]
+    words = [p["title"].split()[0].lower() for p in content["projects"]]
+    stacks = sorted({s for p in content["projects"] for s in p["tags"]["stack"]})
+
+    def set_case(at, case):
+        if case:
+            at.query_params["case"] = case
+        else:
+            at.query_params.pop("case", None)
+        return at
+
+    visitor = rnd.randrange(10**9)
+
+    def submit(at):
+        at.text_input(key="contact-name").input("Bench Visitor")
+        at.text_input(key="contact-email").input(f"visitor{visitor}@example.com")
+        at.text_area(key="contact-message").input(f"Hello from the benchmark, visitor {visitor}.")
+        return next(b for b in at.button if b.label == "Send Message").click()
+
+    return [
+        ("load", lambda at: at),
+        ("theme", lambda at: at.selectbox(key="theme").select(rnd.choice(["Dark", "Teal/Purple (Light)"]))),
+        ("role", lambda at: at.radio(key="role-focus").set_value(rnd.choice(roles[1:] or roles))),
+        ("mode", lambda at: at.toggle(key="scan-mode").set_value(False)),
+        ("filter", lambda at: at.multiselect(key="filter-stack").select(rnd.choice(stacks))),
+        ("search", lambda at: at.text_input(key="project-search").input(rnd.choice(words))),
+        ("case", lambda at: set_case(at, rnd.choice(ids))),
+        ("back", lambda at: set_case(at, None)),
+        ("contact", submit),
+    ]
+
+
+def run_session(seed, content):
+    rnd = random.Random(seed)
+    at = _app_test()
+    samples = []
+    for name, action in session_steps(rnd, content):
+        action(at)
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        at.run()
+        samples.append((name, (time.perf_counter() - wall0) * 1000, (time.process_time() - cpu0) * 1000))
+        if at.exception:
+            raise RuntimeError(f"step {name!r} raised: {at.exception[0].message}")
+    return samples
+
+
+def worker(seeds):
+    content = _content()
+    return [s for seed in seeds for s in run_session(seed, content)]
+
+
+def measure_memory(sessions):
+    """Retained Python heap per live session (includes the harness' element tree)."""
+    content = _content()
+    run_session(0, content)  # warm imports and process-wide caches first
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    live = []
+    for seed in range(sessions):
+        at = _app_test()
+        at.run()
+        live.append(at)
+    gc.collect()
+    per_session = (tracemalloc.get_traced_memory()[0] - base) / sessions
+    tracemalloc.stop()
+    return per_session
+
+
+def percentiles(values):
+    values = sorted(values)
+
+    def pct(p):
+        return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+    return {"n": len(values), "p50": pct(50), "p95": pct(95), "p99": pct(99), "mean": statistics.fmean(values)}
+
+
+def _git_rev():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=40, help="simulated visitors (default: 40)")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1), help="parallel worker processes")
+    parser.add_argument("--memory-sessions", type=int, default=20, help="live sessions for the memory probe")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    seeds = [args.seed * 100_000 + i for i in range(args.sessions)]
+    chunks = [seeds[i::args.workers] for i in range(args.workers)]
+    with tempfile.TemporaryDirectory(prefix="bench-app-") as tmp:
+        # Read at import by outbox.py / analytics.py in the workers, which inherit this environment.
+        os.environ["RESUME_OUTBOX_DB"] = str(Path(tmp) / "outbox.sqlite3")
+        os.environ["RESUME_ANALYTICS_DB"] = str(Path(tmp) / "events.sqlite3")
+        os.environ.pop("RESUME_SMTP_HOST", None)
+        t0 = time.perf_counter()
+        with ProcessPoolExecutor(args.workers) as ex:
+            samples = [s for part in ex.map(worker, chunks) for s in part]
+        elapsed = time.perf_counter() - t0
+        with ProcessPoolExecutor(1) as ex:
+            mem = ex.submit(measure_memory, args.memory_sessions).result()
+
+    steps = {}
+    for name, wall, cpu in samples:
+        steps.setdefault(name, {"wall": [], "cpu": []})
+        steps[name]["wall"].append(wall)
+        steps[name]["cpu"].append(cpu)
+    result = {
+        "commit": _git_rev(),
+        "python": platform.python_version(),
+        "sessions": args.sessions,
+        "workers": args.workers,
+        "reruns": len(samples),
+        "elapsed_s": elapsed,
+        "reruns_per_s": len(samples) / elapsed,
+        "latency_ms": percentiles([w for _, w, _ in samples]),
+        "cpu_ms": percentiles([c for _, _, c in samples]),
+        "steps": {k: {"latency_ms": percentiles(v["wall"]), "cpu_ms": percentiles(v["cpu"])} for k, v in steps.items()},
+        "memory_per_session_kib": mem / 1024,
+    }
+
+    print(f"{args.sessions} sessions, {len(samples)} reruns on {args.workers} workers in {elapsed:.1f}s "
+          f"({result['reruns_per_s']:.1f} reruns/s)")
+    print(f"{'step':<10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'cpu p50':>8}")
+    for name, row in [("all", {"latency_ms": result["latency_ms"], "cpu_ms": result["cpu_ms"]})] + list(result["steps"].items()):
+        lat = row["latency_ms"]
+        print(f"{name:<10} {lat['p50']:>8.1f} {lat['p95']:>8.1f} {lat['p99']:>8.1f} {row['cpu_ms']['p50']:>8.1f}")
+    print(f"retained memory per session: {result['memory_per_session_kib']:.0f} KiB")
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
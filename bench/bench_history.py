@@ -0,0 +1,74 @@
+"""Cost of the generated change history as the number of content revisions grows.
+
+Records ``--revisions`` synthetic revisions of content/profile.json (each one
+edits a metric, a bullet or a stat) into a temporary snapshot store, then
+times:
+
+- the first build of the history (every pairwise diff computed once),
+- the history after one more revision (one new diff),
+- a repeat lookup (what a rerun pays),
+- a cold process that finds the diffs on disk.
+
+    python bench/bench_history.py [--revisions 300]
+"""
+import argparse
+import copy
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from profiles import get_profile  # noqa: E402
+from snapshots import SnapshotStore  # noqa: E402
+
+
+def edit(data, i):
+    data = copy.deepcopy(data)
+    kind = i % 3
+    if kind == 0:
+        data["projects"][0]["metrics"][0]["value"] = f"0.{i:03d}"
+    elif kind == 1:
+        data["roles"][0]["tldr"][0] = f"Revision {i} of the first highlight."
+    else:
+        data["stats"]["projects"] = i
+    return data
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--revisions", type=int, default=300)
+    args = parser.parse_args()
+
+    _, data = get_profile().store.load()
+    with tempfile.TemporaryDirectory() as tmp:
+        snaps, diffs = Path(tmp) / "snapshots", Path(tmp) / "diffs"
+        store = SnapshotStore(snaps, diffs)
+        for i in range(args.revisions):
+            data = edit(data, i)
+            store.record(f"rev{i:05d}", data)
+        head = f"rev{args.revisions - 1:05d}"
+
+        history, first = timed(lambda: store.history(head))
+        store.record("next", edit(data, args.revisions))
+        _, incremental = timed(lambda: store.history("next"))
+        _, repeat = timed(lambda: store.history("next"))
+        _, cold = timed(lambda: SnapshotStore(snaps, diffs).history("next"))
+
+    print(f"{args.revisions} revisions, {len(history)} history entries")
+    print(f"  first build      : {first:9.2f} ms")
+    print(f"  one new revision : {incremental:9.2f} ms")
+    print(f"  repeat lookup    : {repeat:9.4f} ms")
+    print(f"  cold, diffs cached on disk: {cold:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
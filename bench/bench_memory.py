@@ -0,0 +1,100 @@
+"""Per-session memory for the content: per-rerun dicts vs. the shared model.
+
+The original app.py rebuilt its content as dict literals on every rerun and
+derived a role map, featured set and visible-project list from them, so each
+session that was mid-rerun held its own copy. With model.py every session
+holds references into one frozen ``Resume`` per content revision plus a small
+tuple of visible projects.
+
+This simulates ``--sessions`` concurrent sessions both ways and reports the
+retained heap per session (tracemalloc), plus the deep size of one record:
+
+    python bench/bench_memory.py [--sessions 1000]
+"""
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from content import CONTENT_PATH  # noqa: E402
+from profiles import get_profile  # noqa: E402
+from search import ProjectIndex  # noqa: E402
+
+
+def deep_size(obj, seen=None):
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(x, seen) for x in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(deep_size(getattr(obj, s), seen) for s in obj.__slots__)
+    return size
+
+
+def session_before(raw, role, scan):
+    """What one rerun of the original script kept alive."""
+    content = json.loads(raw)  # stands in for the dict literals evaluated in app.py
+    role_map = {r["label"]: r for r in content["roles"]}
+    r = role_map[role]
+    featured = set(r["featured"])
+    visible = sorted(content["projects"], key=lambda p: (0 if p["id"] in featured else 1, -int(p["tags"]["year"])))
+    return {"content": content, "role_map": role_map, "bullets": r["tldr"] if scan else r["deep"],
+            "visible": visible, "stack": sorted({s for p in content["projects"] for s in p["tags"]["stack"]})}
+
+
+def session_after(index, role, scan):
+    """What one rerun keeps alive now: references into the shared model."""
+    resume = get_profile().resume()
+    return {"resume": resume, "bullets": resume.role(role).bullets(scan),
+            "visible": index.search("", role=role), "stack": index.facet_values("stack")}
+
+
+def measure(make, sessions):
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    live = [make(i) for i in range(sessions)]
+    gc.collect()
+    per_session = (tracemalloc.get_traced_memory()[0] - base) / sessions
+    tracemalloc.stop()
+    del live
+    return per_session
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1000, help="concurrent sessions (default: 1000)")
+    args = parser.parse_args()
+
+    raw = CONTENT_PATH.read_text(encoding="utf-8")
+    resume = get_profile().resume()
+    index = ProjectIndex(resume.projects, resume.roles)
+    roles = [r.label for r in resume.roles]
+
+    def variant(i):
+        return roles[i % len(roles)], i % 2 == 0
+
+    before = measure(lambda i: session_before(raw, *variant(i)), args.sessions)
+    after = measure(lambda i: session_after(index, *variant(i)), args.sessions)
+    shared = deep_size(resume) + deep_size(index.postings)
+
+    print(f"{args.sessions} concurrent sessions")
+    print(f"  per-rerun dicts : {before / 1024:8.1f} KiB/session  {before * args.sessions / 2**20:8.1f} MiB total")
+    print(f"  shared model    : {after / 1024:8.1f} KiB/session  {after * args.sessions / 2**20:8.1f} MiB total"
+          f"  (+{shared / 1024:.1f} KiB once per process)")
+    project = json.loads(raw)["projects"][0]
+    print(f"one project record: dict {deep_size(project)} B, model {deep_size(resume.projects[0])} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Bytes and elements sent to the browser per rerun, measured on the websocket.
+
+Starts ``streamlit run app.py`` and drives one browser-less session through:
+
+- load: the first page load;
+- rerun: the same page again with nothing changed;
+- scan off / scan on: the Scan Mode toggle flipped and flipped back;
+- role: another role focus.
+
+For each step it prints the ForwardMsg bytes on the wire, the number of
+element deltas, and how many of them Streamlit replaced with a reference to a
+message the browser already has (see ``global.minCachedMessageSize`` in
+``.streamlit/config.toml``). ``--delay`` adds a simulated link time (ms per KB)
+to show what the bytes cost on a slow mobile connection:
+
+    python bench/bench_payload.py [--delay 2] [--json out.json]
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_startup import FLAGS, TIMEOUT, free_port, wait_ready  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _widgets(fwd, found):
+    if fwd.WhichOneof("type") != "delta" or not fwd.delta.HasField("new_element"):
+        return
+    el = fwd.delta.new_element
+    kind = el.WhichOneof("type")
+    if kind in ("checkbox", "radio"):
+        w = getattr(el, kind)
+        found[w.label] = (kind, w)
+
+
+async def run_step(ws, states=None):
+    msg = BackMsg()
+    msg.rerun_script.query_string = ""
+    msg.rerun_script.page_script_hash = ""
+    for wid, field, value in states or ():
+        state = msg.rerun_script.widget_states.widgets.add()
+        state.id = wid
+        setattr(state, field, value)
+    t0 = time.perf_counter()
+    await ws.write_message(msg.SerializeToString(), binary=True)
+    result = {"bytes": 0, "elements": 0, "refs": 0, "widgets": {}}
+    while True:
+        raw = await asyncio.wait_for(ws.read_message(), TIMEOUT)
+        if raw is None:
+            raise RuntimeError("connection closed before the script finished")
+        result["bytes"] += len(raw)
+        fwd = ForwardMsg()
+        fwd.ParseFromString(raw)
+        kind = fwd.WhichOneof("type")
+        if kind == "ref_hash":
+            result["refs"] += 1
+            result["elements"] += 1
+        elif kind == "delta":
+            result["elements"] += 1
+            _widgets(fwd, result["widgets"])
+        elif kind == "script_finished":
+            result["ms"] = (time.perf_counter() - t0) * 1000
+            return result
+
+
+async def session(port):
+    ws = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream", max_message_size=1 << 26)
+    try:
+        steps = {}
+        load = await run_step(ws)
+        widgets = load.pop("widgets")
+        scan = widgets["Scan Mode (TL;DR)"][1]
+        role = widgets["Role focus"][1]
+        steps["load"] = load
+        steps["rerun"] = await run_step(ws)
+        steps["scan off"] = await run_step(ws, [(scan.id, "bool_value", False)])
+        steps["scan on"] = await run_step(ws, [(scan.id, "bool_value", True)])
+        steps["role"] = await run_step(ws, [(scan.id, "bool_value", True), (role.id, "int_value", 1)])
+        for step in steps.values():
+            step.pop("widgets", None)
+        return steps
+    finally:
+        ws.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delay", type=float, default=2.0, help="simulated link time, ms per KB (default 2)")
+    parser.add_argument("--json", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    port = free_port()
+    cmd = [sys.executable, "-m", "streamlit", "run", str(ROOT / "app.py"), "--server.port", str(port), *FLAGS]
+    proc = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(port, proc)
+        asyncio.run(session(port))  # the first session pays the cold start
+        steps = asyncio.run(session(port))
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+    print(f"{'step':10} {'bytes':>8} {'elements':>9} {'as refs':>8} {'server ms':>10} {'+ link ms':>10}")
+    for name, s in steps.items():
+        s["link_ms"] = round(s["bytes"] / 1024 * args.delay, 1)
+        s["ms"] = round(s["ms"], 1)
+        print(f"{name:10} {s['bytes']:8d} {s['elements']:9d} {s['refs']:8d} {s['ms']:10.1f} {s['link_ms']:10.1f}")
+    if args.json:
+        args.json.write_text(json.dumps({"delay_ms_per_kb": args.delay, "steps": steps}, indent=2) + "\n",
+                             encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
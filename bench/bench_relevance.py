@@ -0,0 +1,69 @@
+"""Job-description ranking latency (relevance.py) at 10, 1k and 50k projects.
+
+Scores a long and a short job description against the real content with its
+projects replaced by synthetic ones (same generator as bench_search.py).
+Reports the index build time, uncached ``rank`` p50/p95 (``--repeat`` calls,
+``--large-repeat`` from 50k projects up) and cached lookups:
+
+    python bench/bench_relevance.py [--sizes 10 1000 50000] [--repeat 200] [--large-repeat 40]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_search import make_projects  # noqa: E402
+from model import build_resume  # noqa: E402
+from relevance import RelevanceIndex  # noqa: E402
+
+JOBS = (
+    "Data Scientist. You will own forecast and ranking models end to end: feature pipelines in Python and SQL, "
+    "experiment design, churn and retention cohort analysis, anomaly detection, and dashboards in Tableau. "
+    "Deploy models with Docker; streaming data experience and PyTorch or TensorFlow embeddings are a plus. "
+    "Industry: Finance or Retail. Communicate accuracy and latency trade-offs to product partners.",
+    "ML engineer, computer vision, PyTorch, Docker, latency",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 50_000], help="catalogue sizes")
+    parser.add_argument("--repeat", type=int, default=200, help="uncached and cached calls (default: 200)")
+    parser.add_argument("--large-repeat", type=int, default=40, help="uncached calls from 50k projects up")
+    args = parser.parse_args()
+
+    with open(ROOT / "content" / "profile.json", encoding="utf-8") as f:
+        content = json.load(f)
+    print(f"{'projects':>9} {'build ms':>9} {'rank p50':>9} {'rank p95':>9} {'cached p50':>11}")
+    for n in args.sizes:
+        data = dict(content, projects=make_projects(n))
+        data["roles"] = [dict(r, featured=["p1", "p3"]) for r in content["roles"]]
+        resume = build_resume(f"bench-{n}", data)
+        t = time.perf_counter()
+        index = RelevanceIndex(resume)
+        build = (time.perf_counter() - t) * 1000
+        samples = []
+        for i in range(args.repeat if n < 50_000 else args.large_repeat):
+            # A new suffix each time, so every call misses the cache.
+            text = f"{JOBS[i % len(JOBS)]} ref{i}"
+            t = time.perf_counter()
+            index.rank(text)
+            samples.append((time.perf_counter() - t) * 1000)
+        cached = []
+        for _ in range(args.repeat):
+            t = time.perf_counter()
+            index.rank(JOBS[0] + " ref0")
+            cached.append((time.perf_counter() - t) * 1000)
+        samples.sort()
+        print(f"{n:>9} {build:>9.1f} {statistics.median(samples):>9.3f} "
+              f"{samples[int(len(samples) * 0.95) - 1]:>9.3f} {statistics.median(cached):>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
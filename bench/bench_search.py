@@ -0,0 +1,103 @@
+"""Project search latency: linear scan vs. ProjectIndex at 10, 1k and 50k projects.
+
+Each query is timed ``--repeat`` times, or ``--large-repeat`` times from 50k
+projects up, where one linear scan already takes tens of milliseconds:
+
+    python bench/bench_search.py [--sizes 10 1000 50000] [--repeat 200] [--large-repeat 10]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from model import Project, Role, role_order  # noqa: E402
+from search import ProjectIndex  # noqa: E402
+
+WORDS = ("sequence model latency forecast dashboard pipeline graph simulator vision "
+         "genome market macro docker streaming embeddings policy accuracy cohort "
+         "retention experiment ranking anomaly churn pricing").split()
+STACKS = ["Python", "PyTorch", "TensorFlow", "Rust", "R", "SQL", "Docker", "Tableau", "Streamlit"]
+INDUSTRIES = ["Bio", "Finance", "Computer Vision", "Public Health", "Retail", "EdTech"]
+IMPACTS = ["Low", "Medium", "High"]
+QUERIES = [
+    ("", {}),
+    ("model", {}),
+    ("forcast", {}),
+    ("dash", {"stack": ["Python"]}),
+    ("", {"industry": ["Bio", "Finance"], "impact": ["High"]}),
+    ("graph simulator", {"year": [2024]}),
+]
+
+
+def make_projects(n, seed=7):
+    rnd = random.Random(seed)
+    out = []
+    for i in range(n):
+        words = lambda k: " ".join(rnd.choice(WORDS) for _ in range(k))  # noqa: E731
+        out.append({
+            "id": f"p{i}", "title": words(2).title(), "summary": words(12),
+            "par": [{"type": t, "text": words(10)} for t in ("Problem", "Action", "Result")],
+            "tags": {"stack": rnd.sample(STACKS, 3), "industry": [rnd.choice(INDUSTRIES)],
+                     "year": rnd.choice([2022, 2023, 2024, 2025]), "impact": rnd.choice(IMPACTS)},
+        })
+    return out
+
+
+def linear(projects, featured, q, filters):
+    # The pre-index implementation from app.py, kept for comparison.
+    f1, f2 = filters.get("stack"), filters.get("industry")
+    f3, f4 = filters.get("impact"), filters.get("year")
+
+    def passes(p):
+        if f1 and not set(f1).intersection(p["tags"].get("stack", [])): return False
+        if f2 and not set(f2).intersection(p["tags"].get("industry", [])): return False
+        if f3 and p["tags"].get("impact") not in f3: return False
+        if f4 and p["tags"].get("year") not in f4: return False
+        if q and q not in (p["title"] + " " + p["summary"]).lower(): return False
+        return True
+
+    visible = [p for p in projects if passes(p)]
+    visible.sort(key=lambda p: (0 if p["id"] in featured else 1, -int(p["tags"]["year"])))
+    return visible
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 50_000], help="catalogue sizes")
+    parser.add_argument("--repeat", type=int, default=200, help="timings per query (default: 200)")
+    parser.add_argument("--large-repeat", type=int, default=10, help="timings per query from 50k projects up")
+    args = parser.parse_args()
+
+    print(f"{'projects':>9} {'build ms':>9} {'scan p50':>9} {'scan p95':>9} {'index p50':>10} {'index p95':>10}")
+    for n in args.sizes:
+        projects = make_projects(n)
+        featured = {"p1", "p3"}
+        t = time.perf_counter()
+        models = tuple(Project.from_dict(p) for p in projects)
+        role = Role("Data Science", (), (), frozenset(featured), role_order(models, featured))
+        index = ProjectIndex(models, (role,))
+        build = (time.perf_counter() - t) * 1000
+        repeat = args.repeat if n < 50_000 else args.large_repeat
+        scan = [timed(lambda: linear(projects, featured, q, f), repeat) for q, f in QUERIES]
+        idx = [timed(lambda: index.search(q, role="Data Science", **f), repeat) for q, f in QUERIES]
+        p50 = lambda rows: statistics.median(r[0] for r in rows)  # noqa: E731
+        p95 = lambda rows: max(r[1] for r in rows)  # noqa: E731
+        print(f"{n:>9} {build:>9.1f} {p50(scan):>9.3f} {p95(scan):>9.3f} {p50(idx):>10.3f} {p95(idx):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
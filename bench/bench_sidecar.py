@@ -0,0 +1,169 @@
+"""Load test for the bot-facing side-car (sidecar.py).
+
+Starts ``python sidecar.py`` on a free port. Then ``--clients`` concurrent
+keep-alive clients send ``--requests`` requests in total, mixed the way
+crawlers and link previews do:
+
+- preview: ``GET /`` accepting gzip and br;
+- revalidate: the same with ``If-None-Match``, answered 304;
+- pdf: ``GET /resume.pdf``;
+- json: ``GET /resume.json`` accepting gzip.
+
+It reports requests per second, p50/p95/p99 latency and bytes per request
+for each kind. ``--app`` also opens the same number of page loads as full
+Streamlit sessions against ``streamlit run app.py``, which is what each bot
+costs without the side-car:
+
+    python bench/bench_sidecar.py [--requests 2000] [--clients 16] [--app 20] [--json out.json]
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_startup import FLAGS, free_port, session, wait_ready  # noqa: E402
+
+TIMEOUT = 60
+KINDS = ("preview", "revalidate", "pdf", "json")
+
+
+def wait_healthy(port, proc):
+    deadline = time.perf_counter() + TIMEOUT
+    while time.perf_counter() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"side-car exited with {proc.returncode}")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/healthz")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError("side-car did not become ready")
+
+
+def _request(conn, kind, etag):
+    if kind == "preview":
+        conn.request("GET", "/", headers={"Accept-Encoding": "gzip, br"})
+    elif kind == "revalidate":
+        conn.request("GET", "/", headers={"Accept-Encoding": "gzip, br", "If-None-Match": etag})
+    elif kind == "pdf":
+        conn.request("GET", "/resume.pdf")
+    else:
+        conn.request("GET", "/resume.json", headers={"Accept-Encoding": "gzip"})
+    r = conn.getresponse()
+    body = r.read()
+    expected = 304 if kind == "revalidate" else 200
+    if r.status != expected:
+        raise RuntimeError(f"{kind}: HTTP {r.status}")
+    return len(body)
+
+
+def load(port, total, clients):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=TIMEOUT)
+    conn.request("GET", "/", headers={"Accept-Encoding": "gzip, br"})
+    r = conn.getresponse()
+    r.read()
+    etag = r.getheader("ETag")
+    conn.close()
+
+    samples = {k: [] for k in KINDS}
+    sizes = {k: [] for k in KINDS}
+    lock = threading.Lock()
+    counter = iter(range(total))
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=TIMEOUT)
+        try:
+            while True:
+                with lock:
+                    i = next(counter, None)
+                if i is None:
+                    return
+                kind = KINDS[i % len(KINDS)]
+                t0 = time.perf_counter()
+                size = _request(conn, kind, etag)
+                dt = time.perf_counter() - t0
+                with lock:
+                    samples[kind].append(dt * 1000)
+                    sizes[kind].append(size)
+        finally:
+            conn.close()
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+    result = {"requests_per_s": round(total / wall, 1), "kinds": {}}
+    for kind in KINDS:
+        q = statistics.quantiles(samples[kind], n=100)
+        result["kinds"][kind] = {
+            "p50_ms": round(q[49], 2), "p95_ms": round(q[94], 2), "p99_ms": round(q[98], 2),
+            "bytes": round(statistics.mean(sizes[kind])),
+        }
+    return result
+
+
+def app_sessions(count):
+    """``count`` sequential page loads as Streamlit sessions; returns per-load ms."""
+    port = free_port()
+    cmd = [sys.executable, "-m", "streamlit", "run", str(ROOT / "app.py"), "--server.port", str(port), *FLAGS]
+    proc = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(port, proc)
+        asyncio.run(session(port))  # the first run pays the cold start; bench_startup covers it
+        return [asyncio.run(session(port))[1] * 1000 for _ in range(count)]
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--app", type=int, default=0, help="also time this many Streamlit page loads")
+    parser.add_argument("--json", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    port = free_port()
+    proc = subprocess.Popen([sys.executable, str(ROOT / "sidecar.py"), "--port", str(port)], cwd=ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_healthy(port, proc)
+        sidecar = load(port, args.requests, args.clients)
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+    result = {"python": platform.python_version(), "cpus": os.cpu_count(), "requests": args.requests,
+              "clients": args.clients, "sidecar": sidecar}
+    print(f"side-car: {sidecar['requests_per_s']:.0f} req/s with {args.clients} clients")
+    print(f"{'':12} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'bytes':>8}")
+    for kind, k in sidecar["kinds"].items():
+        print(f"{kind:12} {k['p50_ms']:8.2f} {k['p95_ms']:8.2f} {k['p99_ms']:8.2f} {k['bytes']:8d}")
+    if args.app:
+        loads = app_sessions(args.app)
+        result["app_session_ms"] = {"p50": round(statistics.median(loads), 1), "max": round(max(loads), 1)}
+        print(f"Streamlit page load (session): p50 {result['app_session_ms']['p50']:.0f} ms, "
+              f"max {result['app_session_ms']['max']:.0f} ms")
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
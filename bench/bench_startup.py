@@ -0,0 +1,132 @@
+"""Cold start and first render of a fresh server process.
+
+Starts the app the two supported ways, ``streamlit run app.py`` and
+``python serve.py`` (warm-up first). For each, it measures from process
+spawn:
+
+- ready: the health endpoint answers, i.e. the server accepts traffic;
+- first paint: the first page element reaches a websocket client that
+  connects as soon as the server is ready;
+- first render: that client's script run has finished;
+- first wait: first render minus ready, i.e. what the first visitor waits;
+- warm render: a second session's full run.
+
+Every run is a new process. The on-disk caches in ``build/`` are kept, as
+they would be on a redeploy. Medians over ``--runs`` are printed:
+
+    python bench/bench_startup.py [--runs 3] [--json out.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+ROOT = Path(__file__).resolve().parents[1]
+TIMEOUT = 60
+FLAGS = ["--server.headless", "true", "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"]
+LAUNCHERS = {
+    "streamlit run": lambda port: [sys.executable, "-m", "streamlit", "run", str(ROOT / "app.py"),
+                                   "--server.port", str(port), *FLAGS],
+    "serve.py": lambda port: [sys.executable, str(ROOT / "serve.py"), "--server.port", str(port), *FLAGS],
+}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(port, proc):
+    url = f"http://127.0.0.1:{port}/_stcore/health"
+    deadline = time.perf_counter() + TIMEOUT
+    while time.perf_counter() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with {proc.returncode}")
+        try:
+            with urllib.request.urlopen(url, timeout=1) as r:
+                if r.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.02)
+    raise TimeoutError("server did not become ready")
+
+
+async def session(port):
+    """One page load over the websocket; returns (first element, finished) in seconds after connecting."""
+    t0 = time.perf_counter()
+    ws = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream")
+    msg = BackMsg()
+    msg.rerun_script.query_string = ""
+    msg.rerun_script.page_script_hash = ""
+    await ws.write_message(msg.SerializeToString(), binary=True)
+    first = None
+    try:
+        while True:
+            raw = await asyncio.wait_for(ws.read_message(), TIMEOUT)
+            if raw is None:
+                raise RuntimeError("connection closed before the script finished")
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if first is None and kind == "delta":
+                first = time.perf_counter() - t0
+            if kind == "script_finished":
+                return first, time.perf_counter() - t0
+    finally:
+        ws.close()
+
+
+def run_once(name):
+    port = free_port()
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(LAUNCHERS[name](port), cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(port, proc)
+        ready = time.perf_counter() - t0
+        first, done = asyncio.run(session(port))
+        _, warm = asyncio.run(session(port))
+    finally:
+        proc.terminate()
+        proc.wait(10)
+    return {
+        "ready_ms": ready * 1000,
+        "first_paint_ms": (ready + first) * 1000,
+        "first_render_ms": (ready + done) * 1000,
+        "first_wait_ms": done * 1000,
+        "warm_render_ms": warm * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--json", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    result = {"python": platform.python_version(), "cpus": os.cpu_count(), "runs": args.runs, "launchers": {}}
+    print(f"{'ms (median)':24} {'ready':>8} {'1st paint':>10} {'1st render':>11} {'1st wait':>9} {'warm render':>12}")
+    for name in LAUNCHERS:
+        runs = [run_once(name) for _ in range(args.runs)]
+        med = {k: round(statistics.median(r[k] for r in runs), 1) for k in runs[0]}
+        result["launchers"][name] = med
+        print(f"{name:24} {med['ready_ms']:8.0f} {med['first_paint_ms']:10.0f} "
+              f"{med['first_render_ms']:11.0f} {med['first_wait_ms']:9.0f} {med['warm_render_ms']:12.0f}")
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
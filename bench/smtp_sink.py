@@ -0,0 +1,90 @@
+"""Local SMTP stand-in for trying the contact outbox (outbox.py) without a mail server.
+
+Accepts every message and writes it to ``--out`` as an .eml file. ``--delay``
+adds latency per message and ``--fail-every N`` answers every N-th DATA with a
+temporary failure, to exercise the worker's retries:
+
+    python bench/smtp_sink.py [--port 8025] [--delay 0.5] [--fail-every 3]
+    RESUME_SMTP_HOST=127.0.0.1 RESUME_SMTP_PORT=8025 streamlit run app.py
+"""
+import argparse
+import itertools
+import socketserver
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self):
+        srv = self.server
+        self.reply("220 smtp-sink ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line.decode("utf-8", "replace").strip().split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 smtp-sink")
+            elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                for raw in iter(self.rfile.readline, b""):
+                    if raw in (b".\r\n", b".\n"):
+                        break
+                    data.append(raw[1:] if raw.startswith(b"..") else raw)
+                time.sleep(srv.delay)
+                n = next(srv.counter)
+                if srv.fail_every and n % srv.fail_every == 0:
+                    self.reply("451 Temporary failure, try again")
+                    continue
+                with srv.lock:
+                    srv.received += 1
+                    path = srv.out / f"{int(time.time() * 1000)}-{n}.eml"
+                path.write_bytes(b"".join(data))
+                self.reply("250 Queued")
+                print(f"received message {srv.received} -> {path.name}", flush=True)
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, out, delay=0.0, fail_every=0):
+        super().__init__(address, SMTPHandler)
+        self.out = Path(out)
+        self.out.mkdir(parents=True, exist_ok=True)
+        self.delay = delay
+        self.fail_every = fail_every
+        self.counter = itertools.count(1)
+        self.lock = threading.Lock()
+        self.received = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--out", type=Path, default=ROOT / "build" / "smtp-sink")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds of latency per message")
+    parser.add_argument("--fail-every", type=int, default=0, help="temporarily reject every N-th message")
+    args = parser.parse_args()
+    with SMTPSink((args.host, args.port), args.out, args.delay, args.fail_every) as srv:
+        print(f"SMTP sink on {args.host}:{args.port}, writing to {args.out}", flush=True)
+        srv.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Case studies as their own cached pages.
+
+Each case study is rendered once per project id, content revision and theme
+stylesheet into a standalone HTML page. The page is published under its
+content hash in ``build/cases`` and served through the component route like
+other assets. Project cards link to these pages, and page.js prefetches them
+on hover, so opening one is a cached fetch rather than a script rerun.
+
+The page's back link returns through the browser history to the app URL,
+which carries the filter state (see ``app.py``). The previous list then comes
+back with the same filters. Without history it links to the app with
+``query``, so a hosted profile (``?p=``, see profiles.py) stays selected.
+"""
+import threading
+
+from fonts import FONT_KIND, font_tags, publish_fonts
+from render import case_study_html, page_html
+from static_assets import asset_url, publish_bytes
+
+CASE_KIND = "cases"
+CACHE_SIZE = 512
+
+BACK_LINK = (
+    "<div style='margin-top:12px;'><a class='badge' href='{app}#projects' "
+    "onclick='if (document.referrer && history.length > 1) {{ history.back(); return false; }}'>"
+    "← Back to all projects</a></div>"
+)
+
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cached(key, build):
+    value = _CACHE.get(key)
+    if value is None:
+        value = build()
+        with _CACHE_LOCK:
+            value = _CACHE.setdefault(key, value)
+            while len(_CACHE) > CACHE_SIZE:
+                _CACHE.pop(next(iter(_CACHE)))
+    return value
+
+
+def case_html(resume, project_id):
+    """Case-study markup for the in-app ``?case=`` view, cached per id and revision."""
+    project = resume.projects_by_id.get(project_id)
+    if project is None:
+        return None
+    return _cached(("html", resume.revision, project_id), lambda: case_study_html(project))
+
+
+def case_page(resume, project_id, css_name, query=""):
+    """File name of the published case page for ``project_id`` styled with theme bundle ``css_name``."""
+    fonts = publish_fonts(resume)
+
+    def build():
+        project = resume.projects_by_id[project_id]
+        body = (
+            '<section class="section" id="projects" aria-label="Case study">'
+            f'<div class="card">{case_html(resume, project_id)}'
+            + BACK_LINK.format(app=f"../../{query}")
+            + "</div></section>"
+        )
+        css = asset_url("theme", css_name, from_asset=True)
+        # Same font subsets as the app; no hero here, so nothing to preload.
+        head = font_tags(fonts, lambda name: asset_url(FONT_KIND, name, from_asset=True), preload=False)
+        html = page_html(f"{project.title} — {resume.profile.name}", css, body, head)
+        return publish_bytes(CASE_KIND, html, ".html")
+
+    # The font files are part of the key: adding a font source must reach pages already built.
+    key = ("page", resume.revision, project_id, css_name, query, tuple(f.name for f in fonts))
+    return _cached(key, build)
+
+
+def case_url(resume, project_id, css_name, query=""):
+    return asset_url(CASE_KIND, case_page(resume, project_id, css_name, query))
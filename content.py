@@ -0,0 +1,97 @@
+"""Resume content loaded from ``content/profile.json``.
+
+A ``ContentStore`` parses and validates the file once and keeps the result
+(profiles.py holds one store per profile). Each ``load()`` only ``stat``s
+the file; it is re-read when its mtime or size changes and re-parsed only if
+the bytes hash differently, so edits go live on the next rerun without a
+restart. A file that fails validation is reported and the last
+good revision keeps being served.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+CONTENT_PATH = Path(__file__).parent / "content" / "profile.json"
+
+_LOGGER = logging.getLogger(__name__)
+
+# key -> (type, required keys of each item / of the mapping)
+SCHEMA = {
+    "profile": (dict, ("name", "headline", "badges", "about")),
+    "stats": (dict, ("years", "projects", "impact_pct")),
+    "contact": (dict, ("email", "calendar")),
+    "roles": (list, ("label", "tldr", "deep", "featured")),
+    "experience": (list, ("company", "title", "where", "from", "to", "items")),
+    "projects": (list, ("id", "title", "summary", "par", "metrics", "tags")),
+    "skills": (dict, ()),
+    "skill_level": (dict, ()),
+    "testimonials": (list, ("quote", "name", "role")),
+    "resume_history": (list, ("date", "changes")),
+}
+
+
+class ContentError(ValueError):
+    pass
+
+
+def validate(data):
+    if not isinstance(data, dict):
+        raise ContentError("content root must be an object")
+    for key, (kind, fields) in SCHEMA.items():
+        if key not in data:
+            raise ContentError(f"missing section {key!r}")
+        value = data[key]
+        if not isinstance(value, kind):
+            raise ContentError(f"{key!r} must be a {kind.__name__}")
+        items = value if kind is list else [value]
+        for n, item in enumerate(items):
+            missing = [f for f in fields if f not in item]
+            if missing:
+                raise ContentError(f"{key}[{n}] is missing {', '.join(missing)}")
+    ids = [p["id"] for p in data["projects"]]
+    if len(ids) != len(set(ids)):
+        raise ContentError("project ids must be unique")
+    for p in data["projects"]:
+        if "year" not in p["tags"]:
+            raise ContentError(f"project {p['id']!r} has no tags.year")
+    return data
+
+
+class ContentStore:
+    """Process-wide cache of one content file, keyed by mtime/size and content hash."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._revision = None
+        self._data = None
+
+    def load(self):
+        """Return ``(revision, data)``; ``revision`` is the content hash of the file."""
+        st = os.stat(self.path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp:
+            return self._revision, self._data
+        with self._lock:
+            if stamp != self._stamp:
+                self._reload(stamp)
+        return self._revision, self._data
+
+    def _reload(self, stamp):
+        raw = self.path.read_bytes()
+        revision = hashlib.sha256(raw).hexdigest()[:16]
+        if revision != self._revision:
+            try:
+                data = validate(json.loads(raw))
+            except (ValueError, ContentError) as e:
+                if self._data is None:
+                    raise
+                _LOGGER.error("Ignoring invalid content in %s: %s", self.path, e)
+                self._stamp = stamp
+                return
+            self._revision, self._data = revision, data
+        self._stamp = stamp
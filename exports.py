@@ -0,0 +1,182 @@
+"""Machine-readable exports of each resume variant: JSON Resume, plain text and Markdown.
+
+Each role focus × Scan/Deep variant is serialized from the same
+``model.Resume`` as the page. For every content revision, all variants are
+written once as content-hashed files under ``build/exports``, plus a manifest
+with a stable name that lists them: ``index.json`` for the default profile,
+``index-<slug>.json`` for a hosted one (see profiles.py). Crawlers and ATS
+importers fetch the manifest and the files over plain HTTP from
+``component/static_assets.exports/`` and never open a UI session. serve.py
+publishes the exports during its warm-up and routes them as soon as the
+server's runtime exists (``static_assets.register_routes``).
+
+JSON output follows the JSON Resume schema (https://jsonresume.org/schema/).
+The variant's highlight bullets go in ``basics.highlights``, and the variant
+itself in ``meta``.
+"""
+import json
+import re
+import threading
+
+from static_assets import atomic_write, kind_dir, publish_bytes
+
+EXPORT_KIND = "exports"
+MODES = (("scan", True), ("deep", False))
+FORMATS = {"json": ".json", "txt": ".txt", "md": ".md"}
+LEVELS = {1: "Beginner", 2: "Elementary", 3: "Intermediate", 4: "Advanced", 5: "Expert"}
+_MONTHS = {m: n for n, m in enumerate(("jan", "feb", "mar", "apr", "may", "jun",
+                                        "jul", "aug", "sep", "oct", "nov", "dec"), 1)}
+
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+CACHE_SIZE = 64
+
+
+def _iso_date(text):
+    """``"Dec 2024"`` -> ``"2024-12"``; None for "Present" or anything unparseable."""
+    m = re.match(r"^\s*([A-Za-z]{3})[a-z]*\.?\s+(\d{4})\s*$", text)
+    if m and m.group(1).lower() in _MONTHS:
+        return f"{m.group(2)}-{_MONTHS[m.group(1).lower()]:02d}"
+    m = re.match(r"^\s*(\d{4})\s*$", text)
+    return m.group(1) if m else None
+
+
+def _projects(resume, role):
+    return [resume.projects_by_id[pid] for pid in resume.role(role).order]
+
+
+def _project_lines(p, scan):
+    lines = [] if scan else [f"{e.kind}: {e.text}" for e in p.par]
+    return lines + [f"{m.label}: {m.value}" for m in p.metrics]
+
+
+def json_resume(resume, role, scan):
+    profile, contact = resume.profile, resume.contact
+    work = []
+    for e in resume.experience:
+        entry = {"name": e.company, "position": e.title, "location": e.where, "highlights": list(e.items)}
+        start, end = _iso_date(e.start), _iso_date(e.end)
+        if start:
+            entry["startDate"] = start
+        if end:
+            entry["endDate"] = end
+        work.append(entry)
+    return {
+        "$schema": "https://raw.githubusercontent.com/jsonresume/resume-schema/v1.0.0/schema.json",
+        "basics": {
+            "name": profile.name,
+            "label": profile.headline,
+            "email": contact.email,
+            "url": contact.calendar,
+            "summary": profile.about,
+            "highlights": list(resume.role(role).bullets(scan)),
+        },
+        "work": work,
+        "projects": [
+            {
+                "name": p.title,
+                "description": p.summary,
+                "highlights": _project_lines(p, scan),
+                "keywords": list(p.stack + p.industry),
+                "startDate": str(p.year),
+            }
+            for p in _projects(resume, role)
+        ],
+        "skills": [
+            {"name": s.name, "level": LEVELS.get(s.level, ""), "keywords": [group]}
+            for group, items in resume.skills for s in items
+        ],
+        "references": [{"name": f"{t.name}, {t.role}", "reference": t.quote} for t in resume.testimonials],
+        "meta": {"version": resume.revision, "variant": {"role": role, "mode": "scan" if scan else "deep"}},
+    }
+
+
+def _sections(resume, role, scan):
+    """``(heading, [(title, [lines])])`` pairs shared by the text and Markdown writers."""
+    yield "Highlights", [("", list(resume.role(role).bullets(scan)))]
+    yield "Experience", [
+        (f"{e.title} — {e.company} ({e.start} – {e.end}, {e.where})", list(e.items)) for e in resume.experience
+    ]
+    yield "Projects", [
+        (f"{p.title} ({p.year}) — {p.summary}", _project_lines(p, scan)) for p in _projects(resume, role)
+    ]
+    yield "Skills", [
+        ("", [f"{group}: " + ", ".join(f"{s.name} ({s.level}/5)" for s in items) for group, items in resume.skills])
+    ]
+
+
+def plain_text(resume, role, scan):
+    profile, contact = resume.profile, resume.contact
+    out = [profile.name, profile.headline, f"{contact.email} · {contact.calendar}", "", profile.about]
+    for heading, entries in _sections(resume, role, scan):
+        out += ["", heading.upper(), "-" * len(heading)]
+        for title, lines in entries:
+            if title:
+                out.append(title)
+            out += [f"  - {line}" if title else f"- {line}" for line in lines]
+    return "\n".join(out) + "\n"
+
+
+def markdown(resume, role, scan):
+    profile, contact = resume.profile, resume.contact
+    out = [f"# {profile.name}", "", f"_{profile.headline}_", "",
+           f"[{contact.email}](mailto:{contact.email}) · [Calendar]({contact.calendar})", "", profile.about]
+    for heading, entries in _sections(resume, role, scan):
+        out += ["", f"## {heading}", ""] if out[-1] else [f"## {heading}", ""]
+        for title, lines in entries:
+            if title:
+                out.append(f"**{title}**")
+                out.append("")
+            out += [f"- {line}" for line in lines]
+            if title:
+                out.append("")
+    return "\n".join(out).rstrip("\n") + "\n"
+
+
+def serialize(resume, fmt, role, scan):
+    """One export as bytes."""
+    if fmt == "json":
+        return json.dumps(json_resume(resume, role, scan), ensure_ascii=False, indent=2).encode("utf-8")
+    return (plain_text if fmt == "txt" else markdown)(resume, role, scan).encode("utf-8")
+
+
+def manifest_name(slug=""):
+    return f"index-{slug}.json" if slug else "index.json"
+
+
+def _publish(resume, slug):
+    variants = []
+    for r in resume.roles:
+        for mode, scan in MODES:
+            entry = {"role": r.label, "mode": mode}
+            for fmt, suffix in FORMATS.items():
+                entry[fmt] = publish_bytes(EXPORT_KIND, serialize(resume, fmt, r.label, scan), suffix)
+            variants.append(entry)
+    manifest = {"name": resume.profile.name, "revision": resume.revision, "variants": variants}
+    path = kind_dir(EXPORT_KIND) / manifest_name(slug)
+    data = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+    if not path.exists() or path.read_bytes() != data:
+        atomic_write(path, data)
+    return manifest
+
+
+def publish_exports(resume, slug=""):
+    """Publish every variant of ``resume`` (once per revision); returns the manifest."""
+    key = (slug, resume.revision)
+    manifest = _CACHE.get(key)
+    if manifest is None:
+        manifest = _publish(resume, slug)
+        with _CACHE_LOCK:
+            manifest = _CACHE.setdefault(key, manifest)
+            while len(_CACHE) > CACHE_SIZE:
+                _CACHE.pop(next(iter(_CACHE)))
+    return manifest
+
+
+def export_names(resume, role, scan, slug=""):
+    """``{fmt: file name}`` for one variant."""
+    mode = "scan" if scan else "deep"
+    for entry in publish_exports(resume, slug)["variants"]:
+        if entry["role"] == role and entry["mode"] == mode:
+            return {fmt: entry[fmt] for fmt in FORMATS}
+    raise KeyError(role)
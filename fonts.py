@@ -0,0 +1,215 @@
+"""Self-hosted web fonts, subset to the characters the content uses.
+
+theme.py sets ``Inter`` for text and ``Space Grotesk`` for the hero name.
+Their source files (SIL OFL; the variable TTFs from Google Fonts, or any
+static TTF/OTF of the family under the same name) go in ``assets/fonts``; see
+``FACES``. For each content revision every face is cut down to:
+
+- the characters it has to draw: the hero font only the profile name, the
+  text font printable ASCII, the templates' punctuation and every character
+  in the content;
+- the weights the stylesheet uses: a variable font keeps only that part of
+  its weight axis, its other axes are pinned to their defaults;
+
+then written as WOFF2; fontTools needs ``brotli`` for that (both are in
+requirements.txt), and without it the faces are written as WOFF with a
+warning in the log. Subsets are kept under
+``build/font-subsets`` by a hash of the source file, the characters and the
+weights, so a restart or a revision that uses no new character reuses them
+without loading fontTools. They are published by content hash in
+``build/fonts``: a content change that adds a character yields new URLs, and
+an unchanged one keeps them, so they can be cached as immutable.
+
+``font_tags`` returns the ``@font-face`` rules (``font-display: swap``: text
+shows at once in the fallback stack) and a ``preload`` for the hero font.
+Without source files it returns "" and pages keep the fallback stack.
+"""
+import io
+import logging
+import os
+import threading
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from static_assets import BUILD_DIR, atomic_write, content_hash, publish_bytes
+
+try:
+    import brotli
+except ImportError:  # fontTools needs it for WOFF2; _subset warns and writes WOFF (zlib)
+    brotli = None
+
+_LOGGER = logging.getLogger(__name__)
+
+FONT_KIND = "fonts"
+FONT_DIR = Path(__file__).parent / "assets" / "fonts"
+SUBSET_DIR = BUILD_DIR / "font-subsets"
+FLAVOR = "woff2" if brotli is not None else "woff"
+CACHE_SIZE = 16
+SUBSET_FORMAT = 2  # part of the subset cache key; bump when _subset's output changes
+# Printable ASCII covers the chrome and typical edits; the rest are the templates' own symbols.
+ASCII = "".join(map(chr, range(0x20, 0x7F)))
+TEMPLATE_CHARS = " –—‘’“”•…·×←→"
+
+
+@dataclass(frozen=True, slots=True)
+class Face:
+    family: str
+    source: str  # file name in FONT_DIR
+    weights: tuple  # (lightest, boldest) used by theme.py; clamps a variable font's wght axis
+    hero: bool = False  # preloaded; only draws the profile name
+
+
+FACES = (
+    Face("Inter", "Inter[opsz,wght].ttf", (400, 800)),
+    Face("Space Grotesk", "SpaceGrotesk[wght].ttf", (700, 700), hero=True),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class WebFont:
+    family: str
+    name: str  # published file name in build/fonts
+    weight: str  # CSS font-weight: one value, or a range for a variable font
+    hero: bool
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (tuple, list, frozenset)):
+        for item in value:
+            yield from _strings(item)
+    elif is_dataclass(value):
+        for f in fields(value):
+            yield from _strings(getattr(value, f.name))
+
+
+def characters(resume, face):
+    """The sorted, de-duplicated characters ``face`` has to draw for ``resume``."""
+    if face.hero:
+        chars = set(resume.profile.name)
+    else:
+        chars = set(ASCII + TEMPLATE_CHARS)
+        for text in _strings(resume):
+            chars.update(text)
+    return "".join(sorted(c for c in chars if c.isprintable() or c == " "))
+
+
+@lru_cache(maxsize=16)
+def _source_digest(path, mtime_ns, size):
+    return content_hash(Path(path).read_bytes())
+
+
+def _subset(path, text, weights):
+    # imported lazily; fontTools (~100 ms) is only needed when a subset is missing
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    if brotli is None:
+        _LOGGER.warning("brotli is not installed: writing %s as WOFF, not WOFF2 (pip install -r requirements.txt)",
+                        Path(path).name)
+    font = TTFont(path)
+    if "fvar" in font:
+        limits = {}
+        for axis in font["fvar"].axes:
+            if axis.axisTag == "wght":
+                lo, hi = (min(max(w, axis.minValue), axis.maxValue) for w in weights)
+                limits["wght"] = lo if lo == hi else (lo, hi)
+            else:
+                limits[axis.axisTag] = None  # pinned to the default
+        font = instancer.instantiateVariableFont(font, limits)
+    options = subset.Options()
+    options.flavor = FLAVOR
+    options.hinting = False  # screens at these sizes render unhinted outlines fine
+    options.desubroutinize = True  # compresses better
+    options.name_IDs = [1, 2]  # family and style only
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    weight = str(font["OS/2"].usWeightClass)
+    if "fvar" in font:
+        axis = next((a for a in font["fvar"].axes if a.axisTag == "wght"), None)
+        if axis is not None:
+            weight = f"{axis.minValue:g} {axis.maxValue:g}"
+    buf = io.BytesIO()
+    font.flavor = FLAVOR  # options.flavor only applies to subset.save_font
+    font.save(buf)
+    return buf.getvalue(), weight
+
+
+def _web_font(face, text):
+    path = FONT_DIR / face.source
+    st = os.stat(path)
+    digest = _source_digest(str(path), st.st_mtime_ns, st.st_size)
+    key = content_hash(f"{digest}|{SUBSET_FORMAT}|{FLAVOR}|{face.weights}|{text}")
+    data_path, weight_path = SUBSET_DIR / f"{key}.{FLAVOR}", SUBSET_DIR / f"{key}.weight"
+    try:
+        data, weight = data_path.read_bytes(), weight_path.read_text(encoding="utf-8")
+    except OSError:
+        data, weight = _subset(path, text, face.weights)
+        SUBSET_DIR.mkdir(parents=True, exist_ok=True)
+        atomic_write(data_path, data)
+        atomic_write(weight_path, weight.encode("utf-8"))
+    return WebFont(face.family, publish_bytes(FONT_KIND, data, f".{FLAVOR}"), weight, face.hero)
+
+
+def _sources():
+    # A file's stamp is part of the cache key, so adding or replacing a font is picked up.
+    stamps = []
+    for face in FACES:
+        try:
+            st = os.stat(FONT_DIR / face.source)
+        except OSError:
+            continue
+        stamps.append((face.source, st.st_mtime_ns, st.st_size))
+    return tuple(stamps)
+
+
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def publish_fonts(resume):
+    """Subset and publish every face that has a source file; returns a tuple of ``WebFont``.
+
+    Cached per content revision and source-file stamp (a few ``stat`` calls
+    per lookup), so fonts added to ``FONT_DIR`` are picked up on the next
+    rerun. Faces without a source file are skipped, and a build directory
+    that cannot be written gives ``()``.
+    """
+    sources = _sources()
+    key = (resume.revision, sources)
+    fonts = _CACHE.get(key)
+    if fonts is None:
+        present = {name for name, _, _ in sources}
+        try:
+            fonts = tuple(_web_font(face, characters(resume, face)) for face in FACES if face.source in present)
+        except OSError:
+            return ()
+        with _CACHE_LOCK:
+            fonts = _CACHE.setdefault(key, fonts)
+            while len(_CACHE) > CACHE_SIZE:
+                _CACHE.pop(next(iter(_CACHE)))
+    return fonts
+
+
+def font_tags(fonts, url, preload=True):
+    """``@font-face`` rules for ``fonts`` plus a preload of the hero font; ``url(name)`` gives each href.
+
+    Pass ``preload=False`` for pages without the hero (case studies).
+    """
+    if not fonts:
+        return ""
+    mime = f"font/{FLAVOR}"
+    rules = "".join(
+        f'@font-face{{font-family:"{f.family}";src:url("{url(f.name)}") format("{FLAVOR}");'
+        f"font-weight:{f.weight};font-style:normal;font-display:swap}}"
+        for f in fonts
+    )
+    links = "".join(
+        f'<link rel="preload" href="{url(f.name)}" as="font" type="{mime}" crossorigin>'
+        for f in fonts if preload and f.hero
+    )
+    return f"{links}<style>{rules}</style>"
@@ -0,0 +1,78 @@
+"""Memoized HTML fragments for the app's cards and lists.
+
+The templates in render.py are pure functions of frozen model records (see
+model.py), so their output can be reused across reruns and sessions. A
+fragment is keyed by the template, its arguments (records hash by value) and
+the active theme stylesheet, and kept in one bounded LRU per process. A rerun
+that changes nothing is then a series of dict lookups. Fragments are stored
+minified (``render.minify_html``), since they are sent on every rerun.
+
+Hit/miss counts are kept process-wide and per thread; a script run happens on
+one thread, so the profiler (profiling.py) reads the per-thread counts to
+attribute hits and misses to a run and its sections.
+"""
+import threading
+from collections import OrderedDict
+
+from render import minify_html
+
+MAX_ENTRIES = 2048
+
+
+class FragmentCache:
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def render(self, template, *args, theme=None):
+        """``template(*args)``, cached per template, arguments and theme."""
+        key = (template, args, theme)
+        local = self._local.__dict__
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if html is not None:
+            local["hits"] = local.get("hits", 0) + 1
+            return html
+        html = minify_html(template(*args))
+        local["misses"] = local.get("misses", 0) + 1
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = html
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return html
+
+    def thread_counts(self):
+        """``(hits, misses)`` so far on the calling thread."""
+        local = self._local.__dict__
+        return local.get("hits", 0), local.get("misses", 0)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 3) if total else None,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+FRAGMENTS = FragmentCache()
+
+
+def fragment(template, *args, theme=None):
+    return FRAGMENTS.render(template, *args, theme=theme)
@@ -0,0 +1,265 @@
+/*
+ * Instant project filtering in the browser (the app's "Instant filtering" mode).
+ *
+ * Loads the catalogue JSON built by search.client_catalog once (it is
+ * content-hashed and cacheable), then searches, filters, orders by the role's
+ * featured list (or by the order the app passes, e.g. a job-description
+ * ranking) and highlights matches locally. Matching follows
+ * search.ProjectIndex: every query term must match a token exactly, by prefix,
+ * or within one edit for terms of typoMinLen+ characters; facets are OR within
+ * a facet and AND across facets. Nothing is sent back to Python, so typing and
+ * clicking filters never cause a rerun.
+ */
+(function (global) {
+  "use strict";
+
+  var TOKEN = /[\p{L}\p{N}]+/gu;
+  var STORAGE_KEY = "resume-instant-filter";
+  var LABELS = { stack: "Skill", industry: "Industry", impact: "Impact", year: "Year" };
+
+  function tokenize(text) {
+    return (text.toLowerCase().match(TOKEN) || []);
+  }
+
+  // Mirrors search.within_one_edit: at most one insertion, deletion or substitution.
+  function withinOneEdit(a, b) {
+    if (a.length > b.length) { var t = a; a = b; b = t; }
+    if (b.length - a.length > 1) return false;
+    var i = 0;
+    while (i < a.length && a[i] === b[i]) i++;
+    if (a.length === b.length) return a.slice(i + 1) === b.slice(i + 1);
+    return a.slice(i) === b.slice(i + 1);
+  }
+
+  function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, function (c) {
+      return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[c];
+    });
+  }
+
+  // Filters restored from sessionStorage may name values (or facets) a newer catalogue no longer has.
+  // Such a value would match nothing and hide every project, with no button to clear it.
+  function pruneFilters(filters, facets) {
+    var out = {};
+    Object.keys(LABELS).forEach(function (facet) {
+      var known = facets[facet] || [];
+      var selected = Array.isArray(filters && filters[facet]) ? filters[facet] : [];
+      out[facet] = selected.filter(function (v) { return known.indexOf(v) !== -1; });
+    });
+    return out;
+  }
+
+  function Catalog(data) {
+    this.data = data;
+    this.vocab = Object.keys(data.postings).sort();
+    this.n = data.projects.length;
+  }
+
+  // Tokens in the vocabulary that ``term`` matches (exact, prefix or one edit).
+  Catalog.prototype.termTokens = function (term) {
+    var out = new Set();
+    var vocab = this.vocab, lo = 0, hi = vocab.length;
+    while (lo < hi) {
+      var mid = (lo + hi) >> 1;
+      if (vocab[mid] < term) lo = mid + 1; else hi = mid;
+    }
+    for (var i = lo; i < vocab.length && vocab[i].startsWith(term); i++) out.add(vocab[i]);
+    var minLen = this.data.typoMinLen;
+    if (term.length >= minLen) {
+      vocab.forEach(function (tok) {
+        if (tok.length >= minLen && !out.has(tok) && withinOneEdit(term, tok)) out.add(tok);
+      });
+    }
+    return out;
+  };
+
+  Catalog.prototype.search = function (query, role, filters, order) {
+    var data = this.data, n = this.n;
+    var keep = new Uint8Array(n).fill(1);
+    var marks = new Set();
+    Object.keys(filters).forEach(function (facet) {
+      var selected = filters[facet];
+      if (!selected || !selected.length) return;
+      var wanted = new Set(selected.map(function (v) { return data.facets[facet].indexOf(v); }));
+      data.projects.forEach(function (p, i) {
+        var values = facet === "stack" ? p[3] : facet === "industry" ? p[4] : [facet === "impact" ? p[5] : p[6]];
+        if (!values.some(function (v) { return wanted.has(v); })) keep[i] = 0;
+      });
+    });
+    var self = this;
+    tokenize(query).forEach(function (term) {
+      var hit = new Uint8Array(n);
+      self.termTokens(term).forEach(function (tok) {
+        marks.add(tok);
+        data.postings[tok].forEach(function (i) { hit[i] = 1; });
+      });
+      for (var i = 0; i < n; i++) keep[i] &= hit[i];
+    });
+    order = order || data.order[role] || data.projects.map(function (_, i) { return i; });
+    return { rows: order.filter(function (i) { return keep[i]; }), marks: marks };
+  };
+
+  function highlight(text, marks) {
+    if (!marks.size) return escapeHtml(text);
+    var out = "", last = 0, m;
+    TOKEN.lastIndex = 0;
+    while ((m = TOKEN.exec(text))) {
+      if (marks.has(m[0].toLowerCase())) {
+        out += escapeHtml(text.slice(last, m.index)) + "<mark>" + escapeHtml(m[0]) + "</mark>";
+        last = m.index + m[0].length;
+      }
+    }
+    return out + escapeHtml(text.slice(last));
+  }
+
+  function mountComponent() {
+    var parentWin = global.parent;
+    var state = { query: "", filters: { stack: [], industry: [], impact: [], year: [] } };
+    var args = {}, catalog = null, catalogUrl = null;
+    try {
+      Object.assign(state, JSON.parse(global.sessionStorage.getItem(STORAGE_KEY) || "{}"));
+    } catch (err) { /* storage unavailable: start empty */ }
+
+    function send(type, data) {
+      parentWin.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data || {}), "*");
+    }
+
+    function resolve(url) {
+      // Arguments are relative to the app page, not to this iframe.
+      try { return new URL(url, parentWin.document.baseURI).href; } catch (err) { return url; }
+    }
+
+    function caseHref(id) {
+      var url;
+      try { url = new URL(parentWin.location.href); } catch (err) { return "?case=" + encodeURIComponent(id); }
+      url.searchParams.set("case", id);
+      url.hash = "projects";
+      return url.href;
+    }
+
+    function save() {
+      try { global.sessionStorage.setItem(STORAGE_KEY, JSON.stringify(state)); } catch (err) { /* ignore */ }
+    }
+
+    var link = document.createElement("link");
+    link.rel = "stylesheet";
+    link.id = "theme";
+    document.head.appendChild(link);
+    document.body.style.cssText = "margin:0;background:transparent;";
+    var root = document.createElement("div");
+    root.id = "root";
+    document.body.appendChild(root);
+    var resizeTimer = 0;
+    function fit() {
+      cancelAnimationFrame(resizeTimer);
+      resizeTimer = requestAnimationFrame(function () {
+        send("streamlit:setFrameHeight", { height: document.documentElement.scrollHeight });
+      });
+    }
+
+    function renderControls() {
+      var data = catalog.data;
+      var order = args.impactOrder || [];
+      var html = '<div class="card" style="margin-bottom:12px;">'
+        + '<label for="project-search" class="section-title" style="display:block;">Search</label>'
+        + '<input id="project-search" type="search" autocomplete="off" placeholder="Type to filter…" value="'
+        + escapeHtml(state.query) + '" style="width:100%;padding:8px;border-radius:10px;border:1px solid var(--border);">';
+      Object.keys(LABELS).forEach(function (facet) {
+        var values = data.facets[facet].map(function (v, i) { return [v, i]; });
+        if (facet === "impact" && order.length) {
+          values.sort(function (a, b) { return order.indexOf(a[0]) - order.indexOf(b[0]); });
+        } else if (facet === "year") {
+          values.reverse();
+        }
+        html += '<div role="group" aria-label="Filter by ' + LABELS[facet].toLowerCase() + '" style="margin-top:8px;">'
+          + '<span class="muted">' + LABELS[facet] + ':</span> '
+          + values.map(function (pair) {
+            var on = state.filters[facet].indexOf(pair[0]) !== -1;
+            return '<button type="button" class="badge" data-facet="' + facet + '" data-value="' + pair[1]
+              + '" aria-pressed="' + on + '">' + escapeHtml(pair[0]) + "</button>";
+          }).join(" ") + "</div>";
+      });
+      return html + '<div class="muted" id="result-count" aria-live="polite" style="margin-top:8px;"></div></div>';
+    }
+
+    function renderResults() {
+      var data = catalog.data;
+      var t0 = performance.now();
+      var result = catalog.search(state.query, args.role, state.filters, args.order);
+      var html = result.rows.map(function (i) {
+        var p = data.projects[i];
+        var badges = p[3].map(function (v) { return data.facets.stack[v]; })
+          .concat(p[4].map(function (v) { return data.facets.industry[v]; }))
+          .map(function (t) { return "<span class='badge'>" + escapeHtml(t) + "</span>"; }).join(" ");
+        return "<div class='proj-card card'>"
+          + "<div class='section-title'>" + highlight(p[1], result.marks) + "</div>"
+          + "<div class='muted' style='margin:4px 0 8px 0;'>" + highlight(p[2], result.marks) + "</div>"
+          + badges
+          + "<div style='margin-top:8px;'><a class='badge' target='_top' href='" + escapeHtml(caseHref(p[0]))
+          + "'>Read case study</a></div></div>";
+      }).join("");
+      document.getElementById("results").innerHTML = html
+        || "<div class='card muted'>No projects match your current filters.</div>";
+      document.getElementById("result-count").textContent = result.rows.length + " of " + catalog.n
+        + " projects · filtered in " + (performance.now() - t0).toFixed(1) + " ms";
+      fit();
+    }
+
+    function render() {
+      if (!catalog) return;
+      if (!document.getElementById("results")) {
+        root.innerHTML = renderControls() + '<div id="results"></div>';
+        var input = document.getElementById("project-search");
+        input.addEventListener("input", function () {
+          state.query = input.value;
+          save();
+          renderResults();
+        });
+        root.addEventListener("click", function (e) {
+          var button = e.target.closest("button[data-facet]");
+          if (!button) return;
+          var facet = button.dataset.facet;
+          var list = state.filters[facet], value = catalog.data.facets[facet][Number(button.dataset.value)];
+          var at = list.indexOf(value);
+          if (at === -1) list.push(value); else list.splice(at, 1);
+          button.setAttribute("aria-pressed", String(at === -1));
+          save();
+          renderResults();
+        });
+        document.addEventListener("keydown", function (e) {
+          if (e.key === "/" && e.target !== input) { e.preventDefault(); input.focus(); }
+        });
+      }
+      renderResults();
+    }
+
+    function setStylesheet(href) {
+      if (href && link.getAttribute("href") !== href) link.setAttribute("href", href);
+    }
+
+    global.addEventListener("message", function (event) {
+      var msg = event.data;
+      if (!msg || msg.type !== "streamlit:render") return;
+      args = msg.args || {};
+      setStylesheet(args.cssUrl && resolve(args.cssUrl));
+      var url = resolve(args.catalogUrl);
+      if (url === catalogUrl) {
+        render();  // role or theme changed: reorder locally
+        return;
+      }
+      catalogUrl = url;
+      fetch(url).then(function (r) { return r.json(); }).then(function (data) {
+        if (url !== catalogUrl) return;
+        catalog = new Catalog(data);
+        state.filters = pruneFilters(state.filters, data.facets);
+        save();
+        root.innerHTML = "";
+        render();
+      });
+    });
+    if (global.ResizeObserver) new ResizeObserver(fit).observe(document.body);
+    send("streamlit:componentReady", { apiVersion: 1 });
+  }
+
+  global.ResumeCatalog = { Catalog: Catalog, pruneFilters: pruneFilters, mountComponent: mountComponent };
+})(window);
@@ -0,0 +1,225 @@
+/*
+ * Page behaviour for the resume: active-section highlighting in the navbar,
+ * the "/" and "g p" keyboard shortcuts, the testimonial carousel,
+ * prefetching case-study pages on hover, and reporting which case studies
+ * are opened from a card.
+ *
+ * A card link (a[data-case]) leaves the app page, so the report may not reach
+ * Python before the page unloads. Opens are therefore queued in the tab's
+ * sessionStorage and sent with every report, including the first one after
+ * the app loads again. An open leaves the queue once Python acknowledges it
+ * (the caseAck argument: the time of the last open it counted).
+ *
+ * Used two ways:
+ * - inside the app's page component (page_controller.py), where it runs in a
+ *   hidden, same-origin iframe and works on the parent document;
+ * - on pre-rendered static pages, where it runs in the page itself.
+ *
+ * All lookups into the document happen at event time, so Streamlit replacing
+ * elements between reruns does not break anything.
+ */
+(function (global) {
+  "use strict";
+
+  var DEFAULTS = { reduceMotion: false, interval: 2800, searchLabel: "Search", reportDelay: 800, caseAck: 0 };
+  var OPENS_KEY = "resume-case-opens";
+  var MAX_OPENS = 50;
+
+  function init(doc, win, options, onChange) {
+    var opts = Object.assign({}, DEFAULTS, options || {});
+    var state = { section: null, slide: 0, paused: false, gAt: 0 };
+    var listeners = [];
+    var frame = 0, reportTimer = 0;
+
+    function on(target, type, fn, capture) {
+      target.addEventListener(type, fn, !!capture);
+      listeners.push([target, type, fn, !!capture]);
+    }
+
+    function reduced() {
+      return opts.reduceMotion || (win.matchMedia && win.matchMedia("(prefers-reduced-motion: reduce)").matches);
+    }
+
+    // Case studies opened from a card and not yet acknowledged, oldest first.
+    function pendingOpens() {
+      try {
+        var list = JSON.parse(win.sessionStorage.getItem(OPENS_KEY) || "[]");
+        return list.filter(function (o) { return o.at > (opts.caseAck || 0); });
+      } catch (err) { return []; }
+    }
+
+    function savePending(list) {
+      try { win.sessionStorage.setItem(OPENS_KEY, JSON.stringify(list.slice(-MAX_OPENS))); } catch (err) { /* ignore */ }
+    }
+
+    function send() {
+      onChange({ section: state.section, slide: state.slide, cases: pendingOpens() });
+    }
+
+    function report(now) {
+      if (!onChange) return;
+      clearTimeout(reportTimer);
+      if (now) send(); else reportTimer = setTimeout(send, opts.reportDelay);
+    }
+
+    function caseOpened(target) {
+      var a = target && target.closest && target.closest("a[data-case]");
+      if (!a || !onChange) return;
+      var list = pendingOpens();
+      list.push({ case: a.dataset.case, at: Math.max(Date.now(), list.length ? list[list.length - 1].at + 1 : 0) });
+      savePending(list);
+      report(true);  // the page is about to change: no debounce
+    }
+
+    // Active section: the last section whose top is above 40% of the viewport.
+    function updateActive() {
+      frame = 0;
+      var links = Array.prototype.slice.call(doc.querySelectorAll("#toc a.nav-btn"));
+      if (!links.length) return;
+      var line = win.innerHeight * 0.4;
+      var current = links[0].dataset.section;
+      links.forEach(function (a) {
+        var el = doc.getElementById(a.dataset.section);
+        if (el && el.getBoundingClientRect().top <= line) current = a.dataset.section;
+      });
+      links.forEach(function (a) {
+        a.setAttribute("aria-current", a.dataset.section === current ? "page" : "false");
+      });
+      if (current !== state.section) {
+        state.section = current;
+        report();
+      }
+    }
+
+    function scheduleActive() {
+      if (!frame) frame = win.requestAnimationFrame(updateActive);
+    }
+
+    function scrollTo(id) {
+      var el = doc.getElementById(id);
+      if (el) el.scrollIntoView({ behavior: reduced() ? "auto" : "smooth", block: "start" });
+    }
+
+    // Carousel
+    function show(i) {
+      var track = doc.getElementById("carousel-track");
+      var total = track ? track.children.length : 0;
+      if (!total) return;
+      state.slide = ((i % total) + total) % total;
+      track.style.transform = "translateX(" + (-100 * state.slide) + "%)";
+    }
+
+    var timer = setInterval(function () {
+      if (!state.paused && !reduced() && !doc.hidden) show(state.slide + 1);
+    }, opts.interval);
+
+    // The Streamlit search box, or the one inside the instant-filter iframe (catalog.js).
+    function findSearch() {
+      var field = doc.querySelector('input[aria-label="' + opts.searchLabel + '"]') || doc.getElementById("project-search");
+      var frames = doc.querySelectorAll("iframe");
+      for (var i = 0; !field && i < frames.length; i++) {
+        try {
+          field = frames[i].contentDocument && frames[i].contentDocument.getElementById("project-search");
+        } catch (err) { /* cross-origin frame */ }
+      }
+      return field;
+    }
+
+    // Case-study links marked data-prefetch are fetched on hover/focus, once each.
+    var prefetched = new Set();
+    function prefetch(target) {
+      var a = target && target.closest && target.closest("a[data-prefetch]");
+      if (!a || prefetched.has(a.href)) return;
+      prefetched.add(a.href);
+      var link = doc.createElement("link");
+      link.rel = "prefetch";
+      link.href = a.href;
+      doc.head.appendChild(link);
+    }
+
+    function typing(target) {
+      var tag = target && target.tagName;
+      return tag === "INPUT" || tag === "TEXTAREA" || tag === "SELECT" || (target && target.isContentEditable);
+    }
+
+    on(doc, "scroll", scheduleActive, true);
+    on(win, "resize", scheduleActive);
+    on(doc, "keydown", function (e) {
+      if (e.ctrlKey || e.metaKey || e.altKey || typing(e.target)) return;
+      if (e.key === "/") {
+        var field = findSearch();
+        if (field) {
+          e.preventDefault();
+          field.focus();
+        }
+      } else if (e.key === "g") {
+        state.gAt = Date.now();
+      } else if (e.key === "p" && Date.now() - state.gAt < 600) {
+        state.gAt = 0;
+        scrollTo("projects");
+      }
+    });
+    on(doc, "click", function (e) {
+      var button = e.target.closest && e.target.closest("#prev, #next");
+      if (button) show(state.slide + (button.id === "next" ? 1 : -1));
+      caseOpened(e.target);
+    });
+    on(doc, "mouseover", function (e) {
+      state.paused = !!(e.target.closest && e.target.closest(".carousel"));
+      prefetch(e.target);
+    });
+    on(doc, "focusin", function (e) { prefetch(e.target); });
+
+    scheduleActive();
+    if (onChange && pendingOpens().length) report(true);  // opens queued before the last page change
+
+    return {
+      update: function (options) {
+        opts = Object.assign(opts, options || {});
+        if (onChange) savePending(pendingOpens());  // drop what Python has acknowledged
+        scheduleActive();
+        show(state.slide);
+      },
+      destroy: function () {
+        clearInterval(timer);
+        clearTimeout(reportTimer);
+        if (frame) win.cancelAnimationFrame(frame);
+        listeners.forEach(function (l) { l[0].removeEventListener(l[1], l[2], l[3]); });
+        listeners = [];
+      },
+    };
+  }
+
+  // Streamlit custom-component protocol, without the npm helper library.
+  function mountComponent() {
+    var handle = null;
+
+    function send(type, data) {
+      global.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data || {}), "*");
+    }
+
+    global.addEventListener("message", function (event) {
+      var msg = event.data;
+      if (!msg || msg.type !== "streamlit:render") return;
+      if (handle) {
+        handle.update(msg.args);
+        return;
+      }
+      try {
+        handle = init(global.parent.document, global.parent, msg.args, function (value) {
+          send("streamlit:setComponentValue", { value: value, dataType: "json" });
+        });
+      } catch (err) {
+        // Parent not reachable (e.g. embedded cross-origin): stay inert.
+        console.warn("resume page component disabled:", err);
+      }
+    });
+    global.addEventListener("pagehide", function () {
+      if (handle) handle.destroy();
+    });
+    send("streamlit:componentReady", { apiVersion: 1 });
+    send("streamlit:setFrameHeight", { height: 0 });
+  }
+
+  global.ResumePage = { init: init, mountComponent: mountComponent };
+})(window);
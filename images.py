@@ -0,0 +1,103 @@
+"""Responsive image variants for the hero photo (and any other raster asset).
+
+A source image is decoded once per (mtime, size), resized to a few widths,
+recompressed as progressive JPEG and WebP, and published under content-hashed
+names (see static_assets.py). A tiny blurred thumbnail is inlined as a data URI
+so the layout has a placeholder before the real image arrives.
+
+The result is also recorded in a small manifest named by the hash of the
+source bytes and the encoding settings. A restarted process reads the manifest
+instead of decoding and re-encoding the image again.
+"""
+import base64
+import hashlib
+import io
+import json
+import os
+from functools import lru_cache
+from html import escape
+
+from static_assets import asset_url, atomic_write, kind_dir, publish_bytes
+
+IMAGE_KIND = "images"
+WIDTHS = (160, 320, 640, 960)
+PLACEHOLDER_WIDTH = 24
+JPEG_QUALITY = 82
+WEBP_QUALITY = 78
+
+
+def _encode(im, fmt, **params):
+    buf = io.BytesIO()
+    im.save(buf, fmt, **params)
+    return buf.getvalue()
+
+
+def _manifest_path(src):
+    h = hashlib.sha256(repr((WIDTHS, PLACEHOLDER_WIDTH, JPEG_QUALITY, WEBP_QUALITY)).encode("ascii"))
+    with open(src, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return kind_dir(IMAGE_KIND) / f"{h.hexdigest()[:16]}.json"
+
+
+@lru_cache(maxsize=16)
+def _build(src, mtime_ns, size):
+    manifest = _manifest_path(src)
+    try:
+        variants = json.loads(manifest.read_text(encoding="utf-8"))
+        names = [name for _, name in variants["jpeg"] + variants["webp"]]
+        if all((manifest.parent / name).exists() for name in names):
+            return {**variants, "jpeg": [tuple(e) for e in variants["jpeg"]],
+                    "webp": [tuple(e) for e in variants["webp"]]}
+    except (OSError, ValueError, KeyError):
+        pass
+    variants = _encode_variants(src)
+    atomic_write(manifest, json.dumps(variants).encode("utf-8"))
+    return variants
+
+
+def _encode_variants(src):
+    from PIL import Image, ImageFilter, ImageOps
+
+    with Image.open(src) as im:
+        im = ImageOps.exif_transpose(im).convert("RGB")
+    variants = {"jpeg": [], "webp": []}
+    widths = [w for w in WIDTHS if w < im.width] + [min(im.width, WIDTHS[-1])]
+    for w in sorted(set(widths)):
+        h = round(im.height * w / im.width)
+        resized = im.resize((w, h), Image.LANCZOS)
+        jpg = _encode(resized, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+        webp = _encode(resized, "WEBP", quality=WEBP_QUALITY, method=6)
+        variants["jpeg"].append((w, publish_bytes(IMAGE_KIND, jpg, ".jpg")))
+        variants["webp"].append((w, publish_bytes(IMAGE_KIND, webp, ".webp")))
+    tiny = im.resize((PLACEHOLDER_WIDTH, round(im.height * PLACEHOLDER_WIDTH / im.width)))
+    tiny = tiny.filter(ImageFilter.GaussianBlur(1))
+    placeholder = "data:image/jpeg;base64," + base64.b64encode(_encode(tiny, "JPEG", quality=50)).decode("ascii")
+    return {"width": im.width, "height": im.height, "placeholder": placeholder, **variants}
+
+
+def image_variants(src):
+    """Published variants of ``src``; rebuilt only when the file changes."""
+    st = os.stat(src)
+    return _build(str(src), st.st_mtime_ns, st.st_size)
+
+
+def srcset(entries, url=None):
+    url = url or (lambda name: asset_url(IMAGE_KIND, name))
+    return ", ".join(f"{url(name)} {w}w" for w, name in entries)
+
+
+def picture_html(src, alt, sizes="(max-width: 900px) 60vw, 240px", eager=False, url=None):
+    """``<picture>`` markup with WebP and JPEG ``srcset`` plus an inline placeholder."""
+    v = image_variants(src)
+    url = url or (lambda name: asset_url(IMAGE_KIND, name))
+    fallback = v["jpeg"][min(1, len(v["jpeg"]) - 1)][1]
+    loading = 'fetchpriority="high"' if eager else 'loading="lazy"'
+    return (
+        "<picture>"
+        f'<source type="image/webp" srcset="{srcset(v["webp"], url)}" sizes="{sizes}">'
+        f'<img src="{url(fallback)}" srcset="{srcset(v["jpeg"], url)}" sizes="{sizes}" alt="{escape(alt)}" '
+        f'width="{v["width"]}" height="{v["height"]}" {loading} decoding="async" '
+        f"style=\"background:center/cover url('{v['placeholder']}');\">"
+        "</picture>"
+    )
@@ -0,0 +1,35 @@
+"""Optional in-browser project filtering ("Instant filtering" in the sidebar).
+
+The project catalogue, facets, postings and role orders are serialised once
+per content revision (``search.client_catalog``) and published under their
+content hash. ``frontend/catalog.js`` fetches that file once, then filters,
+orders and highlights locally, so typing in the search box or toggling a
+filter costs no websocket round-trip and no rerun. Python is only involved
+when the role focus or theme changes (new arguments to the same iframe) or a
+case study is opened.
+"""
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
+from search import client_catalog
+from static_assets import asset_url, kind_dir, publish_bytes, publish_component
+
+BUNDLE_SRC = Path(__file__).parent / "frontend" / "catalog.js"
+COMPONENT_KIND = "instant"
+CATALOG_KIND = "catalog"
+
+
+def publish_catalog(index):
+    """File name of the published catalogue JSON for ``index``."""
+    return publish_bytes(CATALOG_KIND, client_catalog(index), ".json")
+
+
+def instant_filter(catalog_name, role, css_url, impact_order=(), key="instant-filter", order=None):
+    """``order`` (project positions) overrides the role's order, e.g. a job-description ranking."""
+    publish_component(COMPONENT_KIND, BUNDLE_SRC, "ResumeCatalog.mountComponent();")
+    component = components.declare_component(COMPONENT_KIND, path=str(kind_dir(COMPONENT_KIND)))
+    component(
+        catalogUrl=asset_url(CATALOG_KIND, catalog_name), role=role, cssUrl=css_url,
+        impactOrder=list(impact_order), order=order, key=key, default=None,
+    )
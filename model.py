@@ -0,0 +1,169 @@
+"""Immutable content model shared by every session in the process.
+
+``build_resume`` turns the validated content (see content.py) into frozen,
+``__slots__`` records once per content revision (profiles.py keeps them per
+profile). Sessions only hold references to them, so a rerun allocates
+nothing for the content itself. Records carry what rendering and filtering
+need precomputed: lowercase search text, skill meter percentages and each
+role's project order.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class Par:
+    kind: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Metric:
+    label: str
+    value: str
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    id: str
+    title: str
+    summary: str
+    par: tuple
+    metrics: tuple
+    stack: tuple
+    industry: tuple
+    year: int
+    impact: str
+    search_text: str
+
+    @classmethod
+    def from_dict(cls, d):
+        tags = d["tags"]
+        par = tuple(Par(e["type"], e["text"]) for e in d.get("par", []))
+        return cls(
+            id=d["id"], title=d["title"], summary=d["summary"], par=par,
+            metrics=tuple(Metric(m["label"], m["value"]) for m in d.get("metrics", [])),
+            stack=tuple(tags.get("stack", [])), industry=tuple(tags.get("industry", [])),
+            year=int(tags["year"]), impact=tags.get("impact", ""),
+            search_text=" ".join([d["title"], d["summary"]] + [e.text for e in par]).lower(),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Role:
+    label: str
+    tldr: tuple
+    deep: tuple
+    featured: frozenset
+    order: tuple  # project ids, featured first then newest first
+
+    def bullets(self, scan):
+        return self.tldr if scan else self.deep
+
+
+@dataclass(frozen=True, slots=True)
+class Experience:
+    company: str
+    title: str
+    where: str
+    start: str
+    end: str
+    items: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Skill:
+    name: str
+    group: str
+    level: int
+    pct: int
+
+
+@dataclass(frozen=True, slots=True)
+class Testimonial:
+    quote: str
+    name: str
+    role: str
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryEntry:
+    date: str
+    changes: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    name: str
+    headline: str
+    badges: tuple
+    about: str
+    photo: str
+    pdf: str
+
+
+@dataclass(frozen=True, slots=True)
+class Contact:
+    email: str
+    calendar: str
+
+
+@dataclass(frozen=True, slots=True)
+class Stats:
+    years: int
+    projects: int
+    impact_pct: int
+
+
+@dataclass(frozen=True, slots=True)
+class Resume:
+    revision: str
+    profile: Profile
+    contact: Contact
+    stats: Stats
+    roles: tuple
+    experience: tuple
+    projects: tuple
+    skills: tuple  # ((group, (Skill, ...)), ...)
+    testimonials: tuple
+    history: tuple
+    roles_by_label: MappingProxyType
+    projects_by_id: MappingProxyType
+
+    def role(self, label):
+        return self.roles_by_label[label]
+
+
+def role_order(projects, featured):
+    ranked = sorted(enumerate(projects), key=lambda ip: (0 if ip[1].id in featured else 1, -ip[1].year, ip[0]))
+    return tuple(p.id for _, p in ranked)
+
+
+def build_resume(revision, data):
+    projects = tuple(Project.from_dict(p) for p in data["projects"])
+    roles = []
+    for r in data["roles"]:
+        featured = frozenset(r["featured"])
+        roles.append(Role(r["label"], tuple(r["tldr"]), tuple(r["deep"]), featured, role_order(projects, featured)))
+    skills = []
+    for group, names in data["skills"].items():
+        levels = [max(1, min(5, data["skill_level"].get(n, 3))) for n in names]
+        skills.append((group, tuple(Skill(n, group, lvl, int(lvl / 5 * 100)) for n, lvl in zip(names, levels))))
+    p = data["profile"]
+    return Resume(
+        revision=revision,
+        profile=Profile(p["name"], p["headline"], tuple(p["badges"]), p["about"], p.get("photo", ""), p.get("pdf", "")),
+        contact=Contact(data["contact"]["email"], data["contact"]["calendar"]),
+        stats=Stats(data["stats"]["years"], data["stats"]["projects"], data["stats"]["impact_pct"]),
+        roles=tuple(roles),
+        experience=tuple(
+            Experience(e["company"], e["title"], e["where"], e["from"], e["to"], tuple(e["items"]))
+            for e in data["experience"]
+        ),
+        projects=projects,
+        skills=tuple(skills),
+        testimonials=tuple(Testimonial(t["quote"], t["name"], t["role"]) for t in data["testimonials"]),
+        history=tuple(HistoryEntry(h["date"], tuple(h["changes"])) for h in data["resume_history"]),
+        roles_by_label=MappingProxyType({r.label: r for r in roles}),
+        projects_by_id=MappingProxyType({p.id: p for p in projects}),
+    )
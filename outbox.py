@@ -0,0 +1,326 @@
+"""Durable contact-form outbox delivered over SMTP by a background worker.
+
+``submit`` validates and throttles a message, stores it in a local SQLite
+queue (``build/outbox/outbox.sqlite3`` or ``RESUME_OUTBOX_DB``) and returns;
+it never talks to the mail server. A single worker thread per process picks up
+due messages in batches, sends each batch over one SMTP connection, and retries
+failures with exponential backoff. Messages survive restarts: anything still
+pending when the process stops is sent by the next one.
+
+SMTP is configured from the environment:
+
+    RESUME_SMTP_HOST, RESUME_SMTP_PORT (25), RESUME_SMTP_USER, RESUME_SMTP_PASSWORD,
+    RESUME_SMTP_STARTTLS (0/1), RESUME_SMTP_FROM, RESUME_SMTP_TO
+
+Each message goes to the contact address of the profile it was sent from
+(see profiles.py); ``RESUME_SMTP_TO`` is the recipient for messages queued
+without one.
+
+Without ``RESUME_SMTP_HOST`` messages are queued but not sent. To try it
+locally, run ``python bench/smtp_sink.py`` and point the host/port at it.
+``python outbox.py`` prints the queue status.
+"""
+import argparse
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from static_assets import BUILD_DIR
+
+DB_PATH = Path(os.environ.get("RESUME_OUTBOX_DB", BUILD_DIR / "outbox" / "outbox.sqlite3"))
+BATCH_SIZE = 20
+SEND_RATE = 30  # messages per minute to the SMTP server
+MAX_ATTEMPTS = 6
+RETRY_BASE = 30  # seconds; doubles per failed attempt
+POLL_INTERVAL = 30
+# Spam and duplicate throttling, enforced before anything is queued.
+SESSION_LIMIT = (3, 600)  # at most 3 messages per session per 10 minutes
+SENDER_LIMIT = (5, 3600)  # at most 5 per sender address per hour
+DUPLICATE_WINDOW = 86400
+MAX_LINKS = 3
+MAX_LENGTH = 5000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    session TEXT NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    body TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    recipient TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS messages_due ON messages (status, next_attempt);
+CREATE INDEX IF NOT EXISTS messages_fingerprint ON messages (fingerprint, created);
+"""
+
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_LINK = re.compile(r"https?://|www\.", re.I)
+# CR/LF would end the Subject header the name goes into; other control characters have no business there.
+_CONTROL = re.compile(r"[\x00-\x1f\x7f]+")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _connect(path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path, timeout=5)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    if "recipient" not in {row[1] for row in db.execute("PRAGMA table_info(messages)")}:
+        db.execute("ALTER TABLE messages ADD COLUMN recipient TEXT")
+    return db
+
+
+def smtp_config():
+    host = os.environ.get("RESUME_SMTP_HOST")
+    if not host:
+        return None
+    return {
+        "host": host,
+        "port": int(os.environ.get("RESUME_SMTP_PORT", "25")),
+        "user": os.environ.get("RESUME_SMTP_USER"),
+        "password": os.environ.get("RESUME_SMTP_PASSWORD"),
+        "starttls": os.environ.get("RESUME_SMTP_STARTTLS") == "1",
+        "sender": os.environ.get("RESUME_SMTP_FROM", "resume-site@localhost"),
+        "to": os.environ.get("RESUME_SMTP_TO"),
+    }
+
+
+class Throttle:
+    """Sliding-window counters per key; checks never wait on other sessions."""
+
+    def __init__(self):
+        self._hits = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key, limit, window, now):
+        with self._lock:
+            hits = [t for t in self._hits.get(key, ()) if now - t < window]
+            if len(hits) >= limit:
+                self._hits[key] = hits
+                return False
+            hits.append(now)
+            self._hits[key] = hits
+            if len(self._hits) > 10_000:
+                # Forget keys whose windows have all expired.
+                self._hits = {k: v for k, v in self._hits.items() if v and now - v[-1] < window}
+            return True
+
+
+class Outbox:
+    def __init__(self, path=DB_PATH, smtp=None, to=None):
+        self.path = Path(path)
+        self.smtp = smtp
+        self.to = to
+        self.throttle = Throttle()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._local = threading.local()
+        self.stats = {"sent": 0, "retried": 0, "failed": 0, "batches": 0}
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = self._local.db = _connect(self.path)
+        return db
+
+    @staticmethod
+    def fingerprint(email, body, recipient=None):
+        norm = " ".join(body.lower().split())
+        return hashlib.sha256(f"{email.strip().lower()}\n{recipient or ''}\n{norm}".encode("utf-8")).hexdigest()[:32]
+
+    def submit(self, name, email, body, session="", recipient=None):
+        """Queue one message for ``recipient`` (default: the outbox's ``to``).
+
+        Returns "queued", "invalid", "spam", "duplicate" or "throttled".
+        """
+        name, email, body = _CONTROL.sub(" ", name).strip(), email.strip(), body.strip()
+        if not _EMAIL.match(email) or not body or len(body) > MAX_LENGTH:
+            return "invalid"
+        if len(_LINK.findall(body)) > MAX_LINKS:
+            return "spam"
+        now = time.time()
+        fp = self.fingerprint(email, body, recipient)
+        db = self._db()
+        if db.execute("SELECT 1 FROM messages WHERE fingerprint = ? AND created > ?",
+                      (fp, now - DUPLICATE_WINDOW)).fetchone():
+            return "duplicate"
+        if not (self.throttle.allow(("session", session), *SESSION_LIMIT, now)
+                and self.throttle.allow(("sender", email.lower()), *SENDER_LIMIT, now)):
+            return "throttled"
+        with db:
+            db.execute(
+                "INSERT INTO messages (created, session, name, email, body, fingerprint, recipient, next_attempt) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (now, session, name, email, body, fp, recipient, now),
+            )
+        self._wake.set()
+        return "queued"
+
+    # -- delivery ---------------------------------------------------------
+
+    def start(self):
+        if self.smtp and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="outbox-worker", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _compose(self, row):
+        # Imported here: the mail modules are only needed by the delivery worker.
+        from email.message import EmailMessage
+        from email.utils import formatdate, make_msgid
+
+        _, _, name, email, body, recipient = row
+        msg = EmailMessage()
+        msg["From"] = self.smtp["sender"]
+        msg["To"] = recipient or self.to
+        msg["Reply-To"] = email
+        msg["Subject"] = f"Hello from {name or 'a visitor'} — Resume Site"
+        msg["Date"] = formatdate(localtime=True)
+        msg["Message-ID"] = make_msgid()
+        msg.set_content(f"From: {name}\nEmail: {email}\n\n{body}")
+        return msg
+
+    def _due(self, now):
+        return self._db().execute(
+            "SELECT id, attempts, name, email, body, recipient FROM messages "
+            "WHERE status = 'pending' AND next_attempt <= ? ORDER BY next_attempt LIMIT ?",
+            (now, BATCH_SIZE),
+        ).fetchall()
+
+    def _mark(self, row, error, permanent=False):
+        """Record a delivery attempt; ``permanent`` errors fail the message without retries."""
+        msg_id, attempts = row[0], row[1] + 1
+        db = self._db()
+        with db:
+            if error is None:
+                db.execute("UPDATE messages SET status = 'sent', attempts = ?, last_error = NULL WHERE id = ?",
+                           (attempts, msg_id))
+                self.stats["sent"] += 1
+            elif permanent or attempts >= MAX_ATTEMPTS:
+                db.execute("UPDATE messages SET status = 'failed', attempts = ?, last_error = ? WHERE id = ?",
+                           (attempts, error, msg_id))
+                self.stats["failed"] += 1
+            else:
+                retry_at = time.time() + RETRY_BASE * 2 ** (attempts - 1)
+                db.execute("UPDATE messages SET attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                           (attempts, retry_at, error, msg_id))
+                self.stats["retried"] += 1
+
+    def deliver_batch(self):
+        """Send the messages that are due over one connection; returns how many were tried."""
+        rows = self._due(time.time())
+        if not rows:
+            return 0
+        import smtplib
+
+        cfg, interval = self.smtp, 60 / SEND_RATE
+        try:
+            with smtplib.SMTP(cfg["host"], cfg["port"], timeout=30) as smtp:
+                if cfg["starttls"]:
+                    smtp.starttls()
+                if cfg["user"]:
+                    smtp.login(cfg["user"], cfg["password"] or "")
+                last = None
+                for i, row in enumerate(rows):
+                    if last is not None:
+                        # Rate limit: space messages out to SEND_RATE per minute.
+                        self._stop.wait(max(0, interval - (time.monotonic() - last)))
+                    if self._stop.is_set():
+                        return i
+                    last = time.monotonic()
+                    try:
+                        msg = self._compose(row)
+                    except (ValueError, TypeError) as exc:
+                        # A header the email package refuses (e.g. a line break in a stored name or recipient):
+                        # retrying cannot help, and leaving it pending would block the queue.
+                        self._mark(row, f"{type(exc).__name__}: {exc}", permanent=True)
+                        continue
+                    try:
+                        smtp.send_message(msg)
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError, smtplib.SMTPSenderRefused) as exc:
+                        self._mark(row, f"{type(exc).__name__}: {exc}")
+                    else:
+                        self._mark(row, None)
+        except (OSError, smtplib.SMTPException) as exc:
+            # Connection-level failure: every message still pending in this batch is retried later.
+            for row in rows:
+                status = self._db().execute("SELECT status, attempts FROM messages WHERE id = ?", (row[0],)).fetchone()
+                if status == ("pending", row[1]):
+                    self._mark(row, f"{type(exc).__name__}: {exc}")
+        self.stats["batches"] += 1
+        return len(rows)
+
+    def _next_due(self):
+        row = self._db().execute("SELECT MIN(next_attempt) FROM messages WHERE status = 'pending'").fetchone()
+        return row[0]
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.deliver_batch():
+                    continue
+                due = self._next_due()
+                wait = POLL_INTERVAL if due is None else min(POLL_INTERVAL, max(0, due - time.time()))
+            except Exception:
+                # One bad row or a database hiccup must not stop delivery for the rest of the process.
+                _LOGGER.exception("Outbox delivery failed; retrying in %s s", POLL_INTERVAL)
+                wait = POLL_INTERVAL
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def status(self):
+        rows = self._db().execute("SELECT status, COUNT(*) FROM messages GROUP BY status").fetchall()
+        return dict(rows)
+
+
+_OUTBOX = None
+_OUTBOX_LOCK = threading.Lock()
+
+
+def get_outbox(default_to=None):
+    """The process-wide outbox; its worker starts on first use if SMTP is configured."""
+    global _OUTBOX
+    if _OUTBOX is None:
+        with _OUTBOX_LOCK:
+            if _OUTBOX is None:
+                cfg = smtp_config()
+                to = (cfg and cfg["to"]) or default_to
+                _OUTBOX = Outbox(DB_PATH, cfg, to).start()
+    return _OUTBOX
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact-form outbox status.")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    parser.add_argument("--deliver", action="store_true", help="send what is due once, using RESUME_SMTP_*")
+    args = parser.parse_args()
+    cfg = smtp_config()
+    box = Outbox(args.db, cfg, cfg and cfg["to"])
+    if args.deliver:
+        if not cfg:
+            parser.exit(1, "set RESUME_SMTP_HOST to deliver\n")
+        print(f"tried {box.deliver_batch()} messages: {box.stats}")
+    print(box.status() or "outbox is empty")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""The app's single front-end component: navigation, shortcuts and carousel.
+
+The behaviour lives in ``frontend/page.js``, published under its content hash
+with an ``index.html`` shell in ``build/page`` (see ``publish_component``) and
+declared as a Streamlit component. The component is rendered with a fixed key,
+so reruns send it new arguments instead of creating a new iframe. Its hidden
+iframe is same-origin and drives the parent document. It reports the section
+the visitor is reading back to Python, and the case studies opened from a
+card: those leave the app page, so page.js keeps them queued (and resends
+them after the next load) until ``case_ack`` says they were counted.
+"""
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
+from static_assets import kind_dir, publish_component
+
+FRONTEND_DIR = Path(__file__).parent / "frontend"
+BUNDLE_SRC = FRONTEND_DIR / "page.js"
+COMPONENT_KIND = "page"
+
+
+def bundle_name():
+    """File name of the published bundle in ``build/page``; rebuilt when page.js changes."""
+    return publish_component(COMPONENT_KIND, BUNDLE_SRC, "ResumePage.mountComponent();")
+
+
+def component():
+    """Publish the bundle and (re)register the component."""
+    bundle_name()
+    # Registering is a dict insert; doing it per call keeps it valid across runtimes.
+    return components.declare_component(COMPONENT_KIND, path=str(kind_dir(COMPONENT_KIND)))
+
+
+def page_controller(reduce_motion=False, search_label="Search", case_ack=0, key="page-controller"):
+    """Render the component; returns the last ``{"section", "slide", "cases"}`` it reported, or None.
+
+    ``case_ack`` is the ``at`` of the last case open already counted.
+    """
+    return component()(reduceMotion=reduce_motion, searchLabel=search_label, caseAck=case_ack,
+                       key=key, default=None)
+
+
+def case_opens(state, ack=0):
+    """Case opens in a reported ``state`` not yet counted: sorted ``(at, project id)`` after ``ack``."""
+    opens = []
+    for item in (state or {}).get("cases") or ():
+        try:
+            at, case_id = float(item["at"]), str(item["case"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if at > ack and case_id:
+            opens.append((at, case_id))
+    return sorted(opens)
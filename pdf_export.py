@@ -0,0 +1,101 @@
+"""Server-side PDF export of one resume variant (role focus × Scan/Deep).
+
+PDFs are generated locally with fpdf2 (no external rendering service) from the
+same ``model.Resume`` records as the page, and cached on disk under ``build/variants``
+with a file name derived from the content revision and the variant. A repeated
+download is a file-existence check; a content edit produces a new revision and
+therefore a new file.
+"""
+import hashlib
+
+from static_assets import atomic_write, kind_dir
+
+VARIANT_KIND = "variants"
+# Bump when the layout below changes so cached files are regenerated.
+LAYOUT_VERSION = "1"
+
+# The built-in PDF fonts only cover Latin-1.
+_LATIN1 = str.maketrans({
+    "→": "->", "–": "-", "—": "-", "“": '"', "”": '"', "‘": "'", "’": "'",
+    "•": "-", "×": "x", "…": "...", "≈": "~",
+})
+
+
+def _text(value):
+    return str(value).translate(_LATIN1).encode("latin-1", "replace").decode("latin-1")
+
+
+def variant_key(revision, role, scan):
+    raw = "|".join([LAYOUT_VERSION, revision, role, "scan" if scan else "deep"])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def render_pdf(resume, role, scan):
+    """Build the PDF for one variant of ``resume`` (a model.Resume) and return its bytes."""
+    from fpdf import FPDF  # imported lazily; only needed when a PDF is generated
+    from fpdf.enums import XPos, YPos
+
+    profile, contact = resume.profile, resume.contact
+    role_rec = resume.role(role)
+
+    pdf = FPDF(format="Letter")
+    pdf.set_margins(18, 16, 18)
+    pdf.set_auto_page_break(True, margin=16)
+    pdf.set_title(_text(f"{profile.name} — {role}"))
+    pdf.set_author(_text(profile.name))
+    pdf.add_page()
+
+    def line(text, size=10, style="", h=5):
+        pdf.set_font("Helvetica", style, size)
+        pdf.multi_cell(0, h, _text(text), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+    def heading(text):
+        pdf.ln(3)
+        line(text.upper(), size=11, style="B", h=6)
+        y = pdf.get_y()
+        pdf.line(pdf.l_margin, y, pdf.w - pdf.r_margin, y)
+        pdf.ln(1.5)
+
+    def bullet(text):
+        line(f"- {text}")
+
+    line(profile.name, size=20, style="B", h=9)
+    line(profile.headline)
+    line(f"{contact.email}  |  {contact.calendar}", size=9)
+
+    heading(f"Highlights ({role})")
+    for b in role_rec.bullets(scan):
+        bullet(b)
+
+    heading("Experience")
+    for e in resume.experience:
+        line(f"{e.title} - {e.company}", style="B")
+        line(f"{e.start} - {e.end}  |  {e.where}", size=9)
+        for item in e.items[: 2 if scan else None]:
+            bullet(item)
+        pdf.ln(1)
+
+    heading("Projects")
+    for p in (resume.projects_by_id[pid] for pid in role_rec.order):
+        line(p.title, style="B")
+        line(p.summary)
+        if not scan:
+            for entry in p.par:
+                bullet(f"{entry.kind}: {entry.text}")
+        line("  ".join(f"{m.label}: {m.value}" for m in p.metrics), size=9)
+        pdf.ln(1)
+
+    heading("Skills")
+    for group, items in resume.skills:
+        line(f"{group}: {', '.join(s.name for s in items)}")
+
+    return bytes(pdf.output())
+
+
+def variant_pdf(resume, role, scan):
+    """File name of the cached PDF for this variant, generating it on first use."""
+    name = f"{variant_key(resume.revision, role, scan)}.pdf"
+    path = kind_dir(VARIANT_KIND) / name
+    if not path.exists():
+        atomic_write(path, render_pdf(resume, role, scan))
+    return name
@@ -0,0 +1,248 @@
+"""Pre-render every resume variant to static HTML.
+
+Renders each theme × role focus × Scan/Deep combination, plus one case-study
+page per project, from the same content file and templates as app.py:
+
+    python prerender.py [--out build/site] [--profile <slug>]
+
+``--profile`` renders a hosted profile (see profiles.py) into
+``build/sites/<slug>`` instead of the default one.
+
+The JSON Resume, text and Markdown exports (see exports.py) go in
+``exports/``, listed by ``exports/index.json``. Every page carries
+OpenGraph tags for link previews; set ``RESUME_PUBLIC_URL`` to the site's
+public origin to make their URLs absolute. The web font subsets (see
+fonts.py) are copied to ``assets/`` with the other hashed files.
+
+The output directory can be served by any static file server or CDN. Only the
+live Streamlit app is needed for filtering, search and the contact form.
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+from html import escape
+from pathlib import Path
+
+from exports import EXPORT_KIND, FORMATS, manifest_name, publish_exports
+from fonts import FONT_KIND, font_tags, publish_fonts
+from images import IMAGE_KIND, image_variants, picture_html
+from page_controller import COMPONENT_KIND, bundle_name
+from profiles import get_profile
+from render import (
+    case_study_html, experience_html, floating_cta_html, hero_html, highlights_html, history_html,
+    navbar_html, og_meta_html, page_html, page_script_html, project_card_html, safe_url, skills_html,
+    testimonials_html,
+)
+from static_assets import BUILD_DIR, content_hash, kind_dir
+from theme import THEMES, compile_bundle
+
+SITE_DIR = BUILD_DIR / "site"
+# Public origin of the static site, for absolute OpenGraph URLs; relative when unset.
+BASE_URL = os.environ.get("RESUME_PUBLIC_URL", "").rstrip("/")
+MODES = (("scan", "Scan", True), ("deep", "Deep", False))
+
+
+def slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def variant_path(theme, role, mode, case_id=None):
+    base = f"{slug(theme)}/{slug(role)}/{mode}"
+    return f"{base}/case/{case_id}.html" if case_id else f"{base}/index.html"
+
+
+def _variant_bar(root, theme, role, mode, roles):
+    def link(label, path, current):
+        attr = ' aria-current="page"' if current else ""
+        return f'<a class="nav-btn" href="{escape(root + path)}"{attr}>{escape(label)}</a>'
+
+    groups = [
+        [link(t, variant_path(t, role, mode), t == theme) for t in THEMES],
+        [link(r, variant_path(theme, r, mode), r == role) for r in roles],
+        [link(label, variant_path(theme, role, m), m == mode) for m, label, _ in MODES],
+    ]
+    return (
+        '<div class="section" aria-label="Variants"><div class="nav-grid">'
+        + "".join(f'<div class="nav-links">{"".join(g)}</div>' for g in groups)
+        + "</div></div>"
+    )
+
+
+def _projects_html(root, resume, theme, role, mode, case, pdf_href):
+    if case is not None:
+        back = f"{root}{variant_path(theme, role, mode)}#projects"
+        main = case_study_html(case) + f"<div style='margin-top:12px;'><a class='badge' href='{back}'>← Back to all projects</a></div>"
+    else:
+        main = "".join(
+            project_card_html(resume.projects_by_id[pid], f"{root}{variant_path(theme, role, mode, pid)}", prefetch=True)
+            for pid in resume.role(role).order
+        )
+    label = dict((m, lbl) for m, lbl, _ in MODES)[mode]
+    export = f"<p>Current variant: <strong>{escape(role)} — {label}</strong></p>"
+    if pdf_href:
+        export += f'<a class="badge" href="{pdf_href}" download="{escape(Path(resume.profile.pdf).name)}">⬇ Download canonical PDF</a>'
+    return (
+        '<section class="section" id="projects" aria-label="Projects section"><div class="grid">'
+        f'<div class="col-8"><div class="card"><div class="section-title">Projects</div>{main}</div></div>'
+        f'<div class="col-4"><div class="card"><div class="section-title">Resume & Export</div>{export}</div></div>'
+        "</div></section>"
+    )
+
+
+def _contact_html(contact):
+    return (
+        '<section class="section" id="contact" aria-label="Contact section">'
+        '<div class="card"><div class="section-title">Contact</div>'
+        f"<p>Email <a href=\"mailto:{escape(contact.email)}\">{escape(contact.email)}</a> "
+        f"or <a href=\"{safe_url(contact.calendar)}\" target=\"_blank\">book a time</a>.</p>"
+        "</div></section>"
+    )
+
+
+def _copy_images(path, out):
+    if path is None:
+        return
+    v = image_variants(path)
+    (out / "assets").mkdir(parents=True, exist_ok=True)
+    for _, name in v["jpeg"] + v["webp"]:
+        if not (out / "assets" / name).exists():
+            shutil.copyfile(kind_dir(IMAGE_KIND) / name, out / "assets" / name)
+
+
+def render_page(resume, theme, role, mode, case=None, css="", pdf="", script="", depth=3,
+                photo_path=None, history=(), url="", og_image="", fonts=()):
+    root = "../" * (depth + (1 if case is not None else 0))
+    photo = ""
+    if photo_path is not None:
+        photo = picture_html(photo_path, resume.profile.name, eager=True,
+                             url=lambda name: f"{root}assets/{name}")
+    scan = dict((m, s) for m, _, s in MODES)[mode]
+    body = "".join([
+        _variant_bar(root, theme, role, mode, [r.label for r in resume.roles]),
+        navbar_html(resume.profile.name),
+        '<div id="top"></div>',
+        hero_html(resume.profile, resume.stats, resume.contact, photo),
+        highlights_html(resume.role(role).bullets(scan)),
+        experience_html(resume.experience),
+        _projects_html(root, resume, theme, role, mode, case, f"{root}{pdf}" if pdf else ""),
+        skills_html(resume.skills),
+        testimonials_html(resume.testimonials),
+        history_html(history),
+        _contact_html(resume.contact),
+        floating_cta_html(resume.contact),
+        page_script_html(f"{root}{script}") if script else "",
+    ])
+    name = resume.profile.name
+    title = f"Killer Resume — {name} ({role}, {mode})"
+    description = f"{resume.profile.headline}. " + " ".join(resume.role(role).tldr)
+    if case is not None:
+        title = f"{case.title} — {name}"
+        description = case.summary
+    image = og_image and (og_image if BASE_URL else f"{root}{og_image}")
+    head = og_meta_html(title, description, url, image, "article" if case is not None else "profile")
+    head += font_tags(fonts, lambda name: f"{root}assets/{name}", preload=case is None)
+    return page_html(title, f"{root}{css}", body, head)
+
+
+def _write_if_changed(path, text):
+    data = text.encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def _copy_exports(resume, slug, out):
+    # The same files the app serves, next to the pages; exports/index.json lists them.
+    manifest = publish_exports(resume, slug)
+    (out / "exports").mkdir(parents=True, exist_ok=True)
+    for entry in manifest["variants"]:
+        for fmt in FORMATS:
+            if not (out / "exports" / entry[fmt]).exists():
+                shutil.copyfile(kind_dir(EXPORT_KIND) / entry[fmt], out / "exports" / entry[fmt])
+    _write_if_changed(out / "exports" / "index.json",
+                      (kind_dir(EXPORT_KIND) / manifest_name(slug)).read_text(encoding="utf-8"))
+
+
+def _copy_fonts(fonts, out):
+    for f in fonts:
+        if not (out / "assets" / f.name).exists():
+            (out / "assets").mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(kind_dir(FONT_KIND) / f.name, out / "assets" / f.name)
+
+
+def build(out=SITE_DIR, profile=""):
+    """Render all variants into ``out``; returns ``(manifest, number of files changed)``.
+
+    It prints nothing: the side-car calls it at runtime whenever the content changes.
+    """
+    out = Path(out)
+    site = get_profile(profile)
+    if site is None:
+        raise SystemExit(f"no profile {profile!r}")
+    resume = site.resume()
+    roles = [r.label for r in resume.roles]
+    extra = {"photo_path": site.path(resume.profile.photo), "history": site.history(),
+             "fonts": publish_fonts(resume)}
+
+    pdf = ""
+    pdf_path = site.path(resume.profile.pdf)
+    if pdf_path:
+        pdf = f"assets/resume-{content_hash(pdf_path.read_bytes())}.pdf"
+        if not (out / pdf).exists():
+            (out / "assets").mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(pdf_path, out / pdf)
+
+    _copy_images(extra["photo_path"], out)
+    _copy_fonts(extra["fonts"], out)
+    if extra["photo_path"] is not None:
+        og_image = f"assets/{max(image_variants(extra['photo_path'])['jpeg'])[1]}"
+        extra["og_image"] = f"{BASE_URL}/{og_image}" if BASE_URL else og_image
+    _copy_exports(resume, site.slug, out)
+    script = f"assets/{bundle_name()}"
+    if not (out / script).exists():
+        (out / "assets").mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(kind_dir(COMPONENT_KIND) / bundle_name(), out / script)
+
+    manifest = {"revision": resume.revision, "pages": {}}
+    written = 0
+    for theme in THEMES:
+        digest, css = compile_bundle(theme)
+        css_path = f"assets/{digest}.css"
+        written += _write_if_changed(out / css_path, css)
+        for role in roles:
+            for mode, _, _ in MODES:
+                cases = [None] + list(resume.projects)
+                for case in cases:
+                    path = variant_path(theme, role, mode, case and case.id)
+                    url = f"{BASE_URL}/{path}" if BASE_URL else ""
+                    html = render_page(resume, theme, role, mode, case, css_path, pdf, script, url=url, **extra)
+                    written += _write_if_changed(out / path, html)
+                    key = "|".join([theme, role, mode, case.id if case else ""])
+                    manifest["pages"][key] = path
+
+    # The default variant again at the site root, with root-relative links.
+    home = render_page(resume, THEMES[0], roles[0], MODES[0][0], None,
+                       f"assets/{compile_bundle(THEMES[0])[0]}.css", pdf, script, depth=0,
+                       url=f"{BASE_URL}/" if BASE_URL else "", **extra)
+    written += _write_if_changed(out / "index.html", home)
+    manifest["pages"]["default"] = "index.html"
+    _write_if_changed(out / "manifest.json", json.dumps(manifest, indent=2, ensure_ascii=False))
+    return manifest, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, help="output directory (default: build/site or build/sites/<slug>)")
+    parser.add_argument("--profile", default="", help="hosted profile to render (default: content/profile.json)")
+    args = parser.parse_args()
+    out = args.out or (BUILD_DIR / "sites" / args.profile if args.profile else SITE_DIR)
+    manifest, written = build(out, args.profile)
+    print(f"Rendered {len(manifest['pages'])} pages into {out} ({written} files changed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Many resumes from one server process, selected by URL.
+
+``?p=<slug>`` serves the profile in ``content/profiles/<slug>/``
+(``RESUME_PROFILES_DIR``). The directory holds ``profile.json`` and the files
+it references, such as the photo and the PDF. Paths in the content are
+relative to that directory, and its ``snapshots`` subdirectory holds the
+change history (see snapshots.py). Without ``?p`` the app serves the default
+profile: ``content/profile.json``, with paths relative to the repository.
+
+A profile is loaded on its first request. Its content store, current
+``Resume`` and per-revision derived objects (project index, instant-filter
+catalogue) stay in a bounded LRU of ``RESUME_MAX_PROFILES`` entries. A
+profile is dropped once it has had no request for ``RESUME_PROFILE_IDLE``
+seconds; idle profiles are swept on each lookup. Everything else built from
+a profile is keyed by content revision and bounded on its own: rendered
+fragments, case pages, PDFs and search results.
+"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from content import CONTENT_PATH, ContentStore
+from model import build_resume
+from snapshots import SNAPSHOT_DIR, SnapshotStore
+
+ROOT = Path(__file__).parent
+PROFILES_DIR = Path(os.environ.get("RESUME_PROFILES_DIR", CONTENT_PATH.parent / "profiles"))
+MAX_PROFILES = int(os.environ.get("RESUME_MAX_PROFILES", "64"))
+IDLE_SECONDS = float(os.environ.get("RESUME_PROFILE_IDLE", "1800"))
+SLUG = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+
+class HostedProfile:
+    """One profile's content, model and derived objects."""
+
+    def __init__(self, slug, root, content_path, snapshot_dir):
+        self.slug = slug
+        self.root = Path(root).resolve()
+        self.store = ContentStore(content_path)
+        self.snapshots = SnapshotStore(snapshot_dir)
+        self.last_used = time.monotonic()
+        self._resume = None
+        self._prepared = {}
+
+    def resume(self):
+        """The ``Resume`` for the current revision; rebuilt (and snapshotted) when the content changes."""
+        revision, data = self.store.load()
+        resume = self._resume
+        if resume is None or resume.revision != revision:
+            resume = build_resume(revision, data)
+            self.snapshots.record(revision, data)
+            self._resume, self._prepared = resume, {}
+        return resume
+
+    def prepared(self, name, build):
+        """``build(resume)`` once per revision, dropped with the profile."""
+        resume = self.resume()
+        key = (resume.revision, name)
+        value = self._prepared.get(key)
+        if value is None:
+            value = self._prepared[key] = build(resume)
+        return value
+
+    def history(self):
+        resume = self.resume()
+        return self.snapshots.history(resume.revision) + resume.history[::-1]
+
+    def path(self, relative):
+        """An existing file referenced by the content, or None (never outside the profile's root)."""
+        if not relative:
+            return None
+        path = (self.root / relative).resolve()
+        if not path.is_relative_to(self.root) or not path.is_file():
+            return None
+        return path
+
+
+class ProfileRegistry:
+    def __init__(self, directory=PROFILES_DIR, max_profiles=MAX_PROFILES, idle=IDLE_SECONDS):
+        self.dir = Path(directory)
+        self.max_profiles = max_profiles
+        self.idle = idle
+        self.default = HostedProfile("", ROOT, CONTENT_PATH, SNAPSHOT_DIR)
+        self.evictions = 0
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _sweep(self, now):
+        while self._profiles:
+            slug, profile = next(iter(self._profiles.items()))
+            if now - profile.last_used < self.idle and len(self._profiles) <= self.max_profiles:
+                break
+            del self._profiles[slug]
+            self.evictions += 1
+
+    def get(self, slug=""):
+        """The profile for ``slug`` ("" for the default), or None if there is no such profile."""
+        now = time.monotonic()
+        # Swept on every lookup, so idle profiles go even when only the default is requested.
+        with self._lock:
+            self._sweep(now)
+        if not slug:
+            self.default.last_used = now
+            return self.default
+        if not SLUG.match(slug):
+            return None
+        with self._lock:
+            profile = self._profiles.get(slug)
+            if profile is not None:
+                self._profiles.move_to_end(slug)
+                profile.last_used = now
+                return profile
+        root = self.dir / slug
+        if not (root / "profile.json").is_file():
+            return None
+        profile = HostedProfile(slug, root, root / "profile.json", root / "snapshots")
+        with self._lock:
+            profile = self._profiles.setdefault(slug, profile)
+            self._profiles.move_to_end(slug)
+            self._sweep(now)
+        return profile
+
+    def stats(self):
+        with self._lock:
+            return {"loaded": len(self._profiles), "max_profiles": self.max_profiles, "evictions": self.evictions}
+
+
+REGISTRY = ProfileRegistry()
+
+
+def get_profile(slug=""):
+    return REGISTRY.get(slug)
@@ -0,0 +1,233 @@
+"""Opt-in per-section render timing and rerun instrumentation.
+
+Enable with ``?profile=1`` in the page URL (sticky for the session) or with
+``RESUME_PROFILE=1`` in the server environment. Each rerun then records:
+
+- wall time per section and for the whole run,
+- which keyed widget(s) changed since the previous run (the trigger),
+- bytes and element deltas sent to the browser, per section and in total,
+  both as produced and on the wire (``wire_bytes``), where Streamlit replaces
+  blocks the browser already has with a hash reference (``cached``),
+- whether it was a full run or a fragment rerun,
+- HTML fragment cache hits and misses (see fragments.py), per section and in total.
+
+Records are kept per session for the debug panel and appended to a JSON lines
+log (``build/profile/reruns.jsonl`` or ``RESUME_PROFILE_LOG``). When disabled,
+``section`` is a no-op context manager.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+
+import streamlit as st
+from streamlit import config
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import startup
+from fragments import FRAGMENTS
+from static_assets import BUILD_DIR
+
+LOG_PATH = Path(os.environ.get("RESUME_PROFILE_LOG", BUILD_DIR / "profile" / "reruns.jsonl"))
+HISTORY = 50
+_STATE_KEY = "_profiler"
+_LOG_LOCK = threading.Lock()
+_TOTALS = {"reruns": 0}
+
+
+def enabled():
+    state = st.session_state.get(_STATE_KEY)
+    if state is not None:
+        return True
+    if os.environ.get("RESUME_PROFILE") == "1" or st.query_params.get("profile") in ("1", "true"):
+        st.session_state[_STATE_KEY] = {"count": 0, "history": [], "snapshot": {}, "run": None}
+        return True
+    return False
+
+
+def _wire_size(msg, size, counters):
+    # Mirrors Runtime._send_message: a message of at least global.minCachedMessageSize
+    # bytes that this session was sent within global.maxCachedMessageAge finished runs
+    # goes out as a reference (its hash plus metadata).
+    if size < config.get_option("global.minCachedMessageSize"):
+        return size
+    body = ForwardMsg()
+    body.CopyFrom(msg)
+    body.ClearField("metadata")
+    digest = hashlib.md5(body.SerializeToString(), usedforsecurity=False).hexdigest()
+    wire = counters["_wire"]
+    seen, run = wire["seen"], wire["runs"]
+    fresh = run - seen.get(digest, -1 << 30) <= config.get_option("global.maxCachedMessageAge")
+    seen[digest] = run
+    if not fresh:
+        return size
+    counters["cached"] += 1
+    ref = ForwardMsg(ref_hash=digest)
+    ref.metadata.CopyFrom(msg.metadata)
+    return ref.ByteSize()
+
+
+def _counters(ctx):
+    """Wrap the session's enqueue once so every ForwardMsg is counted."""
+    counters = getattr(ctx, "_profiler_counters", None)
+    if counters is None:
+        # Each run gets a new context; what the browser holds is per session.
+        wire = st.session_state[_STATE_KEY].setdefault("wire", {"seen": {}, "runs": 0})
+        counters = ctx._profiler_counters = {"bytes": 0, "wire_bytes": 0, "elements": 0, "cached": 0,
+                                             "_wire": wire}
+        enqueue = ctx._enqueue
+
+        def counting_enqueue(msg):
+            size = msg.ByteSize()
+            counters["bytes"] += size
+            if msg.HasField("delta"):
+                counters["elements"] += 1
+                counters["wire_bytes"] += _wire_size(msg, size, counters)
+            else:
+                counters["wire_bytes"] += size
+            enqueue(msg)
+
+        ctx._enqueue = counting_enqueue
+    return counters
+
+
+def _widget_snapshot():
+    return {k: repr(v) for k, v in st.session_state.items() if isinstance(k, str) and not k.startswith("_")}
+
+
+def begin_run(kind="full"):
+    if not enabled():
+        return
+    state = st.session_state[_STATE_KEY]
+    snapshot = _widget_snapshot()
+    trigger = sorted(k for k in snapshot.keys() | state["snapshot"].keys()
+                     if snapshot.get(k) != state["snapshot"].get(k))
+    state["count"] += 1
+    with _LOG_LOCK:
+        _TOTALS["reruns"] += 1
+    ctx = get_script_run_ctx()
+    counters = _counters(ctx)
+    state["run"] = {
+        "ts": round(time.time(), 3),
+        "session": ctx.session_id,
+        "rerun": state["count"],
+        "kind": kind,
+        "trigger": trigger if state["count"] > 1 else ["initial load"],
+        "sections": {},
+        "_t0": time.perf_counter(),
+        "_c0": {k: v for k, v in counters.items() if not k.startswith("_")},
+        "_f0": FRAGMENTS.thread_counts(),
+    }
+
+
+def end_run():
+    state = st.session_state.get(_STATE_KEY)
+    run = state and state["run"]
+    if not run:
+        return
+    counters = _counters(get_script_run_ctx())
+    run["total_ms"] = round((time.perf_counter() - run.pop("_t0")) * 1000, 3)
+    c0 = run.pop("_c0")
+    for key in ("bytes", "wire_bytes", "elements", "cached"):
+        run[key] = counters[key] - c0[key]
+    hits, misses = FRAGMENTS.thread_counts()
+    h0, m0 = run.pop("_f0")
+    run["fragment_hits"], run["fragment_misses"] = hits - h0, misses - m0
+    state["run"] = None
+    if run["kind"] == "full":
+        wire = counters["_wire"]
+        wire["runs"] += 1  # Streamlit's script_run_count, which ages cached messages
+        max_age = config.get_option("global.maxCachedMessageAge")
+        wire["seen"] = {h: r for h, r in wire["seen"].items() if wire["runs"] - r <= max_age}
+    # Compared against at the start of the next run to find the triggering widget(s).
+    state["snapshot"] = _widget_snapshot()
+    state["history"] = (state["history"] + [run])[-HISTORY:]
+    line = json.dumps(run, ensure_ascii=False)
+    with _LOG_LOCK:
+        LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+@contextmanager
+def _timed(name):
+    run = st.session_state[_STATE_KEY]["run"]
+    counters = _counters(get_script_run_ctx())
+    c0, t0 = {k: counters[k] for k in ("bytes", "wire_bytes", "elements", "cached")}, time.perf_counter()
+    h0, m0 = FRAGMENTS.thread_counts()
+    try:
+        yield
+    finally:
+        if run is not None:
+            hits, misses = FRAGMENTS.thread_counts()
+            run["sections"][name] = {
+                "ms": round((time.perf_counter() - t0) * 1000, 3),
+                **{k: counters[k] - v for k, v in c0.items()},
+                "fragment_hits": hits - h0,
+                "fragment_misses": misses - m0,
+            }
+
+
+def section(name):
+    """Time a block of the script as section ``name`` (no-op unless profiling)."""
+    return _timed(name) if enabled() else nullcontext()
+
+
+def profiled(name):
+    """Decorator for fragment functions: times the section, and records a fragment
+    rerun as its own run when Streamlit reruns only this fragment."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not enabled():
+                return fn(*args, **kwargs)
+            ctx = get_script_run_ctx()
+            own_run = bool(ctx and ctx.fragment_ids_this_run)
+            if own_run:
+                begin_run(kind=f"fragment:{name}")
+            try:
+                with _timed(name):
+                    return fn(*args, **kwargs)
+            finally:
+                if own_run:
+                    end_run()
+        return wrapper
+    return decorate
+
+
+def render_panel():
+    """Hidden debug panel with this session's recent reruns (profiling mode only)."""
+    if not enabled():
+        return
+    state = st.session_state[_STATE_KEY]
+    with st.expander(f"Profiler — {state['count']} reruns this session, {_TOTALS['reruns']} in process", expanded=False):
+        if state["history"]:
+            names = list(dict.fromkeys(k for run in state["history"] for k in run["sections"]))
+            head = ["rerun", "kind", "trigger", "total ms", "bytes", "wire bytes", "elements (cached)",
+                    "fragment hits/misses"]
+            head += [f"{n} ms" for n in names]
+            lines = ["| " + " | ".join(head) + " |", "|" + "---|" * len(head)]
+            for run in reversed(state["history"]):
+                cells = [run["rerun"], run["kind"], ", ".join(run["trigger"]) or "—",
+                         run["total_ms"], run["bytes"], run["wire_bytes"], f"{run['elements']} ({run['cached']})",
+                         f"{run['fragment_hits']}/{run['fragment_misses']}"]
+                cells += [run["sections"].get(n, {}).get("ms", "") for n in names]
+                lines.append("| " + " | ".join(str(c) for c in cells) + " |")
+            st.markdown("\n".join(lines))
+            jsonl = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in state["history"])
+            st.download_button("Export reruns (JSON lines)", jsonl, file_name="reruns.jsonl", mime="application/x-ndjson")
+        boot = startup.report()["phases"]
+        if boot:
+            st.caption("Process startup: " + ", ".join(
+                f"{name} {p['ms']} ms (done {p['at_ms']} ms after start)" for name, p in boot.items()))
+        cache = FRAGMENTS.stats()
+        st.caption(
+            f"Fragment cache: {cache['entries']}/{cache['max_entries']} entries, "
+            f"{cache['hits']} hits, {cache['misses']} misses, {cache['evictions']} evictions in process. "
+            f"Also appended to `{LOG_PATH}`."
+        )
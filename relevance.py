@@ -0,0 +1,198 @@
+"""Rank projects, highlight bullets and skills against a pasted job description.
+
+BM25 over every project, every role's highlight bullets and every skill of one
+content revision. ``RelevanceIndex`` tokenizes the content once (same
+tokenizer as search.py, plus stopwords and light suffix stripping). It stores
+the BM25 weight of each (term, document) pair column by column, as numpy
+arrays. Scoring a job description adds up the columns of its known terms,
+one vectorized add per term, so its cost grows with the number of matching
+postings rather than with the catalogue size.
+
+Rankings are cached by a hash of the normalized text (an LRU per index). The
+text is also kept under ``build/jobs/<hash>.txt``, so ``?jd=<hash>`` links
+reproduce a ranking in other sessions and after a restart.
+"""
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import numpy as np
+
+from search import tokenize
+from static_assets import BUILD_DIR, atomic_write, content_hash
+
+JOBS_DIR = BUILD_DIR / "jobs"
+K1 = 1.2
+B = 0.75
+CACHE_SIZE = 256
+MAX_TEXT = 20000  # characters; longer pastes are cut
+TITLE_BOOST = 2  # a project's title counts this many times
+_DIGEST = re.compile(r"^[0-9a-f]{16}$")
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does doing
+for from had has have having he her here him his how i if in into is it its just may me more most must
+my no nor not of off on once only or other our ours out over own per same she should so some such than
+that the their them then there these they this those through to too under until up very was we were what
+when where which while who whom why will with within would you your yours etc e g ie eg
+ability able across build building develop experience help including looking new role strong team teams
+use using work working candidate
+""".split())
+
+
+def _stem(tok):
+    # Light suffix stripping, applied to content and queries alike.
+    for suffix in ("ing", "ed", "s"):
+        if tok.endswith(suffix) and len(tok) - len(suffix) >= 3 and not tok.endswith("ss"):
+            return tok[: -len(suffix)]
+    return tok
+
+
+def terms(text):
+    return [_stem(t) for t in tokenize(text) if t not in STOPWORDS and len(t) > 1]
+
+
+def normalize(text):
+    return " ".join(text[:MAX_TEXT].split()).lower()
+
+
+def job_digest(text):
+    return content_hash(normalize(text).encode("utf-8"))
+
+
+def save_job(text):
+    """Keep ``text`` for ``?jd=`` links; returns its digest."""
+    digest = job_digest(text)
+    path = JOBS_DIR / f"{digest}.txt"
+    if not path.exists():
+        try:
+            JOBS_DIR.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, text[:MAX_TEXT].encode("utf-8"))
+        except OSError:
+            pass
+    return digest
+
+
+def load_job(digest):
+    """A saved job description, or None."""
+    if not _DIGEST.match(digest or ""):
+        return None
+    try:
+        return (JOBS_DIR / f"{digest}.txt").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class Ranking:
+    digest: str
+    terms: tuple  # matched query terms, highest weight first
+    scores: np.ndarray  # one per document, read-only
+    rows: MappingProxyType  # (kind, key) -> document row; shared by the index's rankings
+    ms: float
+
+    def score(self, kind, key):
+        row = self.rows.get((kind, key))
+        return 0.0 if row is None else float(self.scores[row])
+
+    def order_projects(self, projects):
+        # Stable: ties (and unmatched projects) keep the role's featured order.
+        return sorted(projects, key=lambda p: -self.score("projects", p.id))
+
+    def order_bullets(self, bullets):
+        return tuple(sorted(bullets, key=lambda b: -self.score("bullets", b)))
+
+    def order_skills(self, skills):
+        return tuple(sorted(skills, key=lambda s: -self.score("skills", s.name)))
+
+
+class RelevanceIndex:
+    """BM25 term matrix over one ``model.Resume``; ``rank(text)`` scores a job description."""
+
+    def __init__(self, resume):
+        self.revision = resume.revision
+        bullets = list(dict.fromkeys(b for r in resume.roles for b in r.tldr + r.deep))
+        skills = [s for _, items in resume.skills for s in items]
+        docs = [
+            [p.title] * TITLE_BOOST + [p.summary, *(e.text for e in p.par), *(m.label for m in p.metrics),
+                                       *p.stack, *p.industry]
+            for p in resume.projects
+        ] + [[b] for b in bullets] + [[s.name] for s in skills]
+        # Documents are projects, then bullets, then skills; each kind is length-normalized on its own.
+        keys = [("projects", p.id) for p in resume.projects] + [("bullets", b) for b in bullets]
+        keys += [("skills", s.name) for s in skills]
+        self.doc_rows = MappingProxyType({key: row for row, key in enumerate(keys)})
+        self.kinds = (("projects", 0, len(resume.projects)),
+                      ("bullets", len(resume.projects), len(resume.projects) + len(bullets)),
+                      ("skills", len(resume.projects) + len(bullets), len(docs)))
+        counts = [Counter(terms(" ".join(parts))) for parts in docs]
+        lengths = np.array([sum(c.values()) for c in counts], dtype=np.float64)
+        norm = np.empty(len(docs))
+        for _, lo, hi in self.kinds:
+            avg = lengths[lo:hi].mean() if hi > lo else 1.0
+            norm[lo:hi] = K1 * (1 - B + B * lengths[lo:hi] / max(avg, 1.0))
+        postings = {}
+        for row, c in enumerate(counts):
+            for term, tf in c.items():
+                postings.setdefault(term, []).append((row, tf))
+        n = len(docs)
+        self.vocab = {}
+        indptr, rows, weights = [0], [], []
+        for col, (term, plist) in enumerate(sorted(postings.items())):
+            self.vocab[term] = col
+            idf = math.log(1 + (n - len(plist) + 0.5) / (len(plist) + 0.5))
+            for row, tf in plist:
+                rows.append(row)
+                weights.append(idf * tf * (K1 + 1) / (tf + norm[row]))
+            indptr.append(len(rows))
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.rows = np.array(rows, dtype=np.int32)
+        self.weights = np.array(weights, dtype=np.float32)
+        self.peak = np.maximum.reduceat(self.weights, self.indptr[:-1]) if rows else self.weights
+        self.size = n
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def scores(self, text):
+        """``(scores per document, matched terms)`` for ``text``."""
+        query = Counter(t for t in terms(normalize(text)) if t in self.vocab)
+        scores = np.zeros(self.size, dtype=np.float32)
+        importance = {}
+        for term, tf in query.items():
+            col = self.vocab[term]
+            lo, hi = self.indptr[col], self.indptr[col + 1]
+            qw = np.float32(1 + math.log(tf))
+            # A column lists each document once, so the fancy-indexed add is exact.
+            scores[self.rows[lo:hi]] += self.weights[lo:hi] * qw
+            # A term's importance for this job: its query weight times its best content match.
+            importance[term] = self.peak[col] * qw
+        return scores, tuple(sorted(importance, key=importance.__getitem__, reverse=True))
+
+    def rank(self, text):
+        """The cached ``Ranking`` for ``text``."""
+        digest = job_digest(text)
+        with self._lock:
+            ranking = self._cache.get(digest)
+            if ranking is not None:
+                self._cache.move_to_end(digest)
+                self.hits += 1
+                return ranking
+            self.misses += 1
+        t0 = time.perf_counter()
+        scores, matched = self.scores(text)
+        scores.flags.writeable = False
+        ranking = Ranking(digest, matched, scores, self.doc_rows, round((time.perf_counter() - t0) * 1000, 3))
+        with self._lock:
+            self._cache[digest] = ranking
+            while len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return ranking
+
+    def stats(self):
+        with self._lock:
+            return {"documents": self.size, "terms": len(self.vocab), "postings": len(self.rows),
+                    "cached": len(self._cache), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,251 @@
+"""HTML templates shared by app.py and the static pre-renderer (prerender.py).
+
+Functions take ``model`` records (see model.py) and return HTML strings; they never call
+Streamlit, so the same markup can be sent through ``st.markdown`` or written
+to a static file. Every text field is escaped: profiles are uploaded JSON and
+the markup is rendered with ``unsafe_allow_html``.
+"""
+import re
+from html import escape
+from urllib.parse import quote
+
+# Whitespace inside these elements is significant; minify_html leaves them alone.
+_VERBATIM = re.compile(r"(<(script|style|pre|textarea)\b.*?</\2>)", re.S | re.I)
+# Link schemes a profile may use; anything else (javascript:, data:...) becomes "#".
+_SAFE_URL = re.compile(r"^(https?:|mailto:|[/?#.]|[^:/?#]+(?:[/?#]|$))", re.I)
+
+
+PAGE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+{head}<link rel="stylesheet" href="{css}">
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def minify_html(html):
+    """Drop whitespace between tags and collapse runs of it elsewhere (markup sent on every rerun)."""
+    parts = _VERBATIM.split(html)
+    out = []
+    for i, part in enumerate(parts):
+        kind = i % 3
+        if kind == 0:
+            out.append(re.sub(r"\s+", " ", re.sub(r">\s+<", "><", part)))
+        elif kind == 1:
+            out.append(part)
+    return "".join(out).strip()
+
+
+def safe_url(url):
+    """``url`` escaped for an attribute, or "#" unless it is relative, http(s) or mailto."""
+    url = str(url).strip()
+    return escape(url) if _SAFE_URL.match(url) else "#"
+
+
+def page_html(title, css_href, body, head=""):
+    """A standalone HTML document (pre-rendered pages and case-study routes); ``title`` is plain text."""
+    return PAGE.format(title=escape(title), css=css_href, body=body, head=head)
+
+
+def og_meta_html(title, description, url="", image="", kind="profile"):
+    """OpenGraph and Twitter card tags, read by link previews (Slack, LinkedIn, iMessage...)."""
+    tags = [("og:type", kind), ("og:title", title), ("og:description", description)]
+    if url:
+        tags.append(("og:url", url))
+    if image:
+        tags.append(("og:image", image))
+    meta = [f'<meta property="{k}" content="{escape(v)}">' for k, v in tags]
+    meta.append(f'<meta name="description" content="{escape(description)}">')
+    meta.append(f'<meta name="twitter:card" content="{"summary_large_image" if image else "summary"}">')
+    return "\n".join(meta) + "\n"
+
+
+def navbar_html(name):
+    return f"""
+<div class="navbar" role="navigation" aria-label="Sections">
+  <div class="nav-grid">
+    <a href="#top" class="nav-btn" aria-label="Home">💼 {escape(name)}</a>
+    <div class="nav-links" id="toc">
+      <a class="nav-btn" href="#about" data-section="about">About</a>
+      <a class="nav-btn" href="#experience" data-section="experience">Experience</a>
+      <a class="nav-btn" href="#projects" data-section="projects">Projects</a>
+      <a class="nav-btn" href="#skills" data-section="skills">Skills</a>
+      <a class="nav-btn" href="#testimonials" data-section="testimonials">Testimonials</a>
+      <a class="nav-btn" href="#history" data-section="history">Changes</a>
+      <a class="nav-btn" href="#contact" data-section="contact">Contact</a>
+    </div>
+  </div>
+</div>
+"""
+
+
+def page_script_html(src, reduce_motion=False):
+    # Static pages run frontend/page.js directly; the app loads it as a component.
+    return (
+        f'<script src="{src}"></script>'
+        f'<script>ResumePage.init(document, window, {{"reduceMotion": {str(reduce_motion).lower()}}});</script>'
+    )
+
+
+def hero_html(profile, stats, contact, photo=""):
+    badges = "\n      ".join(f'<span class="badge">{escape(b)}</span>' for b in profile.badges)
+    return f"""
+<section class="hero section" id="about" aria-label="About section">
+  <h1>{escape(profile.name)}</h1>
+  <div class="muted" style="margin-bottom:6px;">{escape(profile.headline)}</div>
+  <div class="grid" style="align-items:center;">
+    <div class="col-8">
+      {badges}
+      <div class="muted" style="margin-top:10px;">
+        {escape(profile.about)}
+      </div>
+      <div style="margin-top:12px;">
+        <a class="badge" href="mailto:{escape(contact.email)}">✉ Email</a>
+        <a class="badge" href="{safe_url(contact.calendar)}" target="_blank">📅 Calendar</a>
+      </div>
+    </div>
+    <div class="col-4">
+      {f'<div class="hero-photo">{photo}</div>' if photo else ''}
+      <div class="card" aria-label="Stats">
+        <div class="section-title">Stats</div>
+        <div>🗓️ <strong>{escape(str(stats.years))}</strong> years hands-on</div>
+        <div>📦 <strong>{escape(str(stats.projects))}</strong> projects shipped</div>
+        <div>📈 <strong>{escape(str(stats.impact_pct))}%</strong> typical lift on target metrics</div>
+      </div>
+    </div>
+  </div>
+</section>
+"""
+
+
+def bullets_html(bullets):
+    return "<ul>" + "".join([f"<li>{escape(b)}</li>" for b in bullets]) + "</ul>"
+
+
+def highlights_html(bullets):
+    return (
+        '<section class="section"><div class="card"><div class="section-title">Highlights</div>'
+        + bullets_html(bullets)
+        + "</div></section>"
+    )
+
+
+def experience_item_html(e):
+    return (
+        f"<div tabindex='0' style='outline:none; margin-bottom:12px;'>"
+        f"<strong>{escape(e.title)}</strong> — {escape(e.company)} "
+        f"<span class='muted'>({escape(e.start)} – {escape(e.end)}) • {escape(e.where)}</span>"
+        f"<ul>{''.join([f'<li>{escape(x)}</li>' for x in e.items])}</ul>"
+        f"</div>"
+    )
+
+
+def experience_html(experience):
+    return (
+        '<section class="section" id="experience" aria-label="Experience section">'
+        '<div class="card"><div class="section-title">Experience</div>'
+        + "".join(experience_item_html(e) for e in experience)
+        + "</div></section>"
+    )
+
+
+def project_card_html(p, case_href=None, prefetch=False):
+    case_href = escape(case_href or f"?case={quote(p.id)}")
+    # data-prefetch: page.js fetches the case page on hover so opening it is instant.
+    # target=_self: Streamlit opens other links in a new tab, which would lose "Back".
+    # data-case: page.js reports the open, since the case page never runs the app.
+    link_attrs = f" target='_self' data-prefetch data-case='{escape(p.id)}'" if prefetch else ""
+    stacks = " ".join([f"<span class='badge'>{escape(t)}</span>" for t in p.stack])
+    inds = " ".join([f"<span class='badge'>{escape(t)}</span>" for t in p.industry])
+    return (
+        "<div class='proj-card card'>"
+        f"<div class='section-title'>{escape(p.title)}</div>"
+        f"<div class='muted' style='margin:4px 0 8px 0;'>{escape(p.summary)}</div>"
+        f"{stacks}{inds}"
+        f"<div style='margin-top:8px;'><a class='badge' href='{case_href}'{link_attrs}>Read case study</a></div>"
+        "</div>"
+    )
+
+
+def case_study_html(p):
+    par = "".join([f"<li><strong>{escape(e.kind)}:</strong> {escape(e.text)}</li>" for e in p.par])
+    kpis = " ".join(
+        [f"<span class='kpi'>{escape(m.label)}: <strong>{escape(str(m.value))}</strong></span>" for m in p.metrics]
+    )
+    return (
+        f"<div class='section-title'>{escape(p.title)}</div>"
+        f"<div class='muted' style='margin-bottom:8px;'>{escape(p.summary)}</div>"
+        f"<p><strong>Problem → Action → Result</strong></p><ul>{par}</ul>"
+        f"<p><strong>Metrics</strong></p>{kpis}"
+    )
+
+
+def skill_meter_html(skill):
+    return (
+        f"<div>{escape(skill.name)}</div>"
+        f"<div class='meter-wrap'><div class='meter-val' style='width:{escape(str(skill.pct))}%;'></div></div>"
+    )
+
+
+def skills_html(skills):
+    cols = "".join(
+        f"<div class='col-4'><p><strong>{escape(group)}</strong></p>"
+        + "".join(skill_meter_html(s) for s in items)
+        + "</div>"
+        for group, items in skills
+    )
+    return (
+        '<section class="section" id="skills" aria-label="Skills section">'
+        '<div class="card"><div class="section-title">Skills Matrix</div>'
+        f'<div class="grid">{cols}</div></div></section>'
+    )
+
+
+def testimonial_item_html(t):
+    return (
+        "<div class='carousel-item'>"
+        f"<div style='font-size:1.1rem; font-weight:700;'>“{escape(t.quote)}”</div>"
+        f"<div class='muted' style='margin-top:6px;'>— {escape(t.name)}, {escape(t.role)}</div>"
+        "</div>"
+    )
+
+
+CAROUSEL_CONTROLS = '<div class="carousel-controls"><button id="prev" aria-label="Previous">◀</button><button id="next" aria-label="Next">▶</button></div>'
+
+
+def testimonials_html(testimonials):
+    return (
+        '<section class="section" id="testimonials" aria-label="Testimonials section">'
+        '<div class="card"><div class="section-title">Testimonials</div>'
+        '<div class="carousel"><div class="carousel-track" id="carousel-track">'
+        + "".join(testimonial_item_html(t) for t in testimonials)
+        + "</div>" + CAROUSEL_CONTROLS + "</div></div></section>"
+    )
+
+
+def history_html(history):
+    entries = "".join(
+        f"<details><summary>{escape(entry.date)}</summary>{bullets_html(entry.changes)}</details>"
+        for entry in history
+    )
+    return (
+        '<section class="section" id="history" aria-label="Changes section">'
+        '<div class="card"><div class="section-title">What changed since last month?</div>'
+        + entries + "</div></section>"
+    )
+
+
+def floating_cta_html(contact):
+    return f"""
+<div class="floating-cta" aria-label="Quick contact">
+  <a href="mailto:{escape(contact.email)}">Email</a>
+  <a href="{safe_url(contact.calendar)}" target="_blank">Calendar</a>
+</div>
+"""
@@ -0,0 +1,165 @@
+"""Prebuilt project index: inverted text index plus bitset facets.
+
+Each project gets a bit position. Text tokens and facet values map to Python
+ints used as bitsets, so a query is a handful of ``|``/``&`` operations instead
+of a scan over every project. Query terms match exactly, by prefix, or (for
+terms of four or more characters) within one edit: a deletion neighbourhood
+built at index time finds the candidates, and ``within_one_edit`` confirms
+them (two strings can share a deletion and still be two edits apart, e.g.
+``abxd`` and ``axcd``).
+"""
+import json
+import re
+from bisect import bisect_left
+
+FACETS = ("stack", "industry", "impact", "year")
+TYPO_MIN_LEN = 4
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def _deletes(token):
+    return {token} | {token[:i] + token[i + 1:] for i in range(len(token))}
+
+
+def within_one_edit(a, b):
+    """True if ``b`` is ``a`` with at most one character inserted, deleted or substituted."""
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > 1:
+        return False
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+
+def _bit_string(mask):
+    # Least significant bit first; one conversion beats peeling bits off a big int.
+    return bin(mask)[:1:-1]
+
+
+def iter_bits(mask):
+    s = _bit_string(mask)
+    i = s.find("1")
+    while i != -1:
+        yield i
+        i = s.find("1", i + 1)
+
+
+def _values(p, facet):
+    if facet == "stack":
+        return p.stack
+    if facet == "industry":
+        return p.industry
+    return (getattr(p, facet),)
+
+
+class ProjectIndex:
+    """Index over ``model.Project`` records; ``roles`` supply the precomputed orderings."""
+
+    def __init__(self, projects, roles=()):
+        self.projects = tuple(projects)
+        self.all_mask = (1 << len(self.projects)) - 1
+        self.postings = {}
+        self.facets = {f: {} for f in FACETS}
+        for i, p in enumerate(self.projects):
+            bit = 1 << i
+            for tok in set(tokenize(p.search_text)):
+                self.postings[tok] = self.postings.get(tok, 0) | bit
+            for facet in FACETS:
+                for v in _values(p, facet):
+                    self.facets[facet][v] = self.facets[facet].get(v, 0) | bit
+        self.vocab = sorted(self.postings)
+        self.deletes = {}
+        for tok in self.vocab:
+            if len(tok) >= TYPO_MIN_LEN:
+                for d in _deletes(tok):
+                    self.deletes.setdefault(d, set()).add(tok)
+        self.by_id = {p.id: i for i, p in enumerate(self.projects)}
+        # Role-featured ordering (Role.order) as bit positions and per-position ranks.
+        self.order, self.rank = {}, {}
+        for role in roles:
+            order = [self.by_id[pid] for pid in role.order]
+            rank = [0] * len(order)
+            for pos, i in enumerate(order):
+                rank[i] = pos
+            self.order[role.label], self.rank[role.label] = order, rank
+
+    def facet_values(self, facet):
+        return sorted(self.facets[facet])
+
+    def _term_mask(self, term):
+        mask = self.postings.get(term, 0)
+        i = bisect_left(self.vocab, term)
+        while i < len(self.vocab) and self.vocab[i].startswith(term):
+            mask |= self.postings[self.vocab[i]]
+            i += 1
+        if len(term) >= TYPO_MIN_LEN:
+            for d in _deletes(term):
+                for tok in self.deletes.get(d, ()):
+                    if within_one_edit(term, tok):
+                        mask |= self.postings[tok]
+        return mask
+
+    def match(self, query="", **filters):
+        """Bitset of projects matching every query term and every non-empty facet filter."""
+        mask = self.all_mask
+        for facet, selected in filters.items():
+            if selected:
+                fmask = 0
+                for v in selected:
+                    fmask |= self.facets[facet].get(v, 0)
+                mask &= fmask
+        for term in tokenize(query):
+            if not mask:
+                break
+            mask &= self._term_mask(term)
+        return mask
+
+    def search(self, query="", role=None, **filters):
+        """Matching projects, ordered by the role's featured list and then by year."""
+        mask = self.match(query, **filters)
+        if role not in self.order:
+            return [self.projects[i] for i in iter_bits(mask)]
+        count = mask.bit_count()
+        if count * 8 > len(self.projects):
+            # Dense result: walk the precomputed order instead of sorting.
+            s = _bit_string(mask)
+            return [self.projects[i] for i in self.order[role] if i < len(s) and s[i] == "1"]
+        rank = self.rank[role]
+        return [self.projects[i] for i in sorted(iter_bits(mask), key=rank.__getitem__)]
+
+    def get(self, project_id):
+        i = self.by_id.get(project_id)
+        return None if i is None else self.projects[i]
+
+
+def client_catalog(index):
+    """Compact JSON of ``index`` for in-browser filtering (frontend/catalog.js).
+
+    Facet values are listed once and referenced by position; postings and role
+    orders use project positions, so the browser applies the same matching
+    rules as ``ProjectIndex.search`` without a server round-trip.
+    """
+    facets = {f: index.facet_values(f) for f in FACETS}
+    pos = {f: {v: i for i, v in enumerate(values)} for f, values in facets.items()}
+    projects = [
+        [p.id, p.title, p.summary,
+         [pos["stack"][v] for v in p.stack], [pos["industry"][v] for v in p.industry],
+         pos["impact"][p.impact], pos["year"][p.year]]
+        for p in index.projects
+    ]
+    return json.dumps({
+        "facets": facets,
+        "projects": projects,
+        "postings": {tok: list(iter_bits(mask)) for tok, mask in index.postings.items()},
+        "order": index.order,
+        "typoMinLen": TYPO_MIN_LEN,
+    }, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,60 @@
+"""Start the app with warm caches.
+
+    python serve.py [streamlit run options, e.g. --server.port 8501]
+
+Runs ``warmup.warm()`` and then starts the Streamlit server in the same
+process. The server only starts listening after the warm-up. The first
+visitor therefore finds the modules imported, the content model built and
+the default view's fragments rendered. The machine-readable exports (see
+exports.py) are routed as soon as the server's runtime exists, so crawlers
+can fetch them without opening a session. Content-hashed files (fonts,
+bundles, stylesheets) are sent as ``immutable``. With
+``RESUME_SIDECAR_PORT`` set, the bot-facing side-car (sidecar.py) also runs
+in this process, on that port, sharing its content and caches. Plain ``streamlit run app.py`` still
+works; it just pays these costs on the first request.
+"""
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import startup
+from static_assets import cache_hashed_assets, register_routes
+
+APP = Path(__file__).parent / "app.py"
+
+
+def _route_exports():
+    from streamlit.runtime import Runtime
+
+    from exports import EXPORT_KIND
+
+    # The runtime is created just before the server binds its port.
+    while not Runtime.exists():
+        time.sleep(0.005)
+    register_routes(EXPORT_KIND)
+
+
+def main():
+    startup.begin("warmup")
+    from warmup import warm
+
+    warm()
+    startup.end("warmup")
+    if os.environ.get("RESUME_SIDECAR_PORT"):
+        import sidecar
+
+        sidecar.SITES.get("")
+        sidecar.start_in_background()
+    from streamlit.web import cli
+
+    cache_hashed_assets()
+    threading.Thread(target=_route_exports, name="route-exports", daemon=True).start()
+
+    sys.argv = ["streamlit", "run", str(APP), *sys.argv[1:]]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main()
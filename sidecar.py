@@ -0,0 +1,276 @@
+"""HTTP side-car for crawlers, link previews and health checks.
+
+    python sidecar.py [--host 127.0.0.1] [--port 8502]  (or RESUME_SIDECAR_HOST / RESUME_SIDECAR_PORT)
+
+Bots only need static HTML, OpenGraph tags and files. In the app, each of
+them costs a Streamlit session: a websocket, a script run and session state.
+This server answers them with plain HTTP from the same content and the same
+build caches (see prerender.py and exports.py):
+
+- ``/`` and every pre-rendered page, with OpenGraph tags;
+- ``/resume.pdf``, the canonical PDF;
+- ``/resume.json``, the JSON Resume of the default variant, and
+  ``/exports/…`` for every variant (``/exports/index.json`` lists them);
+- ``/healthz``, which loads no content;
+- ``/p/<slug>/…``, the same for a hosted profile (see profiles.py).
+
+A profile's site is rendered when it is first requested and again when its
+content revision changes. Every file is then held in memory together with its
+gzip body and its brotli body (``brotli`` is in requirements.txt; without it
+only gzip is offered). Both are compressed at maximum level and kept on disk under
+``build/precompressed`` by content hash, so only new content is ever
+compressed, and never per request. Each file has a strong ETag
+derived from its content hash; a matching ``If-None-Match`` gets
+``304 Not Modified``. Run it next to the app, or inside the app's process with
+``RESUME_SIDECAR_PORT`` set (see serve.py).
+"""
+import argparse
+import gzip
+import mimetypes
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from exports import EXPORT_KIND, publish_exports
+from prerender import SITE_DIR, build
+from profiles import MAX_PROFILES, SLUG, get_profile
+from static_assets import BUILD_DIR, IMMUTABLE, atomic_write, content_hash, kind_dir
+
+try:
+    import brotli
+except ImportError:  # optional; without it only gzip is offered
+    brotli = None
+
+PRECOMPRESSED_DIR = BUILD_DIR / "precompressed"
+HOST = os.environ.get("RESUME_SIDECAR_HOST", "127.0.0.1")
+PORT = int(os.environ.get("RESUME_SIDECAR_PORT", "0") or 0)
+COMPRESSIBLE = ("text/", "application/json", "application/javascript", "application/pdf", "image/svg+xml")
+REVALIDATE = "no-cache"
+
+
+@dataclass(frozen=True, slots=True)
+class Entry:
+    body: bytes
+    gzip: bytes
+    br: bytes
+    etag: str  # quoted, without the encoding suffix
+    content_type: str
+    cache_control: str
+
+
+def _compressed(data, digest, coding):
+    """``data`` compressed with ``coding``, cached on disk by content hash (max compression is slow)."""
+    path = PRECOMPRESSED_DIR / f"{digest}.{coding}"
+    try:
+        return path.read_bytes()
+    except OSError:
+        pass
+    body = gzip.compress(data, 9, mtime=0) if coding == "gz" else brotli.compress(data, quality=11)
+    try:
+        PRECOMPRESSED_DIR.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, body)
+    except OSError:
+        pass
+    return body
+
+
+def _entry(data, name, cache_control):
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    digest = content_hash(data)
+    gz = br = b""
+    if content_type.startswith(COMPRESSIBLE):
+        gz = _compressed(data, digest, "gz")
+        if brotli is not None:
+            br = _compressed(data, digest, "br")
+        # Only keep encodings that actually save bytes.
+        gz = gz if len(gz) < len(data) else b""
+        br = br if br and len(br) < len(gz or data) else b""
+    if content_type.startswith("text/") or content_type == "application/json":
+        content_type += "; charset=utf-8"
+    return Entry(data, gz, br, f'"{digest}"', content_type, cache_control)
+
+
+class StaticSite:
+    """One profile's pre-rendered site, as ``{url path: Entry}`` for a single revision."""
+
+    def __init__(self, slug, revision, files):
+        self.slug = slug
+        self.revision = revision
+        self.files = files
+
+    @classmethod
+    def build(cls, slug):
+        site = get_profile(slug)
+        resume = site.resume()
+        out = BUILD_DIR / "sites" / slug if slug else SITE_DIR
+        build(out, slug)
+        files = {}
+        for path in sorted(p for p in out.rglob("*") if p.is_file()):
+            rel = path.relative_to(out).as_posix()
+            # Hashed names (assets/, exports/<hash>) never change meaning.
+            fixed = rel.startswith("assets/") or (rel.startswith("exports/") and rel != "exports/index.json")
+            files[rel] = _entry(path.read_bytes(), rel, IMMUTABLE if fixed else REVALIDATE)
+            if rel.endswith("/index.html") or rel == "index.html":
+                files[rel[: -len("index.html")]] = files[rel]
+        pdf = site.path(resume.profile.pdf)
+        if pdf:
+            files["resume.pdf"] = _entry(pdf.read_bytes(), "resume.pdf", REVALIDATE)
+        default = publish_exports(resume, slug)["variants"][0]["json"]
+        files["resume.json"] = _entry((kind_dir(EXPORT_KIND) / default).read_bytes(), "resume.json", REVALIDATE)
+        return cls(slug, resume.revision, files)
+
+
+class SiteCache:
+    """Built sites by profile slug; bounded like the profile registry."""
+
+    def __init__(self, max_sites=MAX_PROFILES):
+        self.max_sites = max_sites
+        self.builds = 0
+        self._sites = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def get(self, slug=""):
+        """The current site for ``slug``, or None if there is no such profile."""
+        profile = get_profile(slug)
+        if profile is None:
+            return None
+        revision = profile.resume().revision
+        with self._lock:
+            site = self._sites.get(slug)
+            if site is not None and site.revision == revision:
+                self._sites.move_to_end(slug)
+                return site
+        # One build at a time: concurrent requests for a stale site wait for it instead of racing.
+        with self._build_lock:
+            site = self._sites.get(slug)
+            if site is None or site.revision != profile.resume().revision:
+                site = StaticSite.build(slug)
+                self.builds += 1
+            with self._lock:
+                self._sites[slug] = site
+                self._sites.move_to_end(slug)
+                while len(self._sites) > self.max_sites:
+                    self._sites.popitem(last=False)
+        return site
+
+
+SITES = SiteCache()
+
+
+def _accepts(header, coding):
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() in (coding, "*"):
+            q = params.strip()
+            try:
+                return not (q.startswith("q=") and float(q[2:]) == 0)
+            except ValueError:
+                return False
+    return False
+
+
+def _none_match(header, etag):
+    if header.strip() == "*":
+        return True
+    for tag in header.split(","):
+        tag = tag.strip().removeprefix("W/")
+        # If-None-Match compares weakly: any encoding of the same content matches.
+        if tag.split("-", 1)[0].rstrip('"') + '"' == etag:
+            return True
+    return False
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "resume-sidecar"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle on, keep-alive clients wait ~40 ms for the body.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        if status != HTTPStatus.NOT_MODIFIED:  # a 304 has no body, and no length for one
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _resolve(self):
+        path = self.path.split("?", 1)[0].split("#", 1)[0].lstrip("/")
+        slug = ""
+        if path.startswith("p/"):
+            slug, _, path = path[2:].partition("/")
+            if not SLUG.match(slug):
+                return None
+        site = SITES.get(slug)
+        return site and site.files.get(path)
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] == "/healthz":
+            self._send(HTTPStatus.OK, b"ok\n", [("Content-Type", "text/plain"), ("Cache-Control", "no-store")])
+            return
+        entry = self._resolve()
+        if entry is None:
+            self._send(HTTPStatus.NOT_FOUND, b"not found\n", [("Content-Type", "text/plain")])
+            return
+        accept = self.headers.get("Accept-Encoding", "")
+        if entry.br and _accepts(accept, "br"):
+            body, coding = entry.br, "br"
+        elif entry.gzip and _accepts(accept, "gzip"):
+            body, coding = entry.gzip, "gzip"
+        else:
+            body, coding = entry.body, ""
+        etag = f'{entry.etag[:-1]}-{coding}"' if coding else entry.etag
+        headers = [("ETag", etag), ("Cache-Control", entry.cache_control)]
+        if entry.gzip or entry.br:  # the body depends on Accept-Encoding
+            headers.append(("Vary", "Accept-Encoding"))
+        if _none_match(self.headers.get("If-None-Match", ""), entry.etag):
+            self._send(HTTPStatus.NOT_MODIFIED, headers=headers)
+            return
+        headers.append(("Content-Type", entry.content_type))
+        if coding:
+            headers.append(("Content-Encoding", coding))
+        self._send(HTTPStatus.OK, body, headers)
+
+    do_HEAD = do_GET
+
+
+def make_server(host=HOST, port=8502, verbose=False):
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    return server
+
+
+def start_in_background(host=HOST, port=PORT):
+    """Serve from a daemon thread of the current process (the app's, under serve.py)."""
+    server = make_server(host, port)
+    threading.Thread(target=server.serve_forever, name="sidecar", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT or 8502)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+    t0 = time.perf_counter()
+    SITES.get("")
+    print(f"Default site ready in {(time.perf_counter() - t0) * 1000:.0f} ms; "
+          f"serving on http://{args.host}:{args.port}/ (brotli: {'yes' if brotli else 'no'})")
+    make_server(args.host, args.port, args.verbose).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""Versioned content snapshots and the generated change history.
+
+Every content revision the app or the pre-renderer loads is stored once as
+``<revision>.json`` in ``content/snapshots`` (``RESUME_SNAPSHOT_DIR``), where
+``revision`` is the content hash from content.py. ``index.jsonl`` lists the
+revisions in the order they were first seen, with a timestamp.
+
+The "What changed" section is a structural diff between consecutive
+snapshots: projects added or removed, metrics changed, bullets added, removed
+or edited, and so on. A diff is computed once per snapshot pair and kept
+in ``build/history`` and in memory. The history for a revision is the
+history of the previous revision plus one new entry. Rendering it therefore
+costs a lookup, even with hundreds of revisions. The hand-written
+``resume_history`` entries follow as the record from before snapshots
+existed. Commit ``content/snapshots`` along with the content so the history
+survives redeploys.
+"""
+import difflib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from content import CONTENT_PATH
+from model import HistoryEntry
+from static_assets import atomic_write, kind_dir
+
+SNAPSHOT_DIR = Path(os.environ.get("RESUME_SNAPSHOT_DIR", CONTENT_PATH.parent / "snapshots"))
+DIFF_KIND = "history"
+SNIPPET = 70
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# =========================
+# Structural diff
+# =========================
+def _snippet(text):
+    return f"“{text if len(text) <= SNIPPET else text[:SNIPPET - 1].rstrip() + '…'}”"
+
+
+def _list_changes(label, old, new):
+    """Bullet-list edits as sentences; a replaced bullet is reported as edited."""
+    out = []
+    matcher = difflib.SequenceMatcher(a=old, b=new, autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal":
+            continue
+        removed, added = old[i1:i2], new[j1:j2]
+        if op == "replace":
+            for a, b in zip(removed, added):
+                out.append(f"{label}: edited {_snippet(a)} → {_snippet(b)}")
+            removed, added = removed[len(added):], added[len(removed):]
+        out += [f"{label}: added {_snippet(b)}" for b in added]
+        out += [f"{label}: removed {_snippet(a)}" for a in removed]
+    return out
+
+
+def _by_key(items, key):
+    return {key(item): item for item in items}
+
+
+def _project_changes(old, new):
+    out = []
+    before, after = _by_key(old, lambda p: p["id"]), _by_key(new, lambda p: p["id"])
+    out += [f"Added project {after[i]['title']}" for i in after if i not in before]
+    out += [f"Removed project {before[i]['title']}" for i in before if i not in after]
+    for pid in after:
+        if pid not in before:
+            continue
+        a, b = before[pid], after[pid]
+        title = b["title"]
+        if a["title"] != b["title"]:
+            out.append(f"Renamed project {a['title']} to {b['title']}")
+        if a["summary"] != b["summary"]:
+            out.append(f"{title}: new summary {_snippet(b['summary'])}")
+        out += _list_changes(f"{title} case study",
+                             [f"{e['type']}: {e['text']}" for e in a["par"]],
+                             [f"{e['type']}: {e['text']}" for e in b["par"]])
+        m0 = {m["label"]: m["value"] for m in a["metrics"]}
+        m1 = {m["label"]: m["value"] for m in b["metrics"]}
+        for label, value in m1.items():
+            if label not in m0:
+                out.append(f"{title}: new metric {label} {value}")
+            elif m0[label] != value:
+                out.append(f"{title}: {label} {m0[label]} → {value}")
+        out += [f"{title}: dropped metric {label}" for label in m0 if label not in m1]
+        if a["tags"] != b["tags"]:
+            out.append(f"{title}: retagged")
+    return out
+
+
+def _role_changes(old, new):
+    out = []
+    before, after = _by_key(old, lambda r: r["label"]), _by_key(new, lambda r: r["label"])
+    out += [f"Added role focus {label}" for label in after if label not in before]
+    out += [f"Removed role focus {label}" for label in before if label not in after]
+    for label in after:
+        if label in before:
+            out += _list_changes(f"{label} highlights (TL;DR)", before[label]["tldr"], after[label]["tldr"])
+            out += _list_changes(f"{label} highlights", before[label]["deep"], after[label]["deep"])
+            if before[label]["featured"] != after[label]["featured"]:
+                out.append(f"{label}: new featured projects")
+    return out
+
+
+def _experience_changes(old, new):
+    out = []
+    key = lambda e: (e["title"], e["company"])  # noqa: E731
+    before, after = _by_key(old, key), _by_key(new, key)
+    out += [f"Added experience {t} — {c}" for t, c in after if (t, c) not in before]
+    out += [f"Removed experience {t} — {c}" for t, c in before if (t, c) not in after]
+    for k in after:
+        if k in before:
+            a, b = before[k], after[k]
+            if (a["from"], a["to"]) != (b["from"], b["to"]):
+                out.append(f"{k[0]} — {k[1]}: dates {a['from']} – {a['to']} → {b['from']} – {b['to']}")
+            out += _list_changes(f"{k[0]} — {k[1]}", a["items"], b["items"])
+    return out
+
+
+def _skill_changes(old, new):
+    out = []
+    names0 = {n for names in old["skills"].values() for n in names}
+    names1 = {n for names in new["skills"].values() for n in names}
+    out += [f"Added skill {n}" for n in sorted(names1 - names0)]
+    out += [f"Removed skill {n}" for n in sorted(names0 - names1)]
+    for n in sorted(names0 & names1):
+        a, b = old["skill_level"].get(n, 3), new["skill_level"].get(n, 3)
+        if a != b:
+            out.append(f"{n} level {a} → {b}")
+    return out
+
+
+def diff(old, new):
+    """Human-readable structural changes from content ``old`` to ``new``, as a list of strings."""
+    out = []
+    for field in ("name", "headline", "about"):
+        if old["profile"].get(field) != new["profile"].get(field):
+            out.append(f"Updated {field}")
+    for field, value in new["stats"].items():
+        if old["stats"].get(field) != value:
+            out.append(f"Stats: {field.replace('_', ' ')} {old['stats'].get(field)} → {value}")
+    out += _role_changes(old["roles"], new["roles"])
+    out += _experience_changes(old["experience"], new["experience"])
+    out += _project_changes(old["projects"], new["projects"])
+    out += _skill_changes(old, new)
+    quotes0 = {t["name"] for t in old["testimonials"]}
+    quotes1 = {t["name"] for t in new["testimonials"]}
+    out += [f"New testimonial from {n}" for n in sorted(quotes1 - quotes0)]
+    out += [f"Removed testimonial from {n}" for n in sorted(quotes0 - quotes1)]
+    return out
+
+
+# =========================
+# Snapshot store
+# =========================
+class SnapshotStore:
+    """Content-addressed snapshots of one content file, plus cached pairwise diffs."""
+
+    def __init__(self, directory=SNAPSHOT_DIR, diff_dir=None):
+        self.dir = Path(directory)
+        self.diff_dir = Path(diff_dir) if diff_dir else None  # default: build/history
+        if self.diff_dir:
+            self.diff_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._order = None  # [(revision, ts), ...] oldest first
+        self._position = {}
+        self._diffs = {}
+        self._histories = {}
+
+    def _read_index(self):
+        order = []
+        try:
+            with open(self.dir / "index.jsonl", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        rec = json.loads(line)
+                        order.append((rec["revision"], rec["ts"]))
+        except FileNotFoundError:
+            pass
+        self._order = order
+        self._position = {rev: n for n, (rev, _) in enumerate(order)}
+
+    def record(self, revision, data):
+        """Store ``data`` as snapshot ``revision`` if it is new; cheap when already known."""
+        if self._order is not None and revision in self._position:
+            return
+        with self._lock:
+            # Re-read: another process (e.g. prerender.py) may have appended.
+            self._read_index()
+            if revision in self._position:
+                return
+            ts = round(time.time(), 3)
+            try:
+                self.dir.mkdir(parents=True, exist_ok=True)
+                path = self.dir / f"{revision}.json"
+                if not path.exists():
+                    atomic_write(path, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+                with open(self.dir / "index.jsonl", "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"revision": revision, "ts": ts}) + "\n")
+            except OSError as e:
+                # Read-only deployment: keep serving the history recorded so far.
+                _LOGGER.warning("Could not record snapshot %s: %s", revision, e)
+                return
+            self._position[revision] = len(self._order)
+            self._order.append((revision, ts))
+
+    def load(self, revision):
+        return json.loads((self.dir / f"{revision}.json").read_text(encoding="utf-8"))
+
+    def changes(self, old, new):
+        """Cached ``diff`` between snapshots ``old`` and ``new``."""
+        key = (old, new)
+        changes = self._diffs.get(key)
+        if changes is not None:
+            return changes
+        path = (self.diff_dir or kind_dir(DIFF_KIND)) / f"{old}-{new}.json"
+        try:
+            changes = tuple(json.loads(path.read_text(encoding="utf-8")))
+        except (FileNotFoundError, ValueError):
+            changes = tuple(diff(self.load(old), self.load(new)))
+            try:
+                atomic_write(path, json.dumps(changes, ensure_ascii=False).encode("utf-8"))
+            except OSError as e:
+                _LOGGER.warning("Could not cache diff %s: %s", path.name, e)
+        self._diffs[key] = changes
+        return changes
+
+    def history(self, revision):
+        """``HistoryEntry`` tuple for ``revision``, newest first (pairs without changes are skipped)."""
+        if self._order is None:
+            with self._lock:
+                self._read_index()
+        if revision not in self._position:
+            return ()
+        # Walk back to the newest revision whose history is already known, then build forward.
+        n = self._position[revision]
+        start = n
+        while start > 0 and self._order[start][0] not in self._histories:
+            start -= 1
+        history = self._histories.get(self._order[start][0], ())
+        for i in range(start + 1, n + 1):
+            (old, _), (new, ts) = self._order[i - 1], self._order[i]
+            changes = self.changes(old, new)
+            if changes:
+                date = time.strftime("%Y-%m-%d", time.localtime(ts))
+                history = (HistoryEntry(date, changes),) + history
+            self._histories[new] = history
+        self._histories.setdefault(revision, history)
+        return history
+
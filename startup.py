@@ -0,0 +1,83 @@
+"""Startup timing: how long a new server process takes to render its first page.
+
+``app.py`` marks the end of its imports and of its first script run. The
+warm-up launcher (serve.py) marks the warm-up. Each phase is recorded once
+per process, as milliseconds since the process started (read from ``/proc``
+where available; otherwise since this module was imported), together with
+its own duration. When the first render finishes, the report is written to
+``build/profile/startup.json`` and shown in the profiler panel.
+bench/bench_startup.py measures the same path from outside.
+"""
+import json
+import os
+import threading
+import time
+
+from static_assets import BUILD_DIR
+
+REPORT_PATH = BUILD_DIR / "profile" / "startup.json"
+
+_T0 = time.perf_counter()
+_LOCK = threading.Lock()
+_PHASES = {}
+_OPEN = {}
+
+
+def _process_age():
+    """Seconds since this process started (Linux), or None."""
+    try:
+        with open("/proc/self/stat", encoding="ascii") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime", encoding="ascii") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Offset from the process start to this module's import; 0 if unknown.
+_OFFSET = max(0.0, _process_age() or 0.0)
+
+
+def _now_ms():
+    return round((_OFFSET + time.perf_counter() - _T0) * 1000, 1)
+
+
+def begin(name):
+    """Start phase ``name`` unless it has already been recorded in this process.
+
+    A phase still open is restarted: a run that stopped early (``st.stop()``)
+    never calls ``end``, and the next run must not include the gap.
+    """
+    with _LOCK:
+        if name not in _PHASES:
+            _OPEN[name] = time.perf_counter()
+
+
+def end(name):
+    """Finish phase ``name``; returns True the first time only."""
+    with _LOCK:
+        t0 = _OPEN.pop(name, None)
+        if t0 is None:
+            return False
+        _PHASES[name] = {"ms": round((time.perf_counter() - t0) * 1000, 1), "at_ms": _now_ms()}
+    if name == "first_render":
+        write_report()
+    return True
+
+
+def report():
+    with _LOCK:
+        return {
+            "pid": os.getpid(),
+            "module_import_at_ms": round(_OFFSET * 1000, 1),
+            "phases": dict(_PHASES),
+        }
+
+
+def write_report(path=REPORT_PATH):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report(), indent=2), encoding="utf-8")
+    except OSError:
+        pass
@@ -0,0 +1,164 @@
+"""Content-hashed build artifacts served through Streamlit's component route.
+
+Streamlit 1.35 serves ``app/static`` files other than images as ``text/plain``
+with ``nosniff``, which browsers refuse for stylesheets, fonts and PDFs. The
+component route instead guesses the real MIME type, sends
+``Cache-Control: public`` and lets Tornado attach an ETag (answering
+``If-None-Match`` with ``304``). Files are named by their content hash, so a
+URL never changes meaning and can be cached indefinitely; under serve.py
+they are also sent as ``immutable`` (see ``cache_hashed_assets``).
+"""
+import hashlib
+import os
+import re
+import shutil
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
+BUILD_DIR = Path(__file__).parent / "build"
+IMMUTABLE = "public, max-age=31536000, immutable"
+_HASHED = re.compile(r"^[0-9a-f]{16}\.[a-z0-9]+$")
+
+
+def content_hash(data, length=16):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def kind_dir(kind):
+    path = BUILD_DIR / kind
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _tmp_path(path):
+    # Unique per writer so concurrent sessions never share a temp file.
+    return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def atomic_write(path, data):
+    tmp = _tmp_path(path)
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def publish_bytes(kind, data, suffix):
+    """Write ``data`` to ``build/<kind>/<hash><suffix>`` (once) and return the file name."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    name = content_hash(data) + suffix
+    path = kind_dir(kind) / name
+    if not path.exists():
+        atomic_write(path, data)
+    return name
+
+
+@lru_cache(maxsize=64)
+def _published_file(kind, src, mtime_ns, size, suffix):
+    h = hashlib.sha256()
+    with open(src, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    name = h.hexdigest()[:16] + suffix
+    path = kind_dir(kind) / name
+    # A copy, not a hard link: overwriting the source in place must not change a published hash.
+    # (Builds made before this may still hold links; those are replaced too.)
+    if not path.exists() or os.path.samefile(path, src):
+        tmp = _tmp_path(path)
+        shutil.copyfile(src, tmp)
+        tmp.replace(path)
+    return name
+
+
+def publish_file(kind, src):
+    """Publish an existing file under its content hash.
+
+    The file is only re-read when its mtime or size changes; otherwise this is a
+    single ``stat`` call.
+    """
+    st = os.stat(src)
+    return _published_file(kind, str(src), st.st_mtime_ns, st.st_size, Path(src).suffix.lower())
+
+
+COMPONENT_SHELL = """<!doctype html>
+<html><head><meta charset="utf-8"><script src="{bundle}"></script></head>
+<body><script>{mount}</script></body></html>
+"""
+
+
+@lru_cache(maxsize=16)
+def _published_component(kind, src, mtime_ns, size, mount):
+    name = publish_bytes(kind, Path(src).read_bytes(), ".js")
+    shell = COMPONENT_SHELL.format(bundle=name, mount=mount).encode("utf-8")
+    index = kind_dir(kind) / "index.html"
+    if not index.exists() or index.read_bytes() != shell:
+        atomic_write(index, shell)
+    return name
+
+
+def publish_component(kind, src, mount):
+    """Publish a component bundle as ``build/<kind>/<hash>.js`` plus an ``index.html`` shell.
+
+    The shell loads the bundle and runs ``mount``. Streamlit sends the shell
+    with ``no-cache`` and the hashed bundle as ``public``, so a new session
+    costs one small revalidation. Returns the bundle's file name.
+    """
+    st = os.stat(src)
+    return _published_component(kind, str(src), st.st_mtime_ns, st.st_size, mount)
+
+
+def asset_url(kind, name, from_asset=False):
+    """Relative URL for a published file; registers ``build/<kind>`` as a component root.
+
+    URLs are relative to the app page, or to another published file when
+    ``from_asset`` is set (for links between published HTML pages).
+    """
+    # Registering is a dict insert; doing it per call keeps it valid across runtimes.
+    component = components.declare_component(kind, path=str(kind_dir(kind)))
+    return f"{'..' if from_asset else 'component'}/{component.name}/{name}"
+
+
+def register_routes(*kinds):
+    """Serve ``build/<kind>`` at the same URLs as ``asset_url`` before any session has run.
+
+    ``declare_component`` only registers inside a script run, so files in a
+    kind no session has used yet return 404. This registers them with the
+    server's runtime directly. Call it once the runtime exists (serve.py does).
+    """
+    # imported lazily; only the launcher needs the runtime internals
+    from streamlit.components.v1.custom_component import CustomComponent
+    from streamlit.runtime import Runtime
+
+    registry = Runtime.instance().component_registry
+    for kind in kinds:
+        registry.register_component(
+            CustomComponent(name=f"{__name__}.{kind}", path=str(kind_dir(kind)), module_name=__name__)
+        )
+
+
+def cache_hashed_assets():
+    """Send ``IMMUTABLE`` for content-hashed files on the component route.
+
+    Streamlit sends ``Cache-Control: public`` without a lifetime, so browsers
+    revalidate fonts, bundles and stylesheets they already hold. A file named
+    ``<hash>.<ext>`` never changes; other files (component shells, manifests)
+    keep Streamlit's headers. Call it before the server starts (serve.py does).
+    """
+    # imported lazily; only the launcher needs the server internals
+    from streamlit.web.server.component_request_handler import ComponentRequestHandler
+
+    plain = ComponentRequestHandler.set_extra_headers
+    if getattr(plain, "hashed_assets", False):
+        return
+
+    def set_extra_headers(self, path):
+        plain(self, path)
+        if _HASHED.match(path.rsplit("/", 1)[-1]):
+            self.set_header("Cache-Control", IMMUTABLE)
+
+    set_extra_headers.hashed_assets = True
+    ComponentRequestHandler.set_extra_headers = set_extra_headers
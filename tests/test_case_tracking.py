@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import analytics
+from page_controller import case_opens
+from profiles import get_profile
+
+APP = str(Path(__file__).resolve().parents[1] / "app.py")
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def put(self, session, kind, value):
+        self.events.append((kind, value))
+
+    def cases(self):
+        return [value for kind, value in self.events if kind == "case"]
+
+
+@pytest.fixture
+def log(monkeypatch):
+    rec = Recorder()
+    monkeypatch.setattr(analytics, "_LOG", rec)
+    monkeypatch.setenv("RESUME_ANALYTICS", "1")
+    return rec
+
+
+def _report(at, *opens):
+    at.session_state["page-controller"] = {
+        "section": "projects", "slide": 0,
+        "cases": [{"case": case_id, "at": t} for t, case_id in opens],
+    }
+    return at.run()
+
+
+def _project_ids():
+    return [p.id for p in get_profile().resume().projects[:2]]
+
+
+def test_case_opens_skips_acknowledged_and_malformed_entries():
+    state = {"cases": [{"case": "b", "at": 3}, {"case": "a", "at": 1}, {"at": 4}, {"case": "c", "at": "x"}]}
+    assert case_opens(state, 0) == [(1.0, "a"), (3.0, "b")]
+    assert case_opens(state, 1) == [(3.0, "b")]
+    assert case_opens(None) == []
+
+
+def test_opening_a_case_from_a_card_is_counted_once(log):
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    assert not at.exception
+    first, second = _project_ids()
+
+    _report(at, (1, first))
+    assert log.cases() == [first]
+    assert at.session_state["case-ack"] == 1
+
+    # page.js resends until the ack reaches it; a repeat is not counted twice,
+    # but opening the same case again later is.
+    _report(at, (1, first), (2, second), (3, first))
+    assert log.cases() == [first, second, first]
+    _report(at, (1, first), (2, second), (3, first))
+    assert log.cases() == [first, second, first]
+
+
+def test_unknown_case_ids_are_not_counted(log):
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    _report(at, (1, "<script>"))
+    assert log.cases() == []
+    assert at.session_state["case-ack"] == 1
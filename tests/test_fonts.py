@@ -0,0 +1,50 @@
+import logging
+
+import pytest
+
+import fonts
+
+pytest.importorskip("fontTools")
+
+
+@pytest.fixture
+def ttf(tmp_path):
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    def box():
+        pen = TTGlyphPen(None)
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 500))
+        pen.lineTo((400, 500))
+        pen.closePath()
+        return pen.glyph()
+
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef", "A"])
+    fb.setupCharacterMap({ord("A"): "A"})
+    fb.setupGlyf({".notdef": box(), "A": box()})
+    fb.setupHorizontalMetrics({".notdef": (500, 0), "A": (500, 0)})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    path = tmp_path / "Test.ttf"
+    fb.save(str(path))
+    return path
+
+
+def test_woff2_with_brotli(ttf, caplog):
+    pytest.importorskip("brotli")
+    data, _ = fonts._subset(ttf, "A", (400, 400))
+    assert data[:4] == b"wOF2"
+    assert not caplog.records
+
+
+def test_without_brotli_woff_is_written_with_a_warning(ttf, monkeypatch, caplog):
+    monkeypatch.setattr(fonts, "brotli", None)
+    monkeypatch.setattr(fonts, "FLAVOR", "woff")
+    with caplog.at_level(logging.WARNING, logger="fonts"):
+        data, _ = fonts._subset(ttf, "A", (400, 400))
+    assert data[:4] == b"wOFF"
+    assert "brotli is not installed" in caplog.text
@@ -0,0 +1,78 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import outbox
+from outbox import Outbox
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "bench"))
+
+from smtp_sink import SMTPSink  # noqa: E402
+
+
+@pytest.fixture
+def sink(tmp_path):
+    srv = SMTPSink(("127.0.0.1", 0), tmp_path / "mail")
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def box(tmp_path, sink, monkeypatch):
+    monkeypatch.setattr(outbox, "SEND_RATE", 60_000)
+    monkeypatch.setattr(outbox, "POLL_INTERVAL", 0.05)
+    smtp = {"host": "127.0.0.1", "port": sink.server_address[1], "user": None, "password": None,
+            "starttls": False, "sender": "site@example.com", "to": "owner@example.com"}
+    b = Outbox(tmp_path / "outbox.sqlite3", smtp, "owner@example.com")
+    yield b
+    b.stop()
+
+
+def _wait(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_line_breaks_in_the_name_are_removed(box):
+    assert box.submit("Eve\r\nBcc: x@example.com", "eve@example.com", "Hi there") == "queued"
+    assert box._db().execute("SELECT name FROM messages").fetchone() == ("Eve Bcc: x@example.com",)
+    box.start()
+    assert _wait(lambda: box.status() == {"sent": 1})
+    assert box._thread.is_alive()
+
+
+def test_a_message_that_cannot_be_composed_fails_and_the_rest_is_sent(box, sink):
+    now = time.time()
+    with box._db() as db:  # a row stored before names were cleaned
+        db.execute("INSERT INTO messages (created, session, name, email, body, fingerprint, next_attempt) "
+                   "VALUES (?, '', 'Eve\nX', 'eve@example.com', 'Hi', 'fp', ?)", (now, now))
+    assert box.submit("Bob", "bob@example.com", "Hello") == "queued"
+    box.start()
+    assert _wait(lambda: box.status() == {"failed": 1, "sent": 1})
+    assert box._thread.is_alive()
+    assert sink.received == 1
+
+
+def test_the_worker_survives_an_unexpected_error(box, monkeypatch):
+    compose, calls = box._compose, []
+
+    def flaky(row):
+        calls.append(row)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return compose(row)
+
+    monkeypatch.setattr(box, "_compose", flaky)
+    assert box.submit("Bob", "bob@example.com", "Hello") == "queued"
+    box.start()
+    assert _wait(lambda: box.status() == {"sent": 1})
+    assert box._thread.is_alive()
@@ -0,0 +1,43 @@
+from dataclasses import replace
+
+from images import picture_html
+from model import Contact, HistoryEntry
+from profiles import get_profile
+from render import case_study_html, floating_cta_html, hero_html, history_html, project_card_html, safe_url
+
+SCRIPT = "<script>alert(1)</script>"
+
+
+def _resume():
+    return get_profile().resume()
+
+
+def test_project_text_is_escaped():
+    p = replace(_resume().projects[0], title=SCRIPT, summary=SCRIPT, stack=(SCRIPT,), id="x'><b")
+    for html in (project_card_html(p, prefetch=True), project_card_html(p), case_study_html(p)):
+        assert "<script>" not in html and "&lt;script&gt;" in html
+        assert "'><b" not in html
+
+
+def test_profile_and_history_text_is_escaped():
+    resume = _resume()
+    profile = replace(resume.profile, name=SCRIPT, headline=SCRIPT, about=SCRIPT, badges=(SCRIPT,))
+    contact = Contact(email='a@b.c" onmouseover="x', calendar="javascript:alert(1)")
+    hero = hero_html(profile, resume.stats, contact)
+    assert "<script>" not in hero and 'onmouseover="x' not in hero and "javascript:" not in hero
+    assert "javascript:" not in floating_cta_html(contact)
+    assert "<script>" not in history_html((HistoryEntry(SCRIPT, (SCRIPT,)),))
+
+
+def test_safe_url_keeps_ordinary_links():
+    assert safe_url("https://cal.com/me?a=1&b=2") == "https://cal.com/me?a=1&amp;b=2"
+    assert safe_url("?case=p1") == "?case=p1"
+    assert safe_url("page.html") == "page.html"
+    assert safe_url(" JavaScript:alert(1)") == "#"
+    assert safe_url("data:text/html,x") == "#"
+
+
+def test_picture_alt_is_escaped():
+    path = get_profile().path(_resume().profile.photo)
+    if path:
+        assert 'alt="&quot;&gt;&lt;script&gt;' in picture_html(path, '"><script>')
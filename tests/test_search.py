@@ -0,0 +1,33 @@
+import pytest
+
+from model import Project, Role, role_order
+from search import ProjectIndex, within_one_edit
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("model", "model", True),
+    ("forcast", "forecast", True),  # insertion
+    ("models", "model", True),  # deletion
+    ("modal", "model", True),  # substitution
+    ("abxd", "axcd", False),  # share the deletion "ad", but two edits apart
+    ("model", "modle", False),  # a transposition is two edits
+    ("model", "mod", False),
+])
+def test_within_one_edit(a, b, expected):
+    assert within_one_edit(a, b) is expected
+    assert within_one_edit(b, a) is expected
+
+
+def _index(*titles):
+    projects = tuple(
+        Project.from_dict({"id": f"p{i}", "title": t, "summary": "", "tags": {"year": 2024}})
+        for i, t in enumerate(titles)
+    )
+    role = Role("All", (), (), frozenset(), role_order(projects, frozenset()))
+    return ProjectIndex(projects, (role,))
+
+
+def test_typo_matches_only_within_one_edit():
+    index = _index("axcd", "abcd", "forecast")
+    assert [p.id for p in index.search("abxd", role="All")] == ["p1"]
+    assert [p.id for p in index.search("forcast", role="All")] == ["p2"]
@@ -0,0 +1,41 @@
+import http.client
+import threading
+
+import pytest
+
+import sidecar
+from sidecar import Entry, make_server
+
+ENTRY = Entry(b"hello", b"", b"", '"abc"', "text/plain", "no-cache")
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(sidecar.Handler, "_resolve", lambda self: ENTRY)
+    srv = make_server("127.0.0.1", 0)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _get(server, headers=None):
+    conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+    conn.request("GET", "/index.html", headers=headers or {})
+    resp = conn.getresponse()
+    body = resp.read()
+    conn.close()
+    return resp, body
+
+
+def test_ok_has_a_content_length(server):
+    resp, body = _get(server)
+    assert resp.status == 200 and body == b"hello"
+    assert resp.getheader("Content-Length") == "5"
+
+
+def test_not_modified_has_no_content_length(server):
+    resp, body = _get(server, {"If-None-Match": '"abc"'})
+    assert resp.status == 304 and body == b""
+    assert resp.getheader("Content-Length") is None
+    assert resp.getheader("ETag") == '"abc"'
@@ -0,0 +1,211 @@
+"""Theme tokens and the compiled stylesheet bundles injected by app.py.
+
+Every (theme, high contrast, reduce motion) combination is compiled once per
+process into a single minified stylesheet named by its content hash and served
+from ``build/theme`` (see static_assets.py), so a rerun only sends a ``<link>``
+to it instead of the whole stylesheet.
+"""
+import re
+from functools import lru_cache
+
+from static_assets import asset_url, content_hash, publish_bytes
+
+# =========================
+# Theme Tokens
+# =========================
+TOKENS = {
+    "Sleek Blue (Light)": {
+        "--bg": "#f6f7fb", "--surface": "#ffffff", "--text": "#0f172a", "--muted": "#64748b",
+        "--primary": "#2563eb", "--accent": "#0ea5e9", "--success": "#16a34a", "--warn": "#f59e0b",
+        "--ring": "rgba(14,165,233,.35)", "--border": "rgba(2,6,23,.08)"
+    },
+    "Teal/Purple (Light)": {
+        "--bg": "#f7fbfb", "--surface": "#ffffff", "--text": "#111827", "--muted": "#64748b",
+        "--primary": "#06b6d4", "--accent": "#7c3aed", "--success": "#16a34a", "--warn": "#f59e0b",
+        "--ring": "rgba(14,165,233,.35)", "--border": "rgba(2,6,23,.08)"
+    },
+    "Dark": {
+        "--bg": "#0b1020", "--surface": "#11162a", "--text": "#e6e9f2", "--muted": "#a3acc3",
+        "--primary": "#06b6d4", "--accent": "#7c3aed", "--success": "#22c55e", "--warn": "#f59e0b",
+        "--ring": "rgba(14,165,233,.45)", "--border": "rgba(226,233,242,.12)"
+    }
+}
+THEMES = list(TOKENS)
+
+# Big CSS block as a plain string (no interpolation → no brace escaping hassle)
+CSS_BASE = """
+html, body, [class*="css"] {
+  background: var(--bg) !important;
+  color: var(--text) !important;
+  font-family: Inter, ui-sans-serif, system-ui, -apple-system, "Segoe UI", Roboto, "Helvetica Neue", Arial;
+  scroll-behavior: smooth;
+}
+
+/* Sticky header + toc */
+.navbar {
+  position: sticky; top: 0; z-index: 9999;
+  backdrop-filter: saturate(1.2) blur(10px);
+  background: color-mix(in oklab, var(--surface) 82%, transparent);
+  border-bottom:1px solid var(--border);
+  padding: 8px 10px; border-radius: 0 0 12px 12px;
+}
+.nav-grid { display:flex; gap:10px; align-items:center; justify-content:space-between; flex-wrap:wrap; max-width: 1200px; margin: 0 auto; }
+.nav-links { display:flex; gap:8px; flex-wrap:wrap; }
+.nav-btn {
+  border:1px solid var(--border); background:var(--surface); color:var(--text);
+  padding:8px 12px; border-radius:999px; font-weight:600; text-decoration:none;
+  transition: transform var(--motion) ease, box-shadow var(--motion) ease, border-color var(--motion) ease;
+  position:relative;
+}
+.nav-btn[aria-current="page"] { border-color: var(--primary); box-shadow: 0 0 0 3px var(--ring); }
+.nav-btn:hover { transform: translateY(-1px); box-shadow: var(--shadow-2); }
+
+/* Sections + cards */
+.section { scroll-margin-top: 90px; max-width: 1200px; margin: 0 auto; padding: 8px 12px; }
+.card { background:var(--surface); border:1px solid var(--border); border-radius:18px; padding:16px 18px; box-shadow: var(--shadow-1); }
+.section-title { font-weight:800; font-size:clamp(1.2rem, 1vw + 1rem, 1.6rem); letter-spacing:.2px; margin:0 0 8px 0; }
+.muted { color: var(--muted); }
+
+/* Hero */
+.hero {
+  margin: 10px auto 16px auto; padding: 26px 22px; border-radius: 20px;
+  background: radial-gradient(1200px 600px at 12% -10%, color-mix(in oklab, var(--accent) 16%, transparent) 0%, transparent 50%),
+              radial-gradient(900px 500px at 95% 10%, color-mix(in oklab, var(--primary) 14%, transparent) 0%, transparent 55%),
+              var(--surface);
+  border: 1px solid var(--border); box-shadow: var(--shadow-2);
+  animation: fadeUp var(--motion) ease forwards;
+  max-width: 1200px;
+}
+@keyframes fadeUp { from {opacity:.0; transform: translateY(8px)} to {opacity:1; transform: translateY(0)} }
+.hero h1 { font-family: "Space Grotesk", Inter, ui-sans-serif; font-size:clamp(2rem, 2.5vw + 1rem, 3rem); margin:0 0 6px 0; line-height:1.1; }
+.badge {
+  display:inline-block; padding:6px 12px; border-radius:999px; margin:0 8px 8px 0;
+  background: color-mix(in oklab, var(--primary) 8%, var(--surface));
+  border:1px solid color-mix(in oklab, var(--primary) 25%, var(--border));
+  font-weight:600; font-size:.9rem;
+}
+button.badge { color:inherit; cursor:pointer; }
+.badge[aria-pressed="true"] { border-color: var(--primary); box-shadow: 0 0 0 3px var(--ring); }
+mark { background: color-mix(in oklab, var(--primary) 25%, transparent); color:inherit; border-radius:4px; padding:0 2px; }
+.hero-photo img { display:block; width:100%; max-width:240px; height:auto; margin:0 auto 12px auto; border-radius:16px; border:1px solid var(--border); }
+details { border-top:1px solid var(--border); padding:6px 0; }
+summary { cursor:pointer; font-weight:600; }
+.kpi { display:inline-block; padding:6px 10px; border-radius:10px; border:1px dashed var(--border); margin:0 10px 10px 0; }
+
+/* Grid */
+.grid { display: grid; gap: 16px; grid-template-columns: repeat(12, 1fr); }
+.col-8 { grid-column: span 8; }
+.col-4 { grid-column: span 4; }
+@media (max-width: 900px) { .col-8, .col-4 { grid-column: 1 / -1; } }
+
+/* Project cards */
+.proj-card { transition: transform var(--motion) ease, box-shadow var(--motion) ease; }
+.proj-card:hover { transform: translateY(-2px); box-shadow: var(--shadow-2); }
+
+/* Meters */
+.meter-wrap { height:8px; background: color-mix(in oklab, var(--muted) 18%, transparent); border-radius:24px; overflow:hidden; border:1px solid var(--border); }
+.meter-val { height:100%; background: var(--primary); width:0; transition: width 0.8s ease; }
+
+/* Testimonials carousel */
+.carousel { position:relative; overflow:hidden; border-radius:16px; border:1px solid var(--border); background:var(--surface); }
+.carousel-track { display:flex; transition: transform var(--motion) ease; }
+.carousel-item { min-width:100%; padding: 18px; box-sizing: border-box; }
+.carousel-controls { display:flex; gap:10px; position:absolute; right:10px; bottom:10px; }
+.carousel button { border:1px solid var(--border); background:var(--surface); border-radius:999px; padding:6px 10px; }
+@media (prefers-reduced-motion) { .carousel-track { transition:none !important; } }
+
+/* Floating CTA */
+.floating-cta {
+  position: fixed; right: 16px; bottom: 18px; z-index: 9998;
+  display:flex; gap:8px; flex-wrap:wrap;
+}
+.floating-cta a {
+  text-decoration:none; padding:10px 12px; border-radius:999px; font-weight:700;
+  background: var(--primary); color: #fff;
+}
+@media (max-width: 700px) {
+  .floating-cta { position: fixed; left:0; right:0; bottom:0; justify-content:center; background:var(--surface); padding:10px; border-top:1px solid var(--border); }
+}
+
+/* Focus rings */
+a:focus-visible, button:focus-visible { box-shadow: 0 0 0 4px var(--ring); outline: none; }
+hr { border:none; border-top:1px solid var(--border); margin: 8px 0 16px 0; }
+"""
+
+PRINT_CSS = """
+@media print {
+  .navbar, .floating-cta, [data-testid="stSidebar"], .carousel-controls { display: none !important; }
+  .card { box-shadow: none !important; border-color: #000 !important; }
+  * { color: #000 !important; background: #fff !important; }
+  a[href^="http"]::after { content: " (" attr(href) ")"; font-size: .9em; }
+  @page { margin: 0.6in; }
+}
+"""
+
+
+def theme_tokens(theme_choice, high_contrast=False):
+    """Return a copy of the theme's tokens with the high-contrast overrides applied."""
+    tokens = dict(TOKENS[theme_choice])
+    if high_contrast:
+        tokens["--text"] = "#000" if theme_choice != "Dark" else "#fff"
+        tokens["--muted"] = "#111" if theme_choice != "Dark" else "#eee"
+        tokens["--border"] = "rgba(0,0,0,.3)" if theme_choice != "Dark" else "rgba(255,255,255,.35)"
+    return tokens
+
+
+def _root_vars(tokens, reduce_motion):
+    lines = [f"  {k}: {v};" for k, v in tokens.items()]
+    lines += [
+        "  --shadow-1: 0 1px 2px rgba(0,0,0,.06);",
+        "  --shadow-2: 0 10px 30px rgba(0,0,0,.10);",
+        f"  --motion: {'0s' if reduce_motion else '.25s'};",
+    ]
+    return ":root {\n" + "\n".join(lines) + "\n}\n"
+
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_STRING = re.compile(r"(\"[^\"]*\"|'[^']*')")
+_PUNCT = re.compile(r"\s*([{};:,])\s*")
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace, leaving quoted strings untouched."""
+    parts = _STRING.split(_COMMENT.sub("", css))
+    for i in range(0, len(parts), 2):
+        chunk = _PUNCT.sub(r"\1", re.sub(r"\s+", " ", parts[i]))
+        parts[i] = chunk.replace(";}", "}")
+    return "".join(parts).strip()
+
+
+@lru_cache(maxsize=None)
+def compile_bundle(theme_choice, high_contrast=False, reduce_motion=False):
+    """Compile one theme combination; returns ``(digest, css)``, cached process-wide."""
+    tokens = theme_tokens(theme_choice, high_contrast)
+    css = minify_css(_root_vars(tokens, reduce_motion) + CSS_BASE + PRINT_CSS)
+    return content_hash(css), css
+
+
+@lru_cache(maxsize=None)
+def _published_bundle(theme_choice, high_contrast, reduce_motion):
+    _, css = compile_bundle(theme_choice, high_contrast, reduce_motion)
+    return publish_bytes("theme", css, ".css")
+
+
+def stylesheet_name(theme_choice, high_contrast=False, reduce_motion=False):
+    """File name of the published bundle (raises OSError if it cannot be written)."""
+    return _published_bundle(theme_choice, high_contrast, reduce_motion)
+
+
+def stylesheet_url(theme_choice, high_contrast=False, reduce_motion=False):
+    """URL of the published bundle (raises OSError if it cannot be written)."""
+    return asset_url("theme", stylesheet_name(theme_choice, high_contrast, reduce_motion))
+
+
+def stylesheet_tag(theme_choice, high_contrast=False, reduce_motion=False):
+    """HTML that applies the compiled bundle: a ``<link>`` when it can be served, else inline CSS."""
+    digest, css = compile_bundle(theme_choice, high_contrast, reduce_motion)
+    try:
+        href = stylesheet_url(theme_choice, high_contrast, reduce_motion)
+    except OSError:
+        return f'<style data-bundle="{digest}">{css}</style>'
+    return f'<link rel="stylesheet" data-bundle="{digest}" href="{href}">'
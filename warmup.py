@@ -0,0 +1,108 @@
+"""Prebuild the caches the first visitor would otherwise wait for.
+
+``warm()`` prepares the default profile (or ``slug``):
+- every stylesheet bundle;
+- the content model, project index, job-description term matrix and
+  change history;
+- the hero image variants and the web font subsets;
+- the page component, and the modules Streamlit would otherwise import on
+  the first page load;
+- the variant PDFs, case pages and machine-readable exports (files only;
+  serve.py registers the exports' route once the server's runtime exists);
+- the HTML fragments of the default view, in the default theme, for every
+  role and mode.
+
+Run it in the server process before it accepts traffic (serve.py does). Run
+it on its own to fill just the on-disk caches under ``build/``:
+
+    python warmup.py [--profile <slug>]
+"""
+import argparse
+import itertools
+import time
+
+from case_pages import case_url
+from exports import publish_exports
+from fonts import publish_fonts
+from fragments import fragment
+from images import image_variants, picture_html
+from page_controller import component
+from pdf_export import variant_pdf
+from profiles import get_profile
+from relevance import RelevanceIndex
+from render import (
+    experience_html, hero_html, highlights_html, history_html, project_card_html, skills_html, testimonials_html,
+)
+from search import ProjectIndex
+from theme import THEMES, stylesheet_name
+
+
+def _streamlit():
+    # Streamlit imports these on the first page load: the emoji table (page_icon)
+    # and pyarrow (component arguments). The first declare_component also builds
+    # inspect's module table.
+    import pyarrow  # noqa: F401
+    import streamlit.emojis  # noqa: F401
+
+    component()
+
+
+def _fragments(site, resume, css_name):
+    # The same calls, with the same arguments, as app.py's default view.
+    query = f"?p={site.slug}" if site.slug else ""
+    photo_path = site.path(resume.profile.photo)
+    photo = picture_html(photo_path, resume.profile.name, eager=True) if photo_path else ""
+    fragment(hero_html, resume.profile, resume.stats, resume.contact, photo, theme=css_name)
+    for role in resume.roles:
+        for scan in (True, False):
+            fragment(highlights_html, role.bullets(scan), theme=css_name)
+    fragment(experience_html, resume.experience, theme=css_name)
+    for p in resume.projects:
+        fragment(project_card_html, p, case_url(resume, p.id, css_name, query), True, theme=css_name)
+    fragment(skills_html, resume.skills, theme=css_name)
+    fragment(testimonials_html, resume.testimonials, theme=css_name)
+    fragment(history_html, site.history(), theme=css_name)
+
+
+def warm(slug=""):
+    """Build everything listed above; returns ``{step: ms}``."""
+    timings = {}
+
+    def step(name, fn):
+        t0 = time.perf_counter()
+        result = fn()
+        timings[name] = round((time.perf_counter() - t0) * 1000, 1)
+        return result
+
+    site = get_profile(slug)
+    if site is None:
+        raise LookupError(f"no profile {slug!r}")
+    step("stylesheets", lambda: [stylesheet_name(*combo)
+                                 for combo in itertools.product(THEMES, (False, True), (False, True))])
+    resume = step("content", site.resume)
+    step("index", lambda: site.prepared("index", lambda r: ProjectIndex(r.projects, r.roles)))
+    step("relevance", lambda: site.prepared("relevance", RelevanceIndex))
+    step("history", site.history)
+    step("fonts", lambda: publish_fonts(resume))
+    photo = site.path(resume.profile.photo)
+    if photo:
+        step("images", lambda: image_variants(photo))
+    step("streamlit", _streamlit)
+    step("pdfs", lambda: [variant_pdf(resume, r.label, scan) for r in resume.roles for scan in (True, False)])
+    step("exports", lambda: publish_exports(resume, site.slug))
+    step("fragments", lambda: _fragments(site, resume, stylesheet_name(THEMES[0])))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", default="", help="hosted profile to warm (default: content/profile.json)")
+    args = parser.parse_args()
+    timings = warm(args.profile)
+    for name, ms in timings.items():
+        print(f"{name:16} {ms:9.1f} ms")
+    print(f"{'total':16} {sum(timings.values()):9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()